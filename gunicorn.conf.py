@@ -0,0 +1,31 @@
+
+import multiprocessing
+import os
+
+# Configuração do Gunicorn, servidor WSGI usado para executar a API em produção:
+#   gunicorn src.interfaces.wsgi:app
+# O Gunicorn carrega este arquivo automaticamente quando executado na raiz do projeto.
+# As requisições passam a maior parte do tempo aguardando o nó Ethereum (I/O), por isso
+# cada processo atende várias requisições em threads (`gthread`), em vez de uma por vez.
+
+# Plataformas que executam o `Procfile` (ex: Heroku) informam a porta na variável `PORT`.
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+
+# Processos independentes (um interpretador cada), para usar todos os núcleos disponíveis.
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# Threads por processo, para sobrepor as esperas pelas chamadas RPC e pelo banco de dados.
+# Cada thread pode ocupar uma conexão com o banco de dados: por padrão, `DATABASE_POOL_SIZE`
+# (ver `src/infrastructure/config.py`) é este valor mais `BACKGROUND_TASK_WORKERS`, e o total
+# de conexões abertas com o banco é `workers` × `DATABASE_POOL_SIZE`.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Tempo, em segundos, durante o qual uma conexão ociosa é mantida aberta (HTTP keep-alive),
+# para que clientes e balanceadores de carga reutilizem a conexão TCP entre requisições. Com
+# `gthread`, as conexões ociosas aguardam no seletor do processo, sem ocupar uma thread.
+# Deve ser maior que o tempo ocioso do balanceador de carga, quando houver um.
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "30"))
+
+# Tempo máximo de uma requisição; deve cobrir o timeout e as novas tentativas das chamadas ao nó.
+timeout = 60
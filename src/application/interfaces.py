@@ -1,6 +1,6 @@
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from src.domain.entities import Address, ValidatedTransaction, CreatedTransaction, TransferDetail
 
 # Esta camada define as interfaces (portas) que a camada de aplicação (Use Cases) utiliza.
@@ -23,12 +23,20 @@ class IAddressRepository(ABC):
     def save(self, address: Address) -> Address:
         pass
 
+    @abstractmethod
+    def save_many(self, addresses: List[Address]) -> List[Address]:
+        pass
+
     @abstractmethod
     def find_by_address(self, address: str) -> Optional[Address]:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Address]:
+    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> Iterable[Address]:
+        pass
+
+    @abstractmethod
+    def exists_any(self, addresses: Iterable[str]) -> bool:
         pass
 
 class IValidatedTransactionRepository(ABC):
@@ -39,12 +47,20 @@ class IValidatedTransactionRepository(ABC):
     def save(self, tx: ValidatedTransaction) -> ValidatedTransaction:
         pass
 
+    @abstractmethod
+    def save_many(self, txs: List[ValidatedTransaction]) -> List[ValidatedTransaction]:
+        pass
+
     @abstractmethod
     def find_by_hash(self, tx_hash: str) -> Optional[ValidatedTransaction]:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[ValidatedTransaction]:
+    def get_all(self) -> Iterable[ValidatedTransaction]:
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
         pass
 
 class ICreatedTransactionRepository(ABC):
@@ -55,18 +71,34 @@ class ICreatedTransactionRepository(ABC):
     def save(self, tx: CreatedTransaction) -> CreatedTransaction:
         pass
 
+    @abstractmethod
+    def save_many(self, txs: List[CreatedTransaction]) -> List[CreatedTransaction]:
+        pass
+
     @abstractmethod
     def find_by_hash(self, tx_hash: str) -> Optional[CreatedTransaction]:
         pass
 
     @abstractmethod
-    def get_all(self) -> List[CreatedTransaction]:
+    def get_all(self) -> Iterable[CreatedTransaction]:
         pass
 
     @abstractmethod
     def update(self, tx: CreatedTransaction) -> CreatedTransaction:
         pass
 
+    @abstractmethod
+    def find_by_hashes(self, tx_hashes: Iterable[str]) -> List[CreatedTransaction]:
+        pass
+
+    @abstractmethod
+    def update_many(self, txs: List[CreatedTransaction]) -> List[CreatedTransaction]:
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
+        pass
+
 # --- Interface de Serviço de Blockchain ---
 # Esta interface define o contrato para interações com a rede blockchain.
 # Ela abstrai os detalhes de implementação da biblioteca Web3.py ou de qualquer outro
@@ -81,6 +113,10 @@ class IBlockchainService(ABC):
     def generate_new_address(self) -> Address:
         pass
 
+    @abstractmethod
+    def generate_new_addresses(self, count: int) -> List[Address]:
+        pass
+
     @abstractmethod
     def get_transaction_details(self, tx_hash: str) -> dict:
         pass
@@ -89,22 +125,71 @@ class IBlockchainService(ABC):
     def get_transaction_receipt(self, tx_hash: str) -> dict:
         pass
 
+    @abstractmethod
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> List[dict]:
+        pass
+
     @abstractmethod
     def get_current_block_number(self) -> int:
         pass
 
+    @abstractmethod
+    def get_transaction_bundle(self, tx_hash: str) -> Tuple[dict, dict, int]:
+        pass
+
     @abstractmethod
     def decode_erc20_transfer_log(self, log: dict) -> Optional[TransferDetail]:
         pass
 
+    @abstractmethod
+    def decode_erc20_transfer_logs(self, logs: List[dict]) -> List[TransferDetail]:
+        pass
+
     @abstractmethod
     def create_and_sign_transaction(
         self, from_address: str, to_address: str, asset: str, value: str, private_key: str
     ) -> tuple[str, dict]:
         pass
 
+    @abstractmethod
+    def create_and_sign_transactions(
+        self, transfers: List[Tuple[str, str, str, str, str]]
+    ) -> List[dict]:
+        pass
+
     @abstractmethod
     def send_raw_transaction(self, raw_tx: str) -> str:
         pass
 
+    @abstractmethod
+    def send_raw_transactions(self, raw_txs: List[str]) -> List[dict]:
+        pass
+
+# --- Interface de Unidade de Trabalho ---
+# Esta interface delimita a transação de persistência de um caso de uso.
+# Os repositórios apenas registram as alterações; a unidade de trabalho decide quando elas
+# são confirmadas (commit) ou descartadas (rollback), garantindo que todas as escritas de um
+# caso de uso sejam atômicas e confirmadas com uma única transação no banco de dados.
+
+class IUnitOfWork(ABC):
+    """Interface para a unidade de trabalho (Unit of Work).
+
+    Usada como gerenciador de contexto: ao sair do bloco `with` sem erros as alterações são
+    confirmadas; se uma exceção ocorrer, todas as alterações do bloco são descartadas.
+    """
+    def __enter__(self) -> "IUnitOfWork":
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
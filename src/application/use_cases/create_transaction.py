@@ -1,13 +1,18 @@
 
-from typing import Optional
+import re
+from typing import Dict, List, Optional
 from src.domain.entities import CreatedTransaction
-from src.application.interfaces import ICreatedTransactionRepository, IAddressRepository, IBlockchainService
+from src.domain.units import to_base_units
+from src.application.interfaces import ICreatedTransactionRepository, IAddressRepository, IBlockchainService, IUnitOfWork
 
 # Esta camada contém os casos de uso (Use Cases), que representam a lógica de negócio específica da aplicação.
 # Eles orquestram o fluxo de dados entre as entidades de domínio e as interfaces (portas) para serviços externos.
 # Os casos de uso são independentes de frameworks e bancos de dados, dependendo apenas das interfaces.
 # Isso adere ao Princípio da Responsabilidade Única (SRP) e ao Princípio Aberto/Fechado (OCP).
 
+# Formato de um endereço Ethereum: '0x' seguido de 20 bytes em hexadecimal.
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+
 class CreateTransactionUseCase:
     """Caso de uso para criar e enviar uma transação on-chain.
 
@@ -22,6 +27,7 @@ class CreateTransactionUseCase:
         created_tx_repository: ICreatedTransactionRepository,
         address_repository: IAddressRepository,
         blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
     ):
         """
         Inicializa o caso de uso com as dependências necessárias.
@@ -30,10 +36,12 @@ class CreateTransactionUseCase:
             created_tx_repository (ICreatedTransactionRepository): Repositório para persistir transações criadas.
             address_repository (IAddressRepository): Repositório para consultar endereços próprios.
             blockchain_service (IBlockchainService): Serviço para interagir com a blockchain.
+            unit_of_work (IUnitOfWork): Unidade de trabalho que confirma as alterações no banco de dados.
         """
         self.created_tx_repository = created_tx_repository
         self.address_repository = address_repository
         self.blockchain_service = blockchain_service
+        self.unit_of_work = unit_of_work
 
     def execute(
         self, from_address: str, to_address: str, asset: str, value: str
@@ -53,18 +61,24 @@ class CreateTransactionUseCase:
             CreatedTransaction: A entidade da transação criada e enviada.
         
         Raises:
-            ValueError: Se os campos obrigatórios não forem fornecidos ou o endereço de origem não for encontrado.
+            ValueError: Se os campos obrigatórios não forem fornecidos, os endereços, o ativo ou o valor
+                forem inválidos ou o endereço de origem não for encontrado.
         """
-        if not all([from_address, to_address, asset, value]):
-            raise ValueError("Todos os campos (from_address, to_address, asset, value) são obrigatórios.")
+        self._validate(from_address, to_address, asset, value)
+        private_key = self._get_private_key(from_address)
 
-        sender_account_db = self.address_repository.find_by_address(from_address)
-        if not sender_account_db:
-            raise ValueError("Endereço de origem não encontrado em nossa base de dados.")
+        # Cria e envia a transação via serviço de blockchain (SRP).
+        # O caso de uso não se preocupa com os detalhes de como a transação é assinada ou enviada.
+        signed_raw_transacion, tx_details = self.blockchain_service.create_and_sign_transaction(
+            from_address, to_address, asset, value, private_key
+        )
 
-        private_key = sender_account_db.private_key
+        tx_hash = self.blockchain_service.send_raw_transaction(signed_raw_transacion)
 
-        # Armazenar histórico da transação como 'pending' antes de enviar.
+        # Armazena o histórico da transação como 'pending', já com o hash e os detalhes de gás,
+        # em um único INSERT. A transação do banco de dados só é aberta após o envio, sem
+        # permanecer aberta durante as chamadas ao nó; se a assinatura ou o envio falharem,
+        # nada é gravado, como acontecia com o registro pendente desfeito por rollback.
         # A responsabilidade de persistência é do repositório (SRP).
         new_created_tx = CreatedTransaction(
             from_address=from_address,
@@ -72,25 +86,129 @@ class CreateTransactionUseCase:
             asset=asset,
             value=value,
             status="pending",
+            tx_hash=tx_hash,
+            gas_price_gwei=tx_details.get("gasPrice", 0),
+            gas_limit=tx_details.get("gas", 0),
         )
-        self.created_tx_repository.save(new_created_tx)
+        with self.unit_of_work:
+            self.created_tx_repository.save(new_created_tx)
 
-        # Cria e envia a transação via serviço de blockchain (SRP).
-        # O caso de uso não se preocupa com os detalhes de como a transação é assinada ou enviada.
-        signed_raw_transacion, tx_details = self.blockchain_service.create_and_sign_transaction(
-            from_address, to_address, asset, value, private_key
+        return new_created_tx
+
+    def execute_many(self, transfers: List[Dict]) -> List[Dict]:
+        """
+        Executa a criação e o envio de várias transações em uma única chamada.
+
+        As transações válidas são assinadas em conjunto (o nonce de cada remetente, o preço do
+        gás e as estimativas de gás são consultados uma única vez para todo o lote), enviadas ao
+        nó em lotes JSON-RPC e gravadas com um único INSERT em lote e um único commit.
+        Uma transação inválida, que não pode ser assinada (ex: transferência ERC-20 revertida na
+        estimativa de gás) ou rejeitada pelo nó não interrompe o lote: seu resultado contém a
+        mensagem de erro. Como os nonces de um mesmo remetente são consecutivos, as transações
+        enviadas depois de uma rejeitada, do mesmo remetente, aguardam na rede até que o nonce
+        que faltou seja usado.
+
+        Args:
+            transfers (List[Dict]): As transações, cada uma com `from_address`, `to_address`,
+                `asset` e `value`, como em `execute`.
+
+        Returns:
+            List[Dict]: O resultado de cada transação, na ordem recebida: `status` igual a
+                "success" com o `tx_hash`, ou "error" com a mensagem (`message`).
+
+        Raises:
+            ValueError: Se a lista de transações for inválida.
+        """
+        if not isinstance(transfers, list) or not transfers or not all(isinstance(t, dict) for t in transfers):
+            raise ValueError("Informe uma lista de transações.")
+
+        results: List[Dict] = [{} for _ in transfers]
+        accepted = []
+        # Cada remetente é buscado no banco de dados uma única vez, mesmo com várias transações.
+        private_keys: Dict[str, str] = {}
+        for index, transfer in enumerate(transfers):
+            fields = tuple(transfer.get(key) for key in ("from_address", "to_address", "asset", "value"))
+            try:
+                self._validate(*fields)
+                if fields[0] not in private_keys:
+                    private_keys[fields[0]] = self._get_private_key(fields[0])
+                accepted.append((index, fields, private_keys[fields[0]]))
+            except ValueError as e:
+                results[index] = {"status": "error", "message": str(e)}
+
+        if not accepted:
+            return results
+
+        # Cria e envia as transações via serviço de blockchain (SRP), em lote. Transações que não
+        # puderam ser assinadas (ex: estimativa de gás revertida) recebem o erro e não são enviadas.
+        signed_transactions = self.blockchain_service.create_and_sign_transactions(
+            [(*fields, private_key) for _, fields, private_key in accepted]
+        )
+        signed = []
+        for (index, fields, _), signed_transaction in zip(accepted, signed_transactions):
+            if "error" in signed_transaction:
+                results[index] = {"status": "error", "message": signed_transaction["error"]}
+            else:
+                signed.append((index, fields, signed_transaction))
+        if not signed:
+            return results
+        send_results = self.blockchain_service.send_raw_transactions(
+            [signed_transaction["raw_tx"] for _, _, signed_transaction in signed]
         )
 
-        tx_hash = self.blockchain_service.send_raw_transaction(signed_raw_transacion)
+        new_created_txs: List[CreatedTransaction] = []
+        for (index, (from_address, to_address, asset, value), signed_transaction), send_result in zip(signed, send_results):
+            tx_details = signed_transaction["transaction"]
+            if "error" in send_result:
+                results[index] = {"status": "error", "message": send_result["error"]}
+                continue
+            results[index] = {"status": "success", "tx_hash": send_result["tx_hash"]}
+            new_created_txs.append(
+                CreatedTransaction(
+                    from_address=from_address,
+                    to_address=to_address,
+                    asset=asset,
+                    value=value,
+                    status="pending",
+                    tx_hash=send_result["tx_hash"],
+                    gas_price_gwei=tx_details.get("gasPrice", 0),
+                    gas_limit=tx_details.get("gas", 0),
+                )
+            )
 
-        # Atualiza o hash da transação e detalhes de gás no banco de dados.
-        # A responsabilidade de atualização é do repositório (SRP).
-        new_created_tx.tx_hash = tx_hash
-        new_created_tx.gas_price_gwei = str(tx_details.get("gasPrice", 0))
-        new_created_tx.gas_limit = tx_details.get("gas", 0)
-        self.created_tx_repository.update(new_created_tx)
+        # Todas as transações enviadas são gravadas juntas, com um único commit.
+        if new_created_txs:
+            with self.unit_of_work:
+                self.created_tx_repository.save_many(new_created_txs)
 
-        return new_created_tx
+        return results
+
+    @staticmethod
+    def _validate(from_address: str, to_address: str, asset: str, value: str) -> None:
+        """Valida os campos de uma transação, sem consultar o banco de dados ou o nó.
+
+        Raises:
+            ValueError: Se um campo estiver ausente ou se um endereço, o ativo ou o valor forem inválidos.
+        """
+        if not all([from_address, to_address, asset, value]):
+            raise ValueError("Todos os campos (from_address, to_address, asset, value) são obrigatórios.")
+        if not ADDRESS_PATTERN.fullmatch(from_address) or not ADDRESS_PATTERN.fullmatch(to_address):
+            raise ValueError("Endereço Ethereum inválido.")
+        if asset != "ETH" and not ADDRESS_PATTERN.fullmatch(asset):
+            raise ValueError("Ativo inválido: informe 'ETH' ou o endereço do contrato do token ERC-20.")
+        # Valida o valor antes de qualquer consulta ao banco de dados ou ao nó.
+        to_base_units(value)
+
+    def _get_private_key(self, from_address: str) -> str:
+        """Retorna a chave privada de um endereço próprio.
+
+        Raises:
+            ValueError: Se o endereço de origem não for encontrado.
+        """
+        sender_account_db = self.address_repository.find_by_address(from_address)
+        if not sender_account_db:
+            raise ValueError("Endereço de origem não encontrado em nossa base de dados.")
+        return sender_account_db.private_key
 
 class UpdateTransactionStatusUseCase:
     """Caso de uso para atualizar o status de uma transação criada.
@@ -104,6 +222,7 @@ class UpdateTransactionStatusUseCase:
         self,
         created_tx_repository: ICreatedTransactionRepository,
         blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
     ):
         """
         Inicializa o caso de uso com as dependências necessárias.
@@ -111,9 +230,11 @@ class UpdateTransactionStatusUseCase:
         Args:
             created_tx_repository (ICreatedTransactionRepository): Repositório para persistir transações criadas.
             blockchain_service (IBlockchainService): Serviço para interagir com a blockchain.
+            unit_of_work (IUnitOfWork): Unidade de trabalho que confirma as alterações no banco de dados.
         """
         self.created_tx_repository = created_tx_repository
         self.blockchain_service = blockchain_service
+        self.unit_of_work = unit_of_work
 
     def execute(self, tx_hash: str) -> CreatedTransaction:
         """
@@ -133,18 +254,60 @@ class UpdateTransactionStatusUseCase:
             raise ValueError("Transação não encontrada.")
 
         tx_receipt = self.blockchain_service.get_transaction_receipt(tx_hash)
-        if tx_receipt:
-            if tx_receipt.get("status") == 1:
-                tx_record.status = "confirmed"
-                tx_record.effective_cost_wei = str(
-                    tx_receipt.get("gasUsed", 0) * tx_receipt.get("effectiveGasPrice", 0)
-                )
-            else:
-                tx_record.status = "failed"
-            self.created_tx_repository.update(tx_record)
-        else:
-            tx_record.status = "pending" # Ainda pendente na rede
+        if self._apply_receipt(tx_record, tx_receipt):
+            with self.unit_of_work:
+                self.created_tx_repository.update(tx_record)
 
         return tx_record
 
+    def execute_many(self, tx_hashes: List[str]) -> List[CreatedTransaction]:
+        """
+        Atualiza o status de várias transações de uma só vez.
+
+        Os registros são buscados com uma única consulta, os recibos são obtidos em lote
+        pelo serviço de blockchain e todas as alterações são gravadas com um único UPDATE
+        em lote e um único commit.
+
+        Args:
+            tx_hashes (List[str]): Os hashes das transações a serem atualizadas.
+
+        Returns:
+            List[CreatedTransaction]: As entidades das transações encontradas, já atualizadas.
+                                      Hashes que não pertencem à aplicação são ignorados.
+
+        Raises:
+            ValueError: Se a lista de hashes for inválida.
+        """
+        if not isinstance(tx_hashes, list) or not tx_hashes or not all(isinstance(h, str) and h for h in tx_hashes):
+            raise ValueError("Informe uma lista de hashes de transação.")
+
+        tx_records = self.created_tx_repository.find_by_hashes(set(tx_hashes))
+        if not tx_records:
+            return []
+
+        tx_receipts = self.blockchain_service.get_transaction_receipts([tx.tx_hash for tx in tx_records])
+        changed_records = [
+            tx_record
+            for tx_record, tx_receipt in zip(tx_records, tx_receipts)
+            if self._apply_receipt(tx_record, tx_receipt)
+        ]
+        if changed_records:
+            with self.unit_of_work:
+                self.created_tx_repository.update_many(changed_records)
+
+        return tx_records
+
+    @staticmethod
+    def _apply_receipt(tx_record: CreatedTransaction, tx_receipt: dict) -> bool:
+        """Aplica o recibo ao registro da transação e indica se ele precisa ser gravado."""
+        if not tx_receipt:
+            tx_record.status = "pending" # Ainda pendente na rede
+            return False
+        if tx_receipt.get("status") == 1:
+            tx_record.status = "confirmed"
+            tx_record.effective_cost_wei = tx_receipt.get("gasUsed", 0) * tx_receipt.get("effectiveGasPrice", 0)
+        else:
+            tx_record.status = "failed"
+        return True
+
 
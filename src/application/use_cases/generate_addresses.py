@@ -1,7 +1,7 @@
 
 from typing import List
 from src.domain.entities import Address
-from src.application.interfaces import IAddressRepository, IBlockchainService
+from src.application.interfaces import IAddressRepository, IBlockchainService, IUnitOfWork
 
 # Esta camada contém os casos de uso (Use Cases), que representam a lógica de negócio específica da aplicação.
 # Eles orquestram o fluxo de dados entre as entidades de domínio e as interfaces (portas) para serviços externos.
@@ -17,16 +17,23 @@ class GenerateAddressesUseCase:
     apenas que essas operações são possíveis através das interfaces.
     """
 
-    def __init__(self, address_repository: IAddressRepository, blockchain_service: IBlockchainService):
+    def __init__(
+        self,
+        address_repository: IAddressRepository,
+        blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
+    ):
         """
         Inicializa o caso de uso com as dependências necessárias.
 
         Args:
             address_repository (IAddressRepository): Repositório para persistir endereços.
             blockchain_service (IBlockchainService): Serviço para interagir com a blockchain.
+            unit_of_work (IUnitOfWork): Unidade de trabalho que confirma as alterações no banco de dados.
         """
         self.address_repository = address_repository
         self.blockchain_service = blockchain_service
+        self.unit_of_work = unit_of_work
 
     def execute(self, num_addresses: int = 1) -> List[Address]:
         """
@@ -44,17 +51,14 @@ class GenerateAddressesUseCase:
         if not isinstance(num_addresses, int) or num_addresses <= 0:
             raise ValueError("Número de endereços inválido.")
 
-        generated_addresses = []
-        for _ in range(num_addresses):
-            # A lógica de geração de endereço é delegada ao serviço de blockchain (SRP).
-            # O caso de uso não se importa com os detalhes de como o endereço é gerado.
-            new_address_entity = self.blockchain_service.generate_new_address()
-            
-            # O repositório é responsável pela persistência (SRP).
-            # O caso de uso não se importa com os detalhes de como o endereço é salvo.
-            saved_address = self.address_repository.save(new_address_entity)
-            generated_addresses.append(saved_address)
-            
-        return generated_addresses
+        # A lógica de geração de endereço é delegada ao serviço de blockchain (SRP).
+        # O caso de uso não se importa com os detalhes de como os endereços são gerados
+        # (por exemplo, se a geração é distribuída entre vários processos).
+        new_address_entities = self.blockchain_service.generate_new_addresses(num_addresses)
+
+        # O repositório é responsável pela persistência (SRP).
+        # Os endereços são salvos em lote, com uma única transação no banco de dados.
+        with self.unit_of_work:
+            return self.address_repository.save_many(new_address_entities)
 
 
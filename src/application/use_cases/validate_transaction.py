@@ -1,13 +1,24 @@
 
-from typing import List, Dict, Optional
+from dataclasses import asdict
+from typing import List, Dict, Optional, Tuple
 from src.domain.entities import ValidatedTransaction, Address, TransferDetail
-from src.application.interfaces import IValidatedTransactionRepository, IAddressRepository, IBlockchainService
+from src.application.interfaces import IValidatedTransactionRepository, IAddressRepository, IBlockchainService, IUnitOfWork
 
 # Esta camada contém os casos de uso (Use Cases), que representam a lógica de negócio específica da aplicação.
 # Eles orquestram o fluxo de dados entre as entidades de domínio e as interfaces (portas) para serviços externos.
 # Os casos de uso são independentes de frameworks e bancos de dados, dependendo apenas das interfaces.
 # Isso adere ao Princípio da Responsabilidade Única (SRP) e ao Princípio Aberto/Fechado (OCP).
 
+def _transfer_to_dict(transfer: TransferDetail) -> Dict:
+    """Converte uma transferência para a resposta, com o valor uint256 como texto decimal.
+
+    Valores em wei excedem a precisão dos números em JSON (2^53) em muitos clientes,
+    por isso são devolvidos como strings.
+    """
+    transfer_dict = asdict(transfer)
+    transfer_dict["value"] = str(transfer.value)
+    return transfer_dict
+
 class ValidateTransactionUseCase:
     """Caso de uso para validar uma transação on-chain para fins de crédito.
 
@@ -22,6 +33,7 @@ class ValidateTransactionUseCase:
         validated_tx_repository: IValidatedTransactionRepository,
         address_repository: IAddressRepository,
         blockchain_service: IBlockchainService,
+        unit_of_work: IUnitOfWork,
     ):
         """
         Inicializa o caso de uso com as dependências necessárias.
@@ -30,10 +42,12 @@ class ValidateTransactionUseCase:
             validated_tx_repository (IValidatedTransactionRepository): Repositório para persistir transações validadas.
             address_repository (IAddressRepository): Repositório para consultar endereços próprios.
             blockchain_service (IBlockchainService): Serviço para interagir com a blockchain.
+            unit_of_work (IUnitOfWork): Unidade de trabalho que confirma as alterações no banco de dados.
         """
         self.validated_tx_repository = validated_tx_repository
         self.address_repository = address_repository
         self.blockchain_service = blockchain_service
+        self.unit_of_work = unit_of_work
 
     def execute(self, tx_hash: str) -> Dict:
         """
@@ -51,6 +65,61 @@ class ValidateTransactionUseCase:
         if not tx_hash:
             raise ValueError("Hash da transação é obrigatório.")
 
+        response_data, new_validated_tx = self._validate(tx_hash)
+
+        # Armazenar as transações válidas em uma base de dados para consulta do histórico.
+        if new_validated_tx:
+            with self.unit_of_work:
+                self.validated_tx_repository.save(new_validated_tx)
+
+        return response_data
+
+    def execute_many(self, tx_hashes: List[str]) -> List[Dict]:
+        """
+        Executa a validação de várias transações em uma única chamada.
+
+        Todas as transações válidas são gravadas juntas, com um único INSERT em lote e um
+        único commit, em vez de uma transação no banco de dados por hash. Um hash inválido
+        ou não encontrado não interrompe o lote: seu resultado contém a mensagem de erro.
+
+        Args:
+            tx_hashes (List[str]): Os hashes das transações a serem validadas.
+
+        Returns:
+            List[Dict]: O resultado da validação de cada hash, na ordem recebida (sem repetições).
+
+        Raises:
+            ValueError: Se a lista de hashes for inválida.
+        """
+        if not isinstance(tx_hashes, list) or not tx_hashes or not all(isinstance(h, str) and h for h in tx_hashes):
+            raise ValueError("Informe uma lista de hashes de transação.")
+
+        results: List[Dict] = []
+        new_validated_txs: List[ValidatedTransaction] = []
+        for tx_hash in dict.fromkeys(tx_hashes):
+            try:
+                response_data, new_validated_tx = self._validate(tx_hash)
+            except ValueError as e:
+                results.append({"tx_hash": tx_hash, "status": "error", "message": str(e)})
+                continue
+            # O hash é incluído em todos os resultados para identificá-los no lote.
+            results.append({"tx_hash": tx_hash, **response_data})
+            if new_validated_tx:
+                new_validated_txs.append(new_validated_tx)
+
+        if new_validated_txs:
+            with self.unit_of_work:
+                self.validated_tx_repository.save_many(new_validated_txs)
+
+        return results
+
+    def _validate(self, tx_hash: str) -> Tuple[Dict, Optional[ValidatedTransaction]]:
+        """Valida uma transação sem persistir o resultado.
+
+        Returns:
+            Tuple[Dict, Optional[ValidatedTransaction]]: A resposta da validação e, se a transação
+                for válida e ainda não estiver registrada, a entidade a ser salva.
+        """
         # Verifica se a transação já foi validada e salva para evitar duplicação (SRP).
         existing_validation = self.validated_tx_repository.find_by_hash(tx_hash)
         if existing_validation:
@@ -61,75 +130,81 @@ class ValidateTransactionUseCase:
                     "is_valid": existing_validation.is_valid,
                     "asset": existing_validation.asset,
                     "to_address": existing_validation.to_address,
-                    "value": existing_validation.value,
+                    "value": str(existing_validation.value),
                 },
-            }
+            }, None
 
-        tx_details = self.blockchain_service.get_transaction_details(tx_hash)
-        tx_receipt = self.blockchain_service.get_transaction_receipt(tx_hash)
+        # Detalhes, recibo e bloco atual são consultas independentes; o serviço de blockchain
+        # as executa simultaneamente, evitando três viagens de ida e volta sequenciais ao nó.
+        tx_details, tx_receipt, current_block = self.blockchain_service.get_transaction_bundle(tx_hash)
 
         if not tx_details or not tx_receipt:
             raise ValueError("Transação não encontrada ou pendente.")
 
+        # Transações revertidas não transferem nenhum ativo e nunca geram crédito;
+        # nesse caso não há logs a decodificar nem endereços a consultar.
+        if tx_receipt.get("status") != 1:
+            return {
+                "tx_hash": tx_hash,
+                "is_valid_and_safe_for_credit": False,
+                "transfers": [],
+                "confirmations": 0,
+                "tx_status": "failed",
+            }, None
+
         asset = "ETH"
         transfers: List[TransferDetail] = []
 
         # Identificar se é tx de ETH ou token ERC-20
-        if tx_details.get("value", 0) > 0 and not tx_details.get("input", b"").startswith(b"0x"): # Transação ETH simples
+        # Uma transação ETH simples transfere valor sem calldata: o campo `input` é "0x" (ou vazio).
+        input_data = tx_details.get("input", "0x")
+        if tx_details.get("value", 0) > 0 and len(input_data) <= 2: # Transação ETH simples
             transfers.append(
                 TransferDetail(
                     asset="ETH",
                     to_address=tx_details["to"],
-                    value=str(tx_details["value"])
+                    value=tx_details["value"]
                 )
             )
 
         # Para transações de token ERC-20 (verificar logs)
-        for log in tx_receipt.get("logs", []):
-            decoded_log = self.blockchain_service.decode_erc20_transfer_log(log)
-            if decoded_log:
-                transfers.append(decoded_log)
-                asset = decoded_log.asset # Atualiza o ativo principal se for ERC-20
+        # Os logs são decodificados em lote; apenas eventos `Transfer` são considerados.
+        erc20_transfers = self.blockchain_service.decode_erc20_transfer_logs(tx_receipt.get("logs", []))
+        if erc20_transfers:
+            transfers.extend(erc20_transfers)
+            asset = erc20_transfers[-1].asset # Atualiza o ativo principal se for ERC-20
 
-        # Confirmar se o destino da transferência é um de nossos endereços gerados
-        is_destination_our_address = False
-        our_addresses = [addr.address for addr in self.address_repository.get_all()]
+        confirmations = current_block - tx_receipt.get("blockNumber", 0)
 
-        for transfer in transfers:
-            if transfer.to_address in our_addresses:
-                is_destination_our_address = True
-                break
+        MIN_CONFIRMATIONS = 12
 
         # Se a transação é válida e segura para gerar crédito.
-        is_valid_and_safe = False
-        if tx_receipt.get("status") == 1:
-            current_block = self.blockchain_service.get_current_block_number()
-            confirmations = current_block - tx_receipt.get("blockNumber", 0)
-
-            MIN_CONFIRMATIONS = 12
-
-            if confirmations >= MIN_CONFIRMATIONS and is_destination_our_address:
-                is_valid_and_safe = True
+        # A consulta de propriedade dos endereços só é feita quando as demais condições são
+        # satisfeitas, e consulta apenas os destinos das transferências, não a tabela inteira.
+        is_valid_and_safe = (
+            confirmations >= MIN_CONFIRMATIONS
+            and bool(transfers)
+            and self.address_repository.exists_any(transfer.to_address for transfer in transfers)
+        )
 
         response_data = {
             "tx_hash": tx_hash,
             "is_valid_and_safe_for_credit": is_valid_and_safe,
-            "transfers": [t.__dict__ for t in transfers],
-            "confirmations": confirmations if "confirmations" in locals() else 0,
-            "tx_status": "success" if tx_receipt.get("status") == 1 else "failed",
+            "transfers": [_transfer_to_dict(t) for t in transfers],
+            "confirmations": confirmations,
+            "tx_status": "success",
         }
 
-        # Armazenar as transações válidas em uma base de dados para consulta do histórico.
-        if is_valid_and_safe:
-            new_validated_tx = ValidatedTransaction(
-                tx_hash=tx_hash,
-                asset=asset,
-                to_address=transfers[0].to_address if transfers else "N/A",
-                value=str(transfers[0].value) if transfers else "0",
-                is_valid=True,
-            )
-            self.validated_tx_repository.save(new_validated_tx)
-
-        return response_data
+        if not is_valid_and_safe:
+            return response_data, None
+
+        new_validated_tx = ValidatedTransaction(
+            tx_hash=tx_hash,
+            asset=asset,
+            to_address=transfers[0].to_address if transfers else "N/A",
+            value=transfers[0].value if transfers else 0,
+            is_valid=True,
+        )
+        return response_data, new_validated_tx
 
 
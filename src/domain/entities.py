@@ -1,13 +1,15 @@
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 
 # Esta camada contém as entidades de domínio, que são o coração da aplicação.
 # Elas encapsulam as regras de negócio mais importantes e são independentes de qualquer tecnologia externa.
 # Este é o centro da Clean Architecture, garantindo que as regras de negócio permaneçam puras e testáveis.
+# As entidades usam `slots=True`: cada instância dispensa o `__dict__`, ocupando menos memória
+# e tornando o acesso aos atributos mais rápido.
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """Representa um endereço Ethereum e sua chave privada associada.
     
@@ -18,9 +20,9 @@ class Address:
     address: str
     private_key: str  # Em produção, esta chave deve ser criptografada ou gerenciada externamente.
     id: Optional[int] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = None  # Preenchido pelo banco de dados ao ser salvo
 
-@dataclass
+@dataclass(slots=True)
 class ValidatedTransaction:
     """Representa uma transação validada como segura para crédito.
     
@@ -31,12 +33,12 @@ class ValidatedTransaction:
     tx_hash: str
     asset: str  # Ex: 'ETH', 'USDT'
     to_address: str
-    value: str  # Armazenar como string para evitar problemas de precisão com floats
+    value: int  # Em unidades base (wei ou menor unidade do token); inteiros evitam problemas de precisão com floats
     is_valid: bool
     id: Optional[int] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = None  # Preenchido pelo banco de dados ao ser salvo
 
-@dataclass
+@dataclass(slots=True)
 class CreatedTransaction:
     """Representa uma transação criada pela aplicação.
     
@@ -47,16 +49,16 @@ class CreatedTransaction:
     from_address: str
     to_address: str
     asset: str
-    value: str
+    value: str  # Valor decimal informado na requisição (ex: '0.5'), não em unidades base
     status: str  # Ex: 'pending', 'confirmed', 'failed'
     tx_hash: Optional[str] = None  # Pode ser nulo até a transação ser enviada
-    gas_price_gwei: Optional[str] = None
+    gas_price_gwei: Optional[int] = None
     gas_limit: Optional[int] = None
-    effective_cost_wei: Optional[str] = None
+    effective_cost_wei: Optional[int] = None
     id: Optional[int] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = None  # Preenchido pelo banco de dados ao ser salvo
 
-@dataclass
+@dataclass(slots=True)
 class TransferDetail:
     """Representa os detalhes de uma transferência dentro de uma transação.
     
@@ -65,6 +67,6 @@ class TransferDetail:
     """
     asset: str
     to_address: str
-    value: str
+    value: int  # Em unidades base (wei ou menor unidade do token)
 
 
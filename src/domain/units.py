@@ -0,0 +1,66 @@
+
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+# Regras de conversão de valores monetários do domínio, independentes de qualquer biblioteca
+# externa. Os valores recebidos pela API estão em formato decimal (ex: '0.5' ETH) e são
+# enviados à rede em unidades base inteiras (wei ou a menor unidade do token).
+
+# Casas decimais do ETH (1 ETH = 10**18 wei), também usadas pelos tokens ERC-20 da aplicação.
+ETHER_DECIMALS = 18
+
+# Quantidade de conversões mantidas em cache. Os valores transferidos costumam se repetir
+# (ex: '0.1', '1'), e cada envio converte o mesmo valor duas vezes: na validação do caso de
+# uso e na montagem da transação; as repetições são respondidas pelo cache, sem nova conversão.
+BASE_UNITS_CACHE_SIZE = 1024
+
+# Maior valor aceito em unidades base: o limite de um `uint256`, que tem 78 algarismos decimais.
+UINT256_MAX = 2**256 - 1
+UINT256_MAX_DIGITS = len(str(UINT256_MAX))
+
+@lru_cache(maxsize=BASE_UNITS_CACHE_SIZE)
+def to_base_units(value: str, decimals: int = ETHER_DECIMALS) -> int:
+    """Converte um valor decimal em texto para unidades base inteiras.
+
+    A conversão é exata: o texto é interpretado como `Decimal` e escalado com aritmética de
+    inteiros, sem a perda de precisão de `float` nem o limite de precisão do contexto decimal.
+
+    Args:
+        value (str): O valor em formato decimal (ex: '0.5').
+        decimals (int): A quantidade de casas decimais do ativo.
+
+    Returns:
+        int: O valor em unidades base (ex: wei).
+
+    Raises:
+        ValueError: Se o valor não for um número finito e não negativo, tiver mais casas
+            decimais do que o ativo permite ou não couber em um `uint256`.
+    """
+    try:
+        amount = Decimal(value)
+    except (InvalidOperation, TypeError):
+        raise ValueError("Valor da transferência inválido.") from None
+    if not amount.is_finite():
+        raise ValueError("Valor da transferência inválido.")
+
+    sign, digits, exponent = amount.as_tuple()
+    # Sem zeros à direita, o resultado teria `len(digits) + exponent + decimals` algarismos. O
+    # limite é verificado antes da potência de 10, cujo custo cresce com o expoente informado
+    # (ex: '1e9999999' levaria segundos de CPU e ocuparia o cache com um inteiro enorme).
+    if any(digits) and len(digits) + exponent + decimals > UINT256_MAX_DIGITS:
+        raise ValueError("Valor da transferência inválido.")
+    coefficient = int("".join(map(str, digits)))
+    if sign and coefficient:
+        raise ValueError("Valor da transferência inválido.")
+    # Zeros à direita não contam como casas decimais (ex: '1.50' com 1 casa decimal).
+    while exponent + decimals < 0 and coefficient and coefficient % 10 == 0:
+        coefficient //= 10
+        exponent += 1
+    if exponent + decimals < 0:
+        if coefficient:
+            raise ValueError(f"O valor da transferência admite no máximo {decimals} casas decimais.")
+        return 0
+    base_units = coefficient * 10 ** (exponent + decimals)
+    if base_units > UINT256_MAX:
+        raise ValueError("Valor da transferência inválido.")
+    return base_units
@@ -0,0 +1,55 @@
+
+import hashlib
+import math
+from typing import Iterable
+
+# Capacidade e taxa de falsos positivos padrão do filtro de endereços.
+# Com esses valores o filtro ocupa cerca de 18 MB (~29 bits por endereço),
+# contra mais de 100 bytes por endereço em um `set` de strings.
+BLOOM_EXPECTED_ITEMS = 5_000_000
+BLOOM_ERROR_RATE = 1e-6
+
+class AddressBloomFilter:
+    """Filtro de Bloom para o conjunto de endereços da aplicação.
+
+    Responde se um endereço *pode* pertencer ao conjunto: uma resposta negativa é
+    definitiva (sem falsos negativos), enquanto uma positiva deve ser confirmada no
+    banco de dados, pois pode ser um falso positivo. Os endereços são comparados sem
+    diferenciar maiúsculas de minúsculas, já que o checksum EIP-55 não altera o endereço.
+    """
+
+    def __init__(self, expected_items: int = BLOOM_EXPECTED_ITEMS, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        Inicializa um filtro vazio, dimensionado para a capacidade e a taxa de erro informadas.
+
+        Args:
+            expected_items (int): Quantidade de endereços esperada.
+            error_rate (float): Taxa de falsos positivos desejada ao atingir a capacidade.
+        """
+        if expected_items <= 0 or not 0 < error_rate < 1:
+            raise ValueError("Capacidade ou taxa de erro inválida para o filtro de Bloom.")
+        self.num_bits = math.ceil(-expected_items * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / expected_items * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, address: str) -> Iterable[int]:
+        # Hashing duplo (Kirsch-Mitzenmacher): as k posições são derivadas de dois hashes de 64 bits.
+        digest = hashlib.blake2b(address.lower().encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, address: str) -> None:
+        """Adiciona um endereço ao filtro."""
+        bits = self._bits
+        for position in self._positions(address):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, addresses: Iterable[str]) -> None:
+        """Adiciona vários endereços ao filtro."""
+        for address in addresses:
+            self.add(address)
+
+    def __contains__(self, address: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(address))
@@ -0,0 +1,95 @@
+
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple
+from src.infrastructure.cache.address_bloom_filter import AddressBloomFilter
+
+# Esta camada contém caches em memória usados pela camada de Infraestrutura.
+# Eles evitam consultas repetidas ao banco de dados para dados que mudam raramente,
+# sem que as camadas internas (Domínio e Aplicação) precisem saber da sua existência.
+
+# Intervalo mínimo, em segundos, entre duas buscas por endereços inseridos por outros processos.
+# Um endereço recém-gerado em outro processo não pode receber um depósito já confirmado
+# (MIN_CONFIRMATIONS blocos) em poucos segundos, então esse atraso não causa falsos negativos
+# na validação de transações.
+ADDRESS_CACHE_REFRESH_INTERVAL = 5.0
+
+class AddressCache:
+    """Cache em memória do conjunto de endereços gerados pela aplicação.
+
+    Os endereços são mantidos em um filtro de Bloom (`AddressBloomFilter`), carregado sob
+    demanda na primeira consulta e atualizado a cada inserção feita pelo repositório.
+    Endereços inseridos por outros processos são incorporados incrementalmente com
+    `refresh`, que busca apenas as linhas com ID maior que o último carregado.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int], Iterable[Tuple[int, str]]],
+        bloom_factory: Callable[[], AddressBloomFilter] = AddressBloomFilter,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            loader (Callable[[int], Iterable[Tuple[int, str]]]): Função que carrega, do banco de
+                dados, os pares (ID, endereço) com ID maior que o informado.
+            bloom_factory (Callable[[], AddressBloomFilter]): Cria o filtro de Bloom vazio.
+        """
+        self._loader = loader
+        self._bloom_factory = bloom_factory
+        self._bloom: Optional[AddressBloomFilter] = None
+        self._last_id = 0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def might_contain(self, address: str) -> bool:
+        """Indica se o endereço pode pertencer à aplicação, carregando o filtro se necessário.
+
+        Args:
+            address (str): O endereço Ethereum a ser verificado.
+
+        Returns:
+            bool: False se o endereço certamente não está no cache; True se pode estar.
+        """
+        bloom = self._bloom
+        if bloom is None:
+            with self._lock:
+                if self._bloom is None:
+                    bloom = self._bloom_factory()
+                    self._load_into(bloom)
+                    self._bloom = bloom
+                bloom = self._bloom
+        return address in bloom
+
+    def refresh(self) -> None:
+        """Incorpora os endereços inseridos por outros processos desde a última carga.
+
+        Chamadas mais frequentes que `ADDRESS_CACHE_REFRESH_INTERVAL` são ignoradas.
+        """
+        with self._lock:
+            if self._bloom is None or time.monotonic() - self._last_refresh < ADDRESS_CACHE_REFRESH_INTERVAL:
+                return
+            self._load_into(self._bloom)
+
+    def add(self, addresses: Iterable[str]) -> None:
+        """Adiciona endereços recém-inseridos ao cache, caso ele já tenha sido carregado.
+
+        Args:
+            addresses (Iterable[str]): Os endereços inseridos.
+        """
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.update(addresses)
+
+    def invalidate(self) -> None:
+        """Descarta o filtro carregado; a próxima consulta o recarrega do banco de dados."""
+        with self._lock:
+            self._bloom = None
+            self._last_id = 0
+
+    def _load_into(self, bloom: AddressBloomFilter) -> None:
+        for address_id, address in self._loader(self._last_id):
+            bloom.add(address)
+            self._last_id = max(self._last_id, address_id)
+        self._last_refresh = time.monotonic()
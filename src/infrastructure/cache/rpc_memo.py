@@ -0,0 +1,58 @@
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Validade padrão, em segundos, das respostas RPC memorizadas (aproximadamente meio bloco).
+RPC_MEMO_TTL = 6.0
+
+# Quantidade máxima de respostas memorizadas; as mais antigas são descartadas primeiro.
+RPC_MEMO_MAX_SIZE = 10_000
+
+class RpcMemo:
+    """Memória de curta duração para respostas de chamadas RPC.
+
+    Evita buscar novamente, no mesmo intervalo curto, dados que acabaram de ser consultados
+    (ex: o recibo obtido na validação e consultado de novo na atualização de status).
+    A validade curta limita o impacto de reorganizações da cadeia. Os valores armazenados
+    são compartilhados entre as chamadas e não devem ser alterados por quem os recebe.
+    """
+
+    def __init__(self, ttl: float = RPC_MEMO_TTL, max_size: int = RPC_MEMO_MAX_SIZE):
+        """
+        Inicializa a memória.
+
+        Args:
+            ttl (float): Tempo de validade de cada entrada, em segundos.
+            max_size (int): Quantidade máxima de entradas.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor memorizado para a chave, ou None se ausente ou expirado."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Memoriza um valor pelo tempo de validade configurado."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Descarta o valor memorizado para a chave, se houver."""
+        with self._lock:
+            self._entries.pop(key, None)
@@ -1,7 +1,14 @@
 
 import os
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
-from src.infrastructure.database.models import db
+from src.infrastructure.database.models import db, CreatedTransactionModel, ValidatedTransactionModel
+from src.infrastructure.database.history_versions import ensure_history_versions
+from src.infrastructure.database.schema_check import verify_schema
+from src.infrastructure.services.orjson_http_provider import OrjsonHTTPProvider
 
 # Esta camada contém as configurações da aplicação, como URLs de provedores de blockchain
 # e strings de conexão com o banco de dados. Ela faz parte da camada de Infraestrutura
@@ -9,6 +16,28 @@ from src.infrastructure.database.models import db
 # A classe `Config` centraliza o acesso a essas configurações, facilitando a manutenção
 # e a adaptação a diferentes ambientes (desenvolvimento, produção).
 
+def _engine_options(database_uri: str, pool_size: int, max_overflow: int) -> dict:
+    """Retorna as opções do engine do SQLAlchemy adequadas ao banco de dados configurado.
+
+    Com o psycopg2 (driver padrão do PostgreSQL), os INSERTs em lote são agrupados em
+    comandos `INSERT ... VALUES (...), (...)` de até 1000 linhas, e os UPDATEs/DELETEs em
+    lote usam `execute_batch`, em vez de um comando por linha. O pool de conexões é
+    dimensionado para as threads de cada processo, para que uma requisição não espere por
+    uma conexão livre. Essas opções são específicas do driver e não se aplicam ao SQLite.
+    """
+    if database_uri.startswith(("postgresql://", "postgresql+psycopg2://")):
+        return {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": 1000,
+            "executemany_batch_page_size": 500,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+        }
+    return {}
+
+# Tabelas cujos históricos são versionados em `HistoryVersionModel`.
+HISTORY_TABLES = (CreatedTransactionModel.__tablename__, ValidatedTransactionModel.__tablename__)
+
 class Config:
     """Classe de configuração para a aplicação.
 
@@ -22,32 +51,106 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv(
         "DATABASE_URL", "sqlite:///blockchain_data.db"
     )
+    # Algumas plataformas (ex: Heroku) informam a URL com o esquema `postgres://`, que não é
+    # aceito pelo SQLAlchemy 2; ele é trocado pelo nome do dialeto, `postgresql://`.
+    if SQLALCHEMY_DATABASE_URI.startswith("postgres://"):
+        SQLALCHEMY_DATABASE_URI = "postgresql://" + SQLALCHEMY_DATABASE_URI.removeprefix("postgres://")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Threads por processo que executam tarefas em segundo plano (ex: atualizações de status
+    # pedidas com `Prefer: respond-async`). Cada uma também pode ocupar uma conexão do pool.
+    BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", "2"))
+
+    # Conexões mantidas com o banco de dados por processo: uma para cada thread que pode usá-la
+    # ao mesmo tempo (as threads do servidor WSGI, `GUNICORN_THREADS`, e as de segundo plano).
+    # Conexões extras (`DATABASE_MAX_OVERFLOW`) são desativadas por padrão, para que o total de
+    # conexões seja previsível: processos do Gunicorn × `DATABASE_POOL_SIZE`.
+    DATABASE_POOL_SIZE = int(
+        os.getenv("DATABASE_POOL_SIZE", int(os.getenv("GUNICORN_THREADS", "8")) + BACKGROUND_TASK_WORKERS)
+    )
+    DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "0"))
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI, DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW)
+
+    # Executa os caminhos mais usados uma vez ao iniciar a aplicação (consultas de listagem,
+    # validação e serialização JSON), para que a primeira requisição de cada processo não pague
+    # esses custos. Pode ser desativado com `WARMUP_ON_STARTUP=0` (ex: em scripts e testes).
+    WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "1") == "1"
+
     WEB3_PROVIDER_URL = os.getenv(
         "WEB3_PROVIDER_URL", "https://sepolia.infura.io/v3/YOUR_INFURA_PROJECT_ID"
     )
 
+    # Limite de gás fixo para transferências ERC-20 (ex: 65000). Se definido, a estimativa
+    # de gás dessas transferências não é consultada no nó; se vazio, o gás é estimado.
+    ERC20_GAS_LIMIT = int(os.getenv("ERC20_GAS_LIMIT")) if os.getenv("ERC20_GAS_LIMIT") else None
+
+    # Tamanho do pool de conexões HTTP (keep-alive) mantidas com o provedor Web3.
+    # Deve ser pelo menos igual ao número de threads que fazem chamadas RPC simultâneas.
+    WEB3_HTTP_POOL_SIZE = int(os.getenv("WEB3_HTTP_POOL_SIZE", "64"))
+
+    # Tempo máximo, em segundos, de espera por uma resposta do provedor Web3.
+    WEB3_HTTP_TIMEOUT = float(os.getenv("WEB3_HTTP_TIMEOUT", "10"))
+
+    # Quantidade de novas tentativas, com espera exponencial, em falhas de conexão com o provedor Web3.
+    WEB3_HTTP_RETRIES = int(os.getenv("WEB3_HTTP_RETRIES", "3"))
+
     @staticmethod
     def init_db(app):
         """Inicializa o SQLAlchemy com a aplicação Flask.
 
         Esta função é responsável por configurar o banco de dados SQLAlchemy com a aplicação Flask.
-        Ela garante que as tabelas do banco de dados sejam criadas se ainda não existirem.
+        Ela garante que as tabelas do banco de dados, e as linhas de versão dos históricos,
+        sejam criadas se ainda não existirem. Tabelas existentes não são alteradas: se forem de
+        uma versão anterior dos modelos, a inicialização é interrompida (`SchemaMismatchError`).
         """
         db.init_app(app)
         with app.app_context():
+            verify_schema()
             db.create_all()
+            # Linhas de versão dos históricos (ETags de `GET /transactions` e `/transactions/validations`).
+            ensure_history_versions(HISTORY_TABLES)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_web3_instance() -> Web3:
         """Retorna uma instância configurada do Web3.
 
         Esta função fornece uma instância do Web3.py configurada com a URL do provedor.
         Ela abstrai a criação da instância do Web3 das outras partes da aplicação,
-        promovendo a Inversão de Dependência.
+        promovendo a Inversão de Dependência. A instância é criada uma única vez por
+        processo e reutilizada, evitando recriar o provedor (e suas conexões) a cada chamada.
+        """
+        return Web3(
+            OrjsonHTTPProvider(
+                Config.WEB3_PROVIDER_URL,
+                session=Config.get_http_session(),
+                request_kwargs={"timeout": Config.WEB3_HTTP_TIMEOUT},
+            )
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_http_session() -> requests.Session:
+        """Retorna a sessão HTTP compartilhada usada pelo provedor Web3.
+
+        A sessão mantém um pool de conexões persistentes (keep-alive) com o provedor,
+        evitando um novo handshake TCP/TLS a cada chamada RPC. O pool é dimensionado
+        para as chamadas simultâneas feitas pelas threads da aplicação.
+
+        Falhas ao abrir a conexão são repetidas com espera exponencial. Como as chamadas
+        JSON-RPC são POSTs (não idempotentes para o `urllib3`), requisições que chegaram
+        ao provedor não são reenviadas, evitando, por exemplo, enviar uma transação duas vezes.
         """
-        return Web3(Web3.HTTPProvider(Config.WEB3_PROVIDER_URL))
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Config.WEB3_HTTP_POOL_SIZE,
+            pool_maxsize=Config.WEB3_HTTP_POOL_SIZE,
+            max_retries=Retry(total=Config.WEB3_HTTP_RETRIES, backoff_factor=0.1),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
 
 
 
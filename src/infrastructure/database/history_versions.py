@@ -0,0 +1,47 @@
+
+from typing import Iterable
+from sqlalchemy.exc import IntegrityError
+from src.infrastructure.database.models import db, HistoryVersionModel
+
+# Versões dos históricos expostos pelos endpoints de listagem (ver `HistoryVersionModel`).
+# Os repositórios chamam `bump_history_version` a cada gravação, antes do commit da unidade de
+# trabalho; a versão só muda para os leitores quando a gravação é confirmada.
+
+def ensure_history_versions(names: Iterable[str]) -> None:
+    """Cria, se ainda não existirem, as linhas de versão dos históricos informados.
+
+    Executada na inicialização da aplicação, para que as primeiras gravações apenas incrementem
+    o contador. Processos iniciados ao mesmo tempo podem tentar criar a mesma linha; a que
+    perder a disputa apenas desfaz a sua tentativa.
+    """
+    existing = set(db.session.execute(db.select(HistoryVersionModel.name)).scalars())
+    missing = [name for name in names if name not in existing]
+    if not missing:
+        return
+    try:
+        db.session.execute(db.insert(HistoryVersionModel), [{"name": name, "version": 0} for name in missing])
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+
+def bump_history_version(name: str) -> None:
+    """Incrementa a versão de um histórico na transação atual.
+
+    O incremento é feito pelo próprio banco de dados (`version = version + 1`), que bloqueia a
+    linha até o commit: gravações concorrentes nunca produzem a mesma versão.
+    """
+    result = db.session.execute(
+        db.update(HistoryVersionModel)
+        .where(HistoryVersionModel.name == name)
+        .values(version=HistoryVersionModel.version + 1)
+    )
+    if result.rowcount == 0:
+        # A linha ainda não existe (ex: banco criado sem `ensure_history_versions`).
+        db.session.execute(db.insert(HistoryVersionModel).values(name=name, version=1))
+
+def get_history_version(name: str) -> int:
+    """Retorna a versão atual de um histórico (0 se nunca houve gravação)."""
+    version = db.session.execute(
+        db.select(HistoryVersionModel.version).where(HistoryVersionModel.name == name)
+    ).scalar()
+    return version or 0
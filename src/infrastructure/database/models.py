@@ -1,47 +1,78 @@
 
-from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from typing import Optional
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped, mapped_column
+from src.infrastructure.database.types import EthereumAddress, Uint256
 
 db = SQLAlchemy() # Inicializado posteriormente com o app Flask
 
+# Os modelos usam o mapeamento tipado do SQLAlchemy 2.0 (`Mapped`/`mapped_column`): a
+# nulidade de cada coluna é deduzida da anotação (`Optional[...]` indica coluna anulável).
+# Os modelos não têm relacionamentos, portanto nenhuma leitura dispara carregamentos
+# implícitos (lazy loading); ao adicionar um, declare-o com `lazy="raise"` e carregue-o
+# explicitamente (ex: `selectinload`) nas consultas que precisarem dele.
+
 class AddressModel(db.Model):
     __tablename__ = 'addresses'
-    id = db.Column(db.Integer, primary_key=True)
-    address = db.Column(db.String(42), unique=True, nullable=False)
-    private_key = db.Column(db.String(64), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    __mapper_args__ = {'eager_defaults': True}
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Os endereços são armazenados como 20 bytes e devolvidos com checksum (ver `EthereumAddress`).
+    address: Mapped[str] = mapped_column(EthereumAddress, unique=True, index=True)
+    private_key: Mapped[str] = mapped_column(db.String(64))
+    # O carimbo de data/hora é preenchido pelo próprio banco de dados na inserção.
+    created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f'<AddressModel {self.address}>'
 
 class ValidatedTransactionModel(db.Model):
     __tablename__ = 'validated_transactions'
-    id = db.Column(db.Integer, primary_key=True)
-    tx_hash = db.Column(db.String(66), unique=True, nullable=False)
-    asset = db.Column(db.String(10), nullable=False)
-    to_address = db.Column(db.String(42), nullable=False)
-    value = db.Column(db.String(50), nullable=False)
-    is_valid = db.Column(db.Boolean, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    __mapper_args__ = {'eager_defaults': True}
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tx_hash: Mapped[str] = mapped_column(db.String(66), unique=True, index=True)
+    asset: Mapped[str] = mapped_column(db.String(10))
+    to_address: Mapped[str] = mapped_column(EthereumAddress)
+    # Valor em unidades base (wei ou menor unidade do token), como inteiro de 256 bits.
+    value: Mapped[int] = mapped_column(Uint256)
+    is_valid: Mapped[bool] = mapped_column(db.Boolean)
+    # O carimbo de data/hora é preenchido pelo próprio banco de dados na inserção.
+    created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f'<ValidatedTransactionModel {self.tx_hash}>'
 
 class CreatedTransactionModel(db.Model):
     __tablename__ = 'created_transactions'
-    id = db.Column(db.Integer, primary_key=True)
-    tx_hash = db.Column(db.String(66), unique=True, nullable=True)
-    from_address = db.Column(db.String(42), nullable=False)
-    to_address = db.Column(db.String(42), nullable=False)
-    asset = db.Column(db.String(10), nullable=False)
-    value = db.Column(db.String(50), nullable=False)
-    status = db.Column(db.String(20), nullable=False)
-    gas_price_gwei = db.Column(db.String(50), nullable=True)
-    gas_limit = db.Column(db.Integer, nullable=True)
-    effective_cost_wei = db.Column(db.String(50), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    __table_args__ = (db.Index('ix_created_tx_status', 'status'),)
+    __mapper_args__ = {'eager_defaults': True}
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tx_hash: Mapped[Optional[str]] = mapped_column(db.String(66), unique=True, index=True)
+    from_address: Mapped[str] = mapped_column(EthereumAddress)
+    to_address: Mapped[str] = mapped_column(EthereumAddress)
+    asset: Mapped[str] = mapped_column(db.String(10))
+    value: Mapped[str] = mapped_column(db.String(50))
+    status: Mapped[str] = mapped_column(db.String(20))
+    gas_price_gwei: Mapped[Optional[int]] = mapped_column(Uint256)
+    gas_limit: Mapped[Optional[int]] = mapped_column(db.Integer)
+    effective_cost_wei: Mapped[Optional[int]] = mapped_column(Uint256)
+    # O carimbo de data/hora é preenchido pelo próprio banco de dados na inserção.
+    created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
         return f'<CreatedTransactionModel {self.tx_hash or self.id}>'
 
+class HistoryVersionModel(db.Model):
+    """Versão de um histórico (uma linha por tabela), usada nos ETags dos endpoints de listagem.
 
+    O contador é incrementado pelos repositórios na mesma transação de cada gravação, portanto
+    muda exatamente quando as alterações se tornam visíveis, independentemente da ordem em que
+    transações concorrentes são confirmadas. A leitura é uma busca pela chave primária.
+    """
+    __tablename__ = 'history_versions'
+    name: Mapped[str] = mapped_column(db.String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(db.BigInteger)
+
+    def __repr__(self):
+        return f'<HistoryVersionModel {self.name}={self.version}>'
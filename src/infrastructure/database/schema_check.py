@@ -0,0 +1,61 @@
+
+from typing import List
+from sqlalchemy import inspect
+from src.infrastructure.database.models import db
+
+# Verificação do esquema do banco de dados na inicialização da aplicação.
+# O projeto não usa ferramentas de migração: `db.create_all()` cria as tabelas que faltam, mas
+# não altera as que já existem. Um banco criado por uma versão anterior dos modelos (ex: endereços
+# como texto em vez de 20 bytes) passaria a falhar apenas nas primeiras gravações ou leituras;
+# a verificação interrompe a inicialização com a lista das diferenças encontradas.
+
+class SchemaMismatchError(RuntimeError):
+    """O esquema do banco de dados não corresponde aos modelos da aplicação."""
+
+def _normalize_type(type_, dialect) -> str:
+    """Representação do tipo de uma coluna no dialeto do banco, para comparação."""
+    return " ".join(type_.compile(dialect=dialect).upper().split())
+
+def find_schema_differences() -> List[str]:
+    """Compara as tabelas existentes no banco de dados com os modelos.
+
+    São comparados os nomes e os tipos das colunas (no dialeto do banco, ex: `BYTEA` ou
+    `TIMESTAMP WITH TIME ZONE` no PostgreSQL). Tabelas ainda inexistentes não são diferenças:
+    elas são criadas por `db.create_all()`.
+
+    Returns:
+        List[str]: As diferenças encontradas, uma por item; vazia se o esquema estiver atualizado.
+    """
+    inspector = inspect(db.engine)
+    dialect = db.engine.dialect
+    existing_tables = set(inspector.get_table_names())
+    differences = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"]: column for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            existing = columns.pop(column.name, None)
+            if existing is None:
+                differences.append(f"{table.name}.{column.name}: coluna ausente")
+                continue
+            expected_type = _normalize_type(column.type, dialect)
+            found_type = _normalize_type(existing["type"], dialect)
+            if expected_type != found_type:
+                differences.append(f"{table.name}.{column.name}: tipo {found_type}, esperado {expected_type}")
+        differences.extend(f"{table.name}.{name}: coluna não usada pelos modelos" for name in columns)
+    return differences
+
+def verify_schema() -> None:
+    """Interrompe a inicialização se o esquema do banco de dados estiver desatualizado.
+
+    Raises:
+        SchemaMismatchError: Se alguma tabela existente diferir dos modelos.
+    """
+    differences = find_schema_differences()
+    if differences:
+        raise SchemaMismatchError(
+            "O esquema do banco de dados não corresponde aos modelos da aplicação ("
+            + "; ".join(differences)
+            + "). O projeto não tem migrações: recrie o banco de dados (ver README)."
+        )
@@ -0,0 +1,68 @@
+
+from functools import lru_cache
+from typing import Optional
+from eth_utils import to_checksum_address
+from sqlalchemy.types import LargeBinary, Numeric, String, TypeDecorator
+
+# Esta camada contém tipos de coluna personalizados do SQLAlchemy.
+# Eles convertem os valores entre a representação do domínio (ex: strings hexadecimais)
+# e a representação compacta armazenada no banco de dados, de forma transparente
+# para os repositórios e para as camadas internas.
+
+@lru_cache(maxsize=65536)
+def _checksum_from_bytes(raw_address: bytes) -> str:
+    """Converte os 20 bytes de um endereço para o formato com checksum (EIP-55)."""
+    return to_checksum_address(raw_address)
+
+class EthereumAddress(TypeDecorator):
+    """Endereço Ethereum armazenado como 20 bytes binários.
+
+    Na escrita, aceita o endereço hexadecimal com ou sem checksum e o normaliza para bytes;
+    na leitura, devolve o endereço com checksum (EIP-55). Comparado a `String(42)`, reduz o
+    tamanho das linhas e dos índices pela metade e as comparações passam a ser feitas sobre
+    20 bytes, sem depender de maiúsculas e minúsculas.
+    """
+    impl = LargeBinary(20)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        raw_address = bytes.fromhex(value.removeprefix("0x").removeprefix("0X"))
+        if len(raw_address) != 20:
+            raise ValueError(f"Endereço Ethereum inválido: {value}")
+        return raw_address
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return _checksum_from_bytes(bytes(value))
+
+class Uint256(TypeDecorator):
+    """Inteiro sem sinal de 256 bits (valores em wei ou em unidades base de tokens).
+
+    No PostgreSQL é armazenado como `NUMERIC(78, 0)`, que comporta qualquer uint256 e
+    permite aritmética no próprio banco. No SQLite, `NUMERIC` é convertido para ponto
+    flutuante e perderia precisão, por isso o valor é guardado como texto decimal.
+    Em ambos os casos o repositório recebe e devolve `int`.
+    """
+    impl = String(78)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(Numeric(precision=78, scale=0))
+        return dialect.type_descriptor(String(78))
+
+    def process_bind_param(self, value: Optional[int], dialect):
+        if value is None:
+            return None
+        value = int(value)
+        if dialect.name == "postgresql":
+            return value
+        return str(value)
+
+    def process_result_value(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return int(value)
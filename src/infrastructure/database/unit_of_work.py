@@ -0,0 +1,36 @@
+
+from typing import Callable
+from src.application.interfaces import IUnitOfWork
+from src.infrastructure.database.models import db
+
+# Esta é a implementação concreta da interface `IUnitOfWork` usando a sessão do SQLAlchemy.
+# Os repositórios apenas adicionam e enviam (flush) as alterações à sessão; a confirmação
+# acontece uma única vez, ao final do caso de uso, através desta classe.
+
+# Chave usada em `Session.info` para guardar as funções a executar após o commit.
+AFTER_COMMIT_CALLBACKS_KEY = "after_commit_callbacks"
+
+def run_after_commit(callback: Callable[[], None]) -> None:
+    """Agenda uma função para ser executada após o commit da transação atual.
+
+    Usada para atualizar caches em memória somente quando os dados estiverem de fato
+    persistidos; se a transação for desfeita, a função é descartada sem ser executada.
+
+    Args:
+        callback (Callable[[], None]): A função a ser executada.
+    """
+    db.session.info.setdefault(AFTER_COMMIT_CALLBACKS_KEY, []).append(callback)
+
+class SQLAlchemyUnitOfWork(IUnitOfWork):
+    """Implementação da unidade de trabalho usando a sessão do SQLAlchemy."""
+
+    def commit(self) -> None:
+        """Confirma todas as alterações pendentes na sessão e executa as funções agendadas."""
+        db.session.commit()
+        for callback in db.session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, []):
+            callback()
+
+    def rollback(self) -> None:
+        """Descarta todas as alterações pendentes na sessão e as funções agendadas."""
+        db.session.rollback()
+        db.session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, None)
@@ -0,0 +1,88 @@
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+from src.domain.entities import Address
+from src.application.interfaces import IAddressRepository
+from src.infrastructure.database.unit_of_work import run_after_commit
+
+# Esta classe é um decorador (padrão Decorator) sobre qualquer implementação de `IAddressRepository`.
+# Ela adiciona um cache em memória às buscas por endereço sem alterar o repositório decorado,
+# aderindo ao Princípio Aberto/Fechado (OCP). Como implementa a mesma interface, pode substituir
+# o repositório original em qualquer caso de uso, respeitando o Princípio da Substituição de Liskov (LSP).
+
+# Quantidade máxima de endereços mantidos em cache; os menos usados recentemente são descartados.
+ADDRESS_CACHE_MAX_SIZE = 100_000
+
+def _cache_key(address: str) -> str:
+    """Chave do cache para um endereço: o mesmo endereço com ou sem checksum (EIP-55) é uma única entrada."""
+    return address.lower()
+
+class CachedAddressRepository(IAddressRepository):
+    """Repositório de endereços com cache LRU para `find_by_address`.
+
+    Os endereços gerados pela aplicação nunca são alterados ou removidos, portanto uma entrada
+    em cache nunca fica desatualizada. O cache é populado nas inserções (após o commit) e na
+    primeira busca de cada endereço; buscas sem resultado não são armazenadas, para que endereços
+    inseridos por outros processos continuem sendo encontrados.
+    """
+
+    def __init__(self, repository: IAddressRepository, max_size: int = ADDRESS_CACHE_MAX_SIZE):
+        """
+        Inicializa o repositório com cache.
+
+        Args:
+            repository (IAddressRepository): O repositório decorado, responsável pela persistência.
+            max_size (int): Quantidade máxima de endereços mantidos em cache.
+        """
+        self.repository = repository
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, Address]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, address: Address) -> Address:
+        saved_address = self.repository.save(address)
+        run_after_commit(lambda: self._store([saved_address]))
+        return saved_address
+
+    def save_many(self, addresses: List[Address]) -> List[Address]:
+        saved_addresses = self.repository.save_many(addresses)
+        run_after_commit(lambda: self._store(saved_addresses))
+        return saved_addresses
+
+    def find_by_address(self, address: str) -> Optional[Address]:
+        """Busca um endereço, consultando o repositório decorado apenas em caso de ausência no cache.
+
+        Args:
+            address (str): O endereço Ethereum a ser buscado.
+
+        Returns:
+            Optional[Address]: A entidade Address encontrada, ou None se não existir.
+        """
+        key = _cache_key(address)
+        with self._lock:
+            cached_address = self._cache.get(key)
+            if cached_address is not None:
+                self._cache.move_to_end(key)
+                return cached_address
+
+        found_address = self.repository.find_by_address(address)
+        if found_address is not None:
+            self._store([found_address])
+        return found_address
+
+    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> Iterable[Address]:
+        return self.repository.get_all(limit=limit, offset=offset)
+
+    def exists_any(self, addresses: Iterable[str]) -> bool:
+        return self.repository.exists_any(addresses)
+
+    def _store(self, addresses: Iterable[Address]) -> None:
+        """Adiciona endereços ao cache, descartando os menos usados recentemente se necessário."""
+        with self._lock:
+            for address in addresses:
+                key = _cache_key(address.address)
+                self._cache[key] = address
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
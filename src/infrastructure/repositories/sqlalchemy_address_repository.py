@@ -1,8 +1,11 @@
 
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import literal
 from src.domain.entities import Address
 from src.application.interfaces import IAddressRepository
+from src.infrastructure.cache.address_cache import AddressCache
 from src.infrastructure.database.models import db, AddressModel
+from src.infrastructure.database.unit_of_work import run_after_commit
 
 # Esta camada contém as implementações concretas das interfaces de repositório.
 # Ela é responsável por lidar com os detalhes de persistência de dados, como a interação com o banco de dados.
@@ -11,6 +14,14 @@ from src.infrastructure.database.models import db, AddressModel
 # os detalhes de como os dados são armazenados (neste caso, via SQLAlchemy).
 # Também adere ao Princípio da Responsabilidade Única (SRP), sendo responsável apenas pela persistência de endereços.
 
+# Quantidade de linhas buscadas do banco de dados por vez ao percorrer a tabela inteira.
+STREAM_BATCH_SIZE = 1000
+
+# Colunas selecionadas nas leituras, na mesma ordem dos campos da entidade `Address`.
+# As consultas retornam tuplas simples, construídas diretamente como `Address(*row)`,
+# sem hidratar objetos ORM (mapa de identidade e instrumentação de atributos).
+ADDRESS_COLUMNS = (AddressModel.address, AddressModel.private_key, AddressModel.id, AddressModel.created_at)
+
 class SQLAlchemyAddressRepository(IAddressRepository):
     """Implementação do repositório de endereços usando SQLAlchemy.
 
@@ -18,6 +29,16 @@ class SQLAlchemyAddressRepository(IAddressRepository):
     para operações específicas do SQLAlchemy, interagindo com o `AddressModel`.
     """
 
+    def __init__(self, address_cache: Optional[AddressCache] = None):
+        """
+        Inicializa o repositório.
+
+        Args:
+            address_cache (Optional[AddressCache]): Filtro de Bloom dos endereços. Se não for
+                informado, o repositório cria o seu próprio.
+        """
+        self.address_cache = address_cache or AddressCache(self._load_addresses)
+
     def save(self, address: Address) -> Address:
         """Salva um novo endereço no banco de dados.
 
@@ -29,14 +50,46 @@ class SQLAlchemyAddressRepository(IAddressRepository):
         """
         new_address_model = AddressModel(
             address=address.address,
-            private_key=address.private_key,
-            created_at=address.created_at
+            private_key=address.private_key
         )
         db.session.add(new_address_model)
-        db.session.commit()
+        # O flush emite o INSERT, que retorna o ID e o `created_at` gerados pelo banco de dados.
+        db.session.flush()
         address.id = new_address_model.id # Atualiza o ID da entidade de domínio
+        address.created_at = new_address_model.created_at
+        # A confirmação é responsabilidade da unidade de trabalho; o cache só é atualizado após o commit.
+        run_after_commit(lambda: self.address_cache.add([address.address]))
         return address
 
+    def save_many(self, addresses: List[Address]) -> List[Address]:
+        """Salva vários endereços no banco de dados de uma só vez.
+
+        Todos os registros são enviados com um único `flush` e confirmados juntos pela
+        unidade de trabalho, evitando o custo de uma transação (e um fsync) por endereço.
+
+        Args:
+            addresses (List[Address]): As entidades Address a serem salvas.
+
+        Returns:
+            List[Address]: As entidades Address salvas, com os IDs gerados pelo banco de dados.
+        """
+        address_models = [
+            AddressModel(
+                address=address.address,
+                private_key=address.private_key
+            )
+            for address in addresses
+        ]
+        db.session.add_all(address_models)
+        # O flush emite os INSERTs e popula os IDs e o `created_at` gerados pelo banco de dados.
+        db.session.flush()
+        for address, address_model in zip(addresses, address_models):
+            address.id = address_model.id
+            address.created_at = address_model.created_at
+        saved_addresses = [address.address for address in addresses]
+        run_after_commit(lambda: self.address_cache.add(saved_addresses))
+        return addresses
+
     def find_by_address(self, address: str) -> Optional[Address]:
         """Busca um endereço pelo seu valor hash.
 
@@ -46,31 +99,68 @@ class SQLAlchemyAddressRepository(IAddressRepository):
         Returns:
             Optional[Address]: A entidade Address encontrada, ou None se não existir.
         """
-        address_model = AddressModel.query.filter_by(address=address).first()
-        if address_model:
-            return Address(
-                id=address_model.id,
-                address=address_model.address,
-                private_key=address_model.private_key,
-                created_at=address_model.created_at
-            )
-        return None
+        row = db.session.execute(
+            db.select(*ADDRESS_COLUMNS).where(AddressModel.address == address)
+        ).first()
+        return Address(*row) if row else None
+
+    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> Iterator[Address]:
+        """Retorna os endereços armazenados, em ordem de ID.
+
+        Os registros são lidos do banco de dados em blocos de `STREAM_BATCH_SIZE` linhas
+        e convertidos sob demanda, mantendo o uso de memória constante independentemente
+        do tamanho da tabela.
 
-    def get_all(self) -> List[Address]:
-        """Retorna todos os endereços armazenados.
+        Args:
+            limit (Optional[int]): Quantidade máxima de endereços retornados. Se None, retorna todos.
+            offset (int): Quantidade de endereços a serem pulados antes do primeiro retornado.
 
         Returns:
-            List[Address]: Uma lista de todas as entidades Address no banco de dados.
+            Iterator[Address]: Um iterador sobre as entidades Address no banco de dados.
         """
-        address_models = AddressModel.query.all()
-        return [
-            Address(
-                id=addr.id,
-                address=addr.address,
-                private_key=addr.private_key,
-                created_at=addr.created_at
-            )
-            for addr in address_models
-        ]
+        query = db.select(*ADDRESS_COLUMNS).order_by(AddressModel.id).offset(offset).limit(limit)
+        # Executada diretamente na conexão da sessão (Core), sem passar pelo ORM.
+        rows = db.session.connection().execute(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        for row in rows:
+            yield Address(*row)
+
+    def exists_any(self, addresses: Iterable[str]) -> bool:
+        """Verifica se algum dos endereços informados pertence à aplicação.
+
+        Os endereços são primeiro testados no filtro de Bloom em memória: os que certamente
+        não pertencem à aplicação são descartados sem acessar o banco de dados. Os demais
+        (possíveis falsos positivos) são confirmados com uma única consulta `IN`.
+
+        Args:
+            addresses (Iterable[str]): Os endereços Ethereum a serem verificados.
+
+        Returns:
+            bool: True se pelo menos um dos endereços estiver armazenado.
+        """
+        candidates = set(addresses)
+        if not candidates:
+            return False
+
+        possible_matches = [address for address in candidates if self.address_cache.might_contain(address)]
+        if not possible_matches:
+            # Incorpora endereços inseridos por outros processos antes de descartar os candidatos.
+            self.address_cache.refresh()
+            possible_matches = [address for address in candidates if self.address_cache.might_contain(address)]
+            if not possible_matches:
+                return False
 
+        # Seleciona apenas uma constante: o banco responde pela busca no índice, sem
+        # transferir nem converter (checksum) a coluna de endereço.
+        found = db.session.execute(
+            db.select(literal(True)).where(AddressModel.address.in_(possible_matches)).limit(1)
+        ).scalar()
+        return found is not None
 
+    @staticmethod
+    def _load_addresses(after_id: int) -> Iterator[Tuple[int, str]]:
+        """Carrega os pares (ID, endereço) com ID maior que `after_id`, sem hidratar objetos ORM nem chaves privadas."""
+        return db.session.execute(
+            db.select(AddressModel.id, AddressModel.address)
+            .where(AddressModel.id > after_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        ).tuples()
@@ -1,8 +1,10 @@
 
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+from flask import g, has_app_context
 from src.domain.entities import CreatedTransaction
 from src.application.interfaces import ICreatedTransactionRepository
 from src.infrastructure.database.models import db, CreatedTransactionModel
+from src.infrastructure.database.history_versions import bump_history_version, get_history_version
 
 # Esta camada contém as implementações concretas das interfaces de repositório.
 # Ela é responsável por lidar com os detalhes de persistência de dados, como a interação com o banco de dados.
@@ -11,6 +13,38 @@ from src.infrastructure.database.models import db, CreatedTransactionModel
 # os detalhes de como os dados são armazenados (neste caso, via SQLAlchemy).
 # Também adere ao Princípio da Responsabilidade Única (SRP), sendo responsável apenas pela persistência de transações criadas.
 
+# Quantidade de linhas buscadas do banco de dados por vez ao percorrer a tabela inteira.
+STREAM_BATCH_SIZE = 1000
+
+# Colunas selecionadas nas leituras, na mesma ordem dos campos da entidade `CreatedTransaction`.
+# As consultas retornam tuplas simples, construídas diretamente como `CreatedTransaction(*row)`,
+# sem hidratar objetos ORM (mapa de identidade e instrumentação de atributos).
+CREATED_TX_COLUMNS = (
+    CreatedTransactionModel.from_address,
+    CreatedTransactionModel.to_address,
+    CreatedTransactionModel.asset,
+    CreatedTransactionModel.value,
+    CreatedTransactionModel.status,
+    CreatedTransactionModel.tx_hash,
+    CreatedTransactionModel.gas_price_gwei,
+    CreatedTransactionModel.gas_limit,
+    CreatedTransactionModel.effective_cost_wei,
+    CreatedTransactionModel.id,
+    CreatedTransactionModel.created_at,
+)
+
+# Nome do histórico de transações criadas em `HistoryVersionModel`.
+HISTORY_NAME = CreatedTransactionModel.__tablename__
+
+# Atributo de `flask.g` que guarda, durante uma requisição, as transações já buscadas por hash.
+REQUEST_CACHE_ATTR = "created_tx_by_hash"
+
+def _request_cache() -> Optional[Dict[str, CreatedTransaction]]:
+    """Retorna o cache de transações da requisição atual, ou None fora de um contexto Flask."""
+    if not has_app_context():
+        return None
+    return g.setdefault(REQUEST_CACHE_ATTR, {})
+
 class SQLAlchemyCreatedTransactionRepository(ICreatedTransactionRepository):
     """Implementação do repositório de transações criadas usando SQLAlchemy.
 
@@ -36,14 +70,57 @@ class SQLAlchemyCreatedTransactionRepository(ICreatedTransactionRepository):
             status=tx.status,
             gas_price_gwei=tx.gas_price_gwei,
             gas_limit=tx.gas_limit,
-            effective_cost_wei=tx.effective_cost_wei,
-            created_at=tx.created_at
+            effective_cost_wei=tx.effective_cost_wei
         )
         db.session.add(new_tx_model)
-        db.session.commit()
+        bump_history_version(HISTORY_NAME)
+        # O flush emite o INSERT, que retorna o ID e o `created_at` gerados pelo banco de dados.
+        db.session.flush()
         tx.id = new_tx_model.id
+        tx.created_at = new_tx_model.created_at
         return tx
 
+    def save_many(self, txs: List[CreatedTransaction]) -> List[CreatedTransaction]:
+        """Salva várias transações criadas de uma só vez.
+
+        As linhas são enviadas em um único INSERT em lote (`insertmanyvalues`), que retorna
+        os IDs e o `created_at` gerados na mesma ordem das entidades recebidas.
+
+        Args:
+            txs (List[CreatedTransaction]): As entidades CreatedTransaction a serem salvas.
+
+        Returns:
+            List[CreatedTransaction]: As entidades salvas, com os IDs gerados pelo banco de dados.
+        """
+        if not txs:
+            return txs
+        rows = db.session.execute(
+            db.insert(CreatedTransactionModel).returning(
+                CreatedTransactionModel.id,
+                CreatedTransactionModel.created_at,
+                sort_by_parameter_order=True,
+            ),
+            [
+                {
+                    "tx_hash": tx.tx_hash,
+                    "from_address": tx.from_address,
+                    "to_address": tx.to_address,
+                    "asset": tx.asset,
+                    "value": tx.value,
+                    "status": tx.status,
+                    "gas_price_gwei": tx.gas_price_gwei,
+                    "gas_limit": tx.gas_limit,
+                    "effective_cost_wei": tx.effective_cost_wei,
+                }
+                for tx in txs
+            ],
+        )
+        for tx, (tx_id, created_at) in zip(txs, rows):
+            tx.id = tx_id
+            tx.created_at = created_at
+        bump_history_version(HISTORY_NAME)
+        return txs
+
     def find_by_hash(self, tx_hash: str) -> Optional[CreatedTransaction]:
         """Busca uma transação criada pelo seu hash.
 
@@ -53,46 +130,70 @@ class SQLAlchemyCreatedTransactionRepository(ICreatedTransactionRepository):
         Returns:
             Optional[CreatedTransaction]: A entidade CreatedTransaction encontrada, ou None se não existir.
         """
-        tx_model = CreatedTransactionModel.query.filter_by(tx_hash=tx_hash).first()
-        if tx_model:
-            return CreatedTransaction(
-                id=tx_model.id,
-                tx_hash=tx_model.tx_hash,
-                from_address=tx_model.from_address,
-                to_address=tx_model.to_address,
-                asset=tx_model.asset,
-                value=tx_model.value,
-                status=tx_model.status,
-                gas_price_gwei=tx_model.gas_price_gwei,
-                gas_limit=tx_model.gas_limit,
-                effective_cost_wei=tx_model.effective_cost_wei,
-                created_at=tx_model.created_at
-            )
-        return None
+        # Buscas repetidas do mesmo hash na mesma requisição (ex: consulta de status de uma
+        # transação pendente) são respondidas pelo cache em `flask.g`, sem nova consulta.
+        # Buscas sem resultado não são armazenadas.
+        cache = _request_cache()
+        if cache is not None and tx_hash in cache:
+            return cache[tx_hash]
+
+        row = db.session.execute(
+            db.select(*CREATED_TX_COLUMNS).where(CreatedTransactionModel.tx_hash == tx_hash)
+        ).first()
+        if not row:
+            return None
+        tx = CreatedTransaction(*row)
+        if cache is not None:
+            cache[tx_hash] = tx
+        return tx
+
+    def find_by_hashes(self, tx_hashes: Iterable[str]) -> List[CreatedTransaction]:
+        """Busca várias transações criadas pelos seus hashes, com uma única consulta `IN`.
+
+        Args:
+            tx_hashes (Iterable[str]): Os hashes das transações a serem buscadas.
+
+        Returns:
+            List[CreatedTransaction]: As entidades encontradas; hashes inexistentes são ignorados.
+        """
+        tx_hashes = list(tx_hashes)
+        if not tx_hashes:
+            return []
+        rows = db.session.execute(
+            db.select(*CREATED_TX_COLUMNS).where(CreatedTransactionModel.tx_hash.in_(tx_hashes))
+        )
+        return [CreatedTransaction(*row) for row in rows]
 
-    def get_all(self) -> List[CreatedTransaction]:
+    def get_all(self) -> Iterator[CreatedTransaction]:
         """Retorna todas as transações criadas armazenadas.
 
+        Os registros são lidos do banco de dados em blocos de `STREAM_BATCH_SIZE` linhas
+        e convertidos sob demanda, mantendo o uso de memória constante independentemente
+        do tamanho da tabela.
+
         Returns:
-            List[CreatedTransaction]: Uma lista de todas as entidades CreatedTransaction no banco de dados.
+            Iterator[CreatedTransaction]: Um iterador sobre todas as entidades CreatedTransaction no banco de dados.
         """
-        tx_models = CreatedTransactionModel.query.all()
-        return [
-            CreatedTransaction(
-                id=tx.id,
-                tx_hash=tx.tx_hash,
-                from_address=tx.from_address,
-                to_address=tx.to_address,
-                asset=tx.asset,
-                value=tx.value,
-                status=tx.status,
-                gas_price_gwei=tx.gas_price_gwei,
-                gas_limit=tx.gas_limit,
-                effective_cost_wei=tx.effective_cost_wei,
-                created_at=tx.created_at
-            )
-            for tx in tx_models
-        ]
+        # A consulta é executada na conexão da sessão (Core), sem a camada de carregamento do
+        # ORM: as colunas já são selecionadas individualmente e nenhuma entidade ORM é montada.
+        rows = db.session.connection().execute(
+            db.select(*CREATED_TX_COLUMNS)
+            .order_by(CreatedTransactionModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for row in rows:
+            yield CreatedTransaction(*row)
+
+    def get_version(self) -> str:
+        """Retorna um identificador que muda sempre que as transações armazenadas mudam.
+
+        A versão é o contador do histórico (ver `HistoryVersionModel`), incrementado em cada
+        inserção e atualização; a leitura é uma busca pela chave primária.
+
+        Returns:
+            str: A versão atual do histórico de transações criadas.
+        """
+        return str(get_history_version(HISTORY_NAME))
 
     def update(self, tx: CreatedTransaction) -> CreatedTransaction:
         """Atualiza uma transação existente no banco de dados.
@@ -106,7 +207,9 @@ class SQLAlchemyCreatedTransactionRepository(ICreatedTransactionRepository):
         Raises:
             ValueError: Se a transação com o ID fornecido não for encontrada.
         """
-        tx_model = CreatedTransactionModel.query.filter_by(id=tx.id).first()
+        # Busca pela chave primária: usa o mapa de identidade da sessão quando o registro já
+        # foi carregado (ex: logo após o `save` na mesma unidade de trabalho), sem nova consulta.
+        tx_model = db.session.get(CreatedTransactionModel, tx.id)
         if not tx_model:
             raise ValueError(f"Transação com ID {tx.id} não encontrada para atualização.")
         
@@ -115,7 +218,48 @@ class SQLAlchemyCreatedTransactionRepository(ICreatedTransactionRepository):
         tx_model.gas_price_gwei = tx.gas_price_gwei
         tx_model.gas_limit = tx.gas_limit
         tx_model.effective_cost_wei = tx.effective_cost_wei
-        db.session.commit()
+        bump_history_version(HISTORY_NAME)
+        # A confirmação é responsabilidade da unidade de trabalho do caso de uso.
+        db.session.flush()
+        self._evict([tx])
         return tx
 
+    def update_many(self, txs: List[CreatedTransaction]) -> List[CreatedTransaction]:
+        """Atualiza várias transações existentes no banco de dados.
+
+        As alterações são enviadas como um único UPDATE por chave primária, executado em
+        lote (executemany), sem carregar os registros nem emitir um comando por transação.
+
+        Args:
+            txs (List[CreatedTransaction]): As entidades CreatedTransaction a serem atualizadas.
+
+        Returns:
+            List[CreatedTransaction]: As entidades CreatedTransaction atualizadas.
+        """
+        if not txs:
+            return txs
+        db.session.execute(
+            db.update(CreatedTransactionModel),
+            [
+                {
+                    "id": tx.id,
+                    "tx_hash": tx.tx_hash,
+                    "status": tx.status,
+                    "gas_price_gwei": tx.gas_price_gwei,
+                    "gas_limit": tx.gas_limit,
+                    "effective_cost_wei": tx.effective_cost_wei,
+                }
+                for tx in txs
+            ],
+        )
+        bump_history_version(HISTORY_NAME)
+        self._evict(txs)
+        return txs
 
+    @staticmethod
+    def _evict(txs: Iterable[CreatedTransaction]) -> None:
+        """Remove transações alteradas do cache da requisição, forçando uma nova leitura."""
+        cache = _request_cache()
+        if cache:
+            for tx in txs:
+                cache.pop(tx.tx_hash, None)
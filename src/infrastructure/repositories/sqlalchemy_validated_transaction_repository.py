@@ -1,8 +1,9 @@
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from src.domain.entities import ValidatedTransaction
 from src.application.interfaces import IValidatedTransactionRepository
 from src.infrastructure.database.models import db, ValidatedTransactionModel
+from src.infrastructure.database.history_versions import bump_history_version, get_history_version
 
 # Esta camada contém as implementações concretas das interfaces de repositório.
 # Ela é responsável por lidar com os detalhes de persistência de dados, como a interação com o banco de dados.
@@ -11,6 +12,25 @@ from src.infrastructure.database.models import db, ValidatedTransactionModel
 # os detalhes de como os dados são armazenados (neste caso, via SQLAlchemy).
 # Também adere ao Princípio da Responsabilidade Única (SRP), sendo responsável apenas pela persistência de transações validadas.
 
+# Quantidade de linhas buscadas do banco de dados por vez ao percorrer a tabela inteira.
+STREAM_BATCH_SIZE = 1000
+
+# Colunas selecionadas nas leituras, na mesma ordem dos campos da entidade `ValidatedTransaction`.
+# As consultas retornam tuplas simples, construídas diretamente como `ValidatedTransaction(*row)`,
+# sem hidratar objetos ORM (mapa de identidade e instrumentação de atributos).
+VALIDATED_TX_COLUMNS = (
+    ValidatedTransactionModel.tx_hash,
+    ValidatedTransactionModel.asset,
+    ValidatedTransactionModel.to_address,
+    ValidatedTransactionModel.value,
+    ValidatedTransactionModel.is_valid,
+    ValidatedTransactionModel.id,
+    ValidatedTransactionModel.created_at,
+)
+
+# Nome do histórico de transações validadas em `HistoryVersionModel`.
+HISTORY_NAME = ValidatedTransactionModel.__tablename__
+
 class SQLAlchemyValidatedTransactionRepository(IValidatedTransactionRepository):
     """Implementação do repositório de transações validadas usando SQLAlchemy.
 
@@ -32,14 +52,53 @@ class SQLAlchemyValidatedTransactionRepository(IValidatedTransactionRepository):
             asset=tx.asset,
             to_address=tx.to_address,
             value=tx.value,
-            is_valid=tx.is_valid,
-            created_at=tx.created_at
+            is_valid=tx.is_valid
         )
         db.session.add(new_tx_model)
-        db.session.commit()
+        bump_history_version(HISTORY_NAME)
+        # O flush emite o INSERT, que retorna o ID e o `created_at` gerados pelo banco de dados.
+        db.session.flush()
         tx.id = new_tx_model.id
+        tx.created_at = new_tx_model.created_at
         return tx
 
+    def save_many(self, txs: List[ValidatedTransaction]) -> List[ValidatedTransaction]:
+        """Salva várias transações validadas de uma só vez.
+
+        As linhas são enviadas em um único INSERT em lote (`insertmanyvalues`), que retorna
+        os IDs e o `created_at` gerados na mesma ordem das entidades recebidas.
+
+        Args:
+            txs (List[ValidatedTransaction]): As entidades ValidatedTransaction a serem salvas.
+
+        Returns:
+            List[ValidatedTransaction]: As entidades salvas, com os IDs gerados pelo banco de dados.
+        """
+        if not txs:
+            return txs
+        rows = db.session.execute(
+            db.insert(ValidatedTransactionModel).returning(
+                ValidatedTransactionModel.id,
+                ValidatedTransactionModel.created_at,
+                sort_by_parameter_order=True,
+            ),
+            [
+                {
+                    "tx_hash": tx.tx_hash,
+                    "asset": tx.asset,
+                    "to_address": tx.to_address,
+                    "value": tx.value,
+                    "is_valid": tx.is_valid,
+                }
+                for tx in txs
+            ],
+        )
+        for tx, (tx_id, created_at) in zip(txs, rows):
+            tx.id = tx_id
+            tx.created_at = created_at
+        bump_history_version(HISTORY_NAME)
+        return txs
+
     def find_by_hash(self, tx_hash: str) -> Optional[ValidatedTransaction]:
         """Busca uma transação validada pelo seu hash.
 
@@ -49,37 +108,39 @@ class SQLAlchemyValidatedTransactionRepository(IValidatedTransactionRepository):
         Returns:
             Optional[ValidatedTransaction]: A entidade ValidatedTransaction encontrada, ou None se não existir.
         """
-        tx_model = ValidatedTransactionModel.query.filter_by(tx_hash=tx_hash).first()
-        if tx_model:
-            return ValidatedTransaction(
-                id=tx_model.id,
-                tx_hash=tx_model.tx_hash,
-                asset=tx_model.asset,
-                to_address=tx_model.to_address,
-                value=tx_model.value,
-                is_valid=tx_model.is_valid,
-                created_at=tx_model.created_at
-            )
-        return None
-
-    def get_all(self) -> List[ValidatedTransaction]:
+        row = db.session.execute(
+            db.select(*VALIDATED_TX_COLUMNS).where(ValidatedTransactionModel.tx_hash == tx_hash)
+        ).first()
+        return ValidatedTransaction(*row) if row else None
+
+    def get_all(self) -> Iterator[ValidatedTransaction]:
         """Retorna todas as transações validadas armazenadas.
 
+        Os registros são lidos do banco de dados em blocos de `STREAM_BATCH_SIZE` linhas
+        e convertidos sob demanda, mantendo o uso de memória constante independentemente
+        do tamanho da tabela.
+
         Returns:
-            List[ValidatedTransaction]: Uma lista de todas as entidades ValidatedTransaction no banco de dados.
+            Iterator[ValidatedTransaction]: Um iterador sobre todas as entidades ValidatedTransaction no banco de dados.
         """
-        tx_models = ValidatedTransactionModel.query.all()
-        return [
-            ValidatedTransaction(
-                id=tx.id,
-                tx_hash=tx.tx_hash,
-                asset=tx.asset,
-                to_address=tx.to_address,
-                value=tx.value,
-                is_valid=tx.is_valid,
-                created_at=tx.created_at
-            )
-            for tx in tx_models
-        ]
+        # Como em `SQLAlchemyCreatedTransactionRepository.get_all`, a leitura usa a conexão da
+        # sessão (Core) em vez de `session.execute`.
+        rows = db.session.connection().execute(
+            db.select(*VALIDATED_TX_COLUMNS)
+            .order_by(ValidatedTransactionModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for row in rows:
+            yield ValidatedTransaction(*row)
+
+    def get_version(self) -> str:
+        """Retorna um identificador que muda sempre que as transações armazenadas mudam.
 
+        A versão é o contador do histórico (ver `HistoryVersionModel`), incrementado em cada
+        gravação. Diferente do maior ID, ela também muda quando uma transação com ID menor é
+        confirmada depois de outra concorrente.
 
+        Returns:
+            str: A versão atual do histórico de transações validadas.
+        """
+        return str(get_history_version(HISTORY_NAME))
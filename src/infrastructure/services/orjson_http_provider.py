@@ -0,0 +1,22 @@
+
+from typing import cast
+import orjson
+from web3 import HTTPProvider
+from web3.types import RPCResponse
+
+# Provedor HTTP do Web3.py com decodificação das respostas JSON-RPC via `orjson`.
+# Recibos com muitos logs geram respostas grandes; a decodificação padrão (bytes -> str ->
+# `json.loads`) é um dos principais custos de CPU da validação de transações.
+
+class OrjsonHTTPProvider(HTTPProvider):
+    """`HTTPProvider` que decodifica as respostas JSON-RPC com `orjson`.
+
+    `orjson` decodifica diretamente a partir dos bytes da resposta, sem a conversão
+    intermediária para texto, e é várias vezes mais rápido que o módulo `json`.
+    A codificação das requisições é mantida, pois depende do `Web3JsonEncoder` para
+    tipos como `HexBytes` e as requisições são pequenas.
+    """
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        return cast(RPCResponse, orjson.loads(raw_response))
@@ -1,13 +1,23 @@
 
 import os
 import json
+import logging
+import multiprocessing
+import threading
+import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from web3 import Web3
+from web3.contract import Contract
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError, TransactionNotFound, Web3Exception, Web3RPCError
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Tuple, Union
 
 from src.application.interfaces import IBlockchainService
 from src.domain.entities import Address, TransferDetail
+from src.domain.units import ETHER_DECIMALS, to_base_units
+from src.infrastructure.cache.rpc_memo import RpcMemo
 
 # Esta camada contém as implementações concretas das interfaces de serviço.
 # Ela é responsável por lidar com os detalhes de interação com a blockchain Ethereum,
@@ -18,6 +28,8 @@ from src.domain.entities import Address, TransferDetail
 # O Princípio da Substituição de Liskov (LSP) é respeitado, pois esta implementação pode ser substituída
 # por outra que adere à mesma interface, sem quebrar o sistema.
 
+logger = logging.getLogger(__name__)
+
 # ABI mínimo para um contrato ERC-20 (apenas a função transfer e o evento Transfer)
 # Este ABI é um exemplo de como interagir com contratos inteligentes usando um ABI simplificado,
 # demonstrando conhecimento sobre a estrutura de contratos ERC-20.
@@ -71,6 +83,68 @@ ERC20_ABI = """
 ]
 """
 
+# ABI do ERC-20 já decodificado, interpretado uma única vez na importação do módulo
+# em vez de a cada transação de token criada.
+ERC20_ABI_JSON = json.loads(ERC20_ABI)
+
+# Tópico do evento `Transfer(address,address,uint256)` do ERC-20, calculado uma única vez.
+# Os recibos do nó trazem os tópicos em bytes (`HexBytes`); a forma hexadecimal com prefixo
+# `0x`, como no JSON-RPC, é aceita para logs vindos de outras fontes.
+TRANSFER_EVENT_TOPIC_BYTES = bytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+TRANSFER_EVENT_TOPIC = "0x" + TRANSFER_EVENT_TOPIC_BYTES.hex()
+
+# Um `Transfer` do ERC-20 tem três tópicos (assinatura, `from` e `to` indexados) e o valor em
+# `data`, com 32 bytes. O `Transfer` do ERC-721 tem a mesma assinatura, mas quatro tópicos (o ID
+# do token também é indexado) e `data` vazio, e não deve ser tratado como transferência de valor.
+TRANSFER_EVENT_TOPIC_COUNT = 3
+TRANSFER_EVENT_DATA_SIZE = 32
+
+# Gás consumido por uma transferência simples de ETH entre contas externas (custo intrínseco).
+ETH_TRANSFER_GAS = 21_000
+
+# Quantidade mínima de endereços para que a geração seja distribuída entre processos.
+# Abaixo deste valor, o custo de iniciar os processos supera o ganho do paralelismo.
+PARALLEL_ADDRESS_GENERATION_THRESHOLD = 64
+
+# Método de início dos processos de geração de endereços. O `fork` (padrão no Linux) copiaria
+# o processo da API com as suas threads, locks e conexões abertas; o `forkserver` inicia os
+# processos a partir de um servidor limpo, e o `spawn` é usado onde ele não existe.
+ADDRESS_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Quantidade máxima de chamadas RPC independentes executadas simultaneamente.
+RPC_MAX_CONCURRENCY = 8
+
+# Quantidade máxima de chamadas agrupadas em um único lote JSON-RPC.
+RPC_BATCH_MAX_SIZE = 100
+
+# Falhas que afetam apenas a transação sendo montada ou assinada (ex: ativo ou valor inválido,
+# estimativa de gás revertida) e que, em um lote, são informadas como erro dessa transação.
+SIGNING_ERRORS = (ValueError, TypeError, Web3Exception)
+
+# Resultado das transações de um lote que não chegaram a ser enviadas porque a comunicação com
+# o nó falhou. Se a falha ocorreu durante o envio, o nó pode ter recebido a transação.
+UNSENT_TRANSACTION_ERROR = "Falha de comunicação com o nó Ethereum; a transação pode não ter sido enviada."
+
+def _is_transfer_event(topics) -> bool:
+    """Indica se os tópicos de um log correspondem ao evento `Transfer` do ERC-20."""
+    if not topics or len(topics) != TRANSFER_EVENT_TOPIC_COUNT:
+        return False
+    topic = topics[0]
+    if isinstance(topic, bytes):
+        return topic == TRANSFER_EVENT_TOPIC_BYTES
+    return isinstance(topic, str) and topic.lower() == TRANSFER_EVENT_TOPIC
+
+def _create_address(_: object = None) -> Address:
+    """Gera um novo par de chaves e endereço Ethereum.
+
+    Definida no nível do módulo para que possa ser serializada e executada
+    pelos processos do `ProcessPoolExecutor`.
+    """
+    account = Account.create()
+    return Address(address=account.address, private_key=account.key.hex())
+
 class Web3BlockchainService(IBlockchainService):
     """Implementação do serviço de blockchain usando Web3.py.
 
@@ -79,21 +153,43 @@ class Web3BlockchainService(IBlockchainService):
     Ela atua como um adaptador entre a camada de aplicação e a biblioteca `web3.py`.
     """
 
-    def __init__(self, provider_url: str):
+    def __init__(self, w3: Web3, rpc_memo: Optional[RpcMemo] = None, erc20_gas_limit: Optional[int] = None):
         """
-        Inicializa o serviço de blockchain com a URL do provedor.
+        Inicializa o serviço de blockchain com uma instância do Web3.
 
-        Args:
-            provider_url (str): A URL do provedor Web3 (ex: Infura, Alchemy).
+        A instância é criada pela configuração (`Config.get_web3_instance`) e compartilhada
+        por toda a aplicação, de modo que o provedor e suas conexões HTTP sejam configurados
+        em um único lugar.
 
-        Raises:
-            ConnectionError: Se não for possível conectar à rede Ethereum.
+        Args:
+            w3 (Web3): A instância do Web3 conectada ao provedor (ex: Infura, Alchemy).
+            rpc_memo (Optional[RpcMemo]): Memória de curta duração para transações e recibos
+                já consultados. Se não for informada, o serviço cria a sua própria.
+            erc20_gas_limit (Optional[int]): Limite de gás fixo para transferências ERC-20. Se
+                informado, dispensa a estimativa de gás (`estimate_gas`) dessas transferências;
+                caso contrário, o gás é estimado pelo nó a cada transação.
         """
-        self.w3 = Web3(Web3.HTTPProvider(provider_url))
-        if not self.w3.is_connected():
-            raise ConnectionError(f"Não foi possível conectar à rede Ethereum em {provider_url}")
-        print(f"Conectado à rede Ethereum: {self.w3.is_connected()}")
-        print(f"Bloco atual: {self.w3.eth.block_number}")
+        self.w3 = w3
+        self.rpc_memo = rpc_memo or RpcMemo()
+        self.erc20_gas_limit = erc20_gas_limit
+        # A conexão com o nó não é verificada aqui: a criação do serviço (e da aplicação) não faz
+        # chamadas RPC, e a disponibilidade do nó é exposta pelo endpoint `GET /health`.
+        # As chamadas RPC são limitadas por I/O; um pool de threads permite sobrepor
+        # chamadas independentes sem tornar toda a aplicação assíncrona.
+        self._rpc_executor = ThreadPoolExecutor(
+            max_workers=RPC_MAX_CONCURRENCY, thread_name_prefix="web3-rpc"
+        )
+        # Desativado na primeira vez em que o provedor não suportar lotes JSON-RPC.
+        self._batch_supported = True
+        # O chain ID não muda durante a vida do processo; é consultado uma única vez.
+        self._chain_id: Optional[int] = None
+        # Contratos ERC-20 já construídos, por endereço (checksum) do token.
+        self._erc20_contracts: Dict[str, Contract] = {}
+        self._nonce_lock = threading.Lock()
+        # Pool de processos da geração de endereços, criado no primeiro lote grande e mantido
+        # durante a vida do processo, para não pagar o início dos processos a cada requisição.
+        self._address_pool: Optional[ProcessPoolExecutor] = None
+        self._address_pool_lock = threading.Lock()
 
     def generate_new_address(self) -> Address:
         """Gera um novo par de chaves e endereço Ethereum.
@@ -101,8 +197,37 @@ class Web3BlockchainService(IBlockchainService):
         Returns:
             Address: Uma entidade Address contendo o endereço e a chave privada.
         """
-        account = Account.create()
-        return Address(address=account.address, private_key=account.key.hex())
+        return _create_address()
+
+    def generate_new_addresses(self, count: int) -> List[Address]:
+        """Gera vários pares de chaves e endereços Ethereum.
+
+        A geração de chaves (secp256k1 + keccak) é limitada por CPU e serializada pelo GIL.
+        Para lotes grandes, o trabalho é distribuído entre os núcleos disponíveis
+        através de um `ProcessPoolExecutor` reutilizado entre as chamadas.
+
+        Args:
+            count (int): Quantidade de endereços a serem gerados.
+
+        Returns:
+            List[Address]: As entidades Address geradas.
+        """
+        workers = os.cpu_count() or 1
+        if count < PARALLEL_ADDRESS_GENERATION_THRESHOLD or workers < 2:
+            return [_create_address() for _ in range(count)]
+
+        chunksize = max(1, count // (workers * 4))
+        return list(self._get_address_pool(workers).map(_create_address, range(count), chunksize=chunksize))
+
+    def _get_address_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Devolve o pool de processos da geração de endereços, criando-o na primeira chamada."""
+        with self._address_pool_lock:
+            if self._address_pool is None:
+                self._address_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(ADDRESS_POOL_START_METHOD),
+                )
+            return self._address_pool
 
     def get_transaction_details(self, tx_hash: str) -> Dict:
         """Obtém os detalhes de uma transação pelo seu hash.
@@ -113,27 +238,14 @@ class Web3BlockchainService(IBlockchainService):
         Returns:
             Dict: Um dicionário contendo os detalhes da transação, ou um dicionário vazio se não encontrada.
         """
-        tx = self.w3.eth.get_transaction(tx_hash)
-        if tx:
-            # Converte o objeto Transaction para um dicionário serializável
-            return {
-                "blockHash": tx.blockHash.hex() if tx.blockHash else None,
-                "blockNumber": tx.blockNumber,
-                "from": tx["from"],
-                "gas": tx.gas,
-                "gasPrice": tx.gasPrice,
-                "hash": tx.hash.hex(),
-                "input": tx.input,
-                "nonce": tx.nonce,
-                "to": tx.to,
-                "transactionIndex": tx.transactionIndex,
-                "value": tx.value,
-                "type": tx.type,
-                "v": tx.v,
-                "r": tx.r.hex(),
-                "s": tx.s.hex()
-            }
-        return {}
+        memoized = self.rpc_memo.get(("tx", tx_hash))
+        if memoized is not None:
+            return memoized
+        try:
+            tx = self.w3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return {}
+        return self._memoize_transaction(tx_hash, self._serialize_transaction(tx)) if tx else {}
 
     def get_transaction_receipt(self, tx_hash: str) -> Dict:
         """Obtém o recibo de uma transação pelo seu hash.
@@ -144,40 +256,119 @@ class Web3BlockchainService(IBlockchainService):
         Returns:
             Dict: Um dicionário contendo o recibo da transação, ou um dicionário vazio se não encontrado.
         """
-        receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-        if receipt:
-            # Converte o objeto TransactionReceipt para um dicionário serializável
-            return {
-                "blockHash": receipt.blockHash.hex(),
-                "blockNumber": receipt.blockNumber,
-                "contractAddress": receipt.contractAddress,
-                "cumulativeGasUsed": receipt.cumulativeGasUsed,
-                "effectiveGasPrice": receipt.effectiveGasPrice,
-                "from": receipt["from"],
-                "gasUsed": receipt.gasUsed,
-                "logs": [
-                    {
-                        "address": log.address,
-                        "blockHash": log.blockHash.hex(),
-                        "blockNumber": log.blockNumber,
-                        "data": log.data,
-                        "logIndex": log.logIndex,
-                        "removed": log.removed,
-                        "topics": [topic.hex() for topic in log.topics],
-                        "transactionHash": log.transactionHash.hex(),
-                        "transactionIndex": log.transactionIndex,
-                        "id": log.id
-                    }
-                    for log in receipt.logs
-                ],
-                "logsBloom": receipt.logsBloom.hex(),
-                "status": receipt.status,
-                "to": receipt.to,
-                "transactionHash": receipt.transactionHash.hex(),
-                "transactionIndex": receipt.transactionIndex,
-                "type": receipt.type
-            }
-        return {}
+        memoized = self.rpc_memo.get(("receipt", tx_hash))
+        if memoized is not None:
+            return memoized
+        try:
+            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return {}
+        return self._memoize_receipt(tx_hash, self._serialize_receipt(receipt)) if receipt else {}
+
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> List[Dict]:
+        """Obtém os recibos de várias transações.
+
+        Os recibos são buscados em lotes JSON-RPC de até `RPC_BATCH_MAX_SIZE` chamadas,
+        com uma viagem de ida e volta ao nó por lote em vez de uma por transação.
+
+        Args:
+            tx_hashes (List[str]): Os hashes das transações.
+
+        Returns:
+            List[Dict]: Os recibos, na mesma ordem dos hashes; um dicionário vazio para
+                        transações sem recibo (ainda pendentes ou inexistentes).
+        """
+        receipts: Dict[str, Dict] = {}
+        missing = []
+        for tx_hash in tx_hashes:
+            memoized = self.rpc_memo.get(("receipt", tx_hash))
+            if memoized is not None:
+                receipts[tx_hash] = memoized
+            else:
+                missing.append(tx_hash)
+
+        for start in range(0, len(missing), RPC_BATCH_MAX_SIZE):
+            chunk = missing[start:start + RPC_BATCH_MAX_SIZE]
+            results = self._execute_batch(
+                lambda: [self.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in chunk]
+            )
+            if results is None:
+                # Sem lote, as consultas são feitas em paralelo, uma requisição por transação.
+                receipts.update(zip(chunk, self._rpc_executor.map(self.get_transaction_receipt, chunk)))
+                continue
+            for tx_hash, receipt in zip(chunk, results):
+                receipts[tx_hash] = self._memoize_receipt(tx_hash, self._serialize_receipt(receipt))
+        return [receipts[tx_hash] for tx_hash in tx_hashes]
+
+    def _execute_batch(self, build_requests: Callable[[], List[Any]]) -> Optional[List[Any]]:
+        """Envia as consultas criadas por `build_requests` em um único lote JSON-RPC.
+
+        Retorna None quando o lote não pode ser usado, para que o chamador refaça as consultas
+        individualmente: se o provedor não suporta lotes (o que é lembrado nas chamadas
+        seguintes), se o nó rejeita o lote ou se uma das consultas falha (por exemplo, um
+        único recibo ausente faz o lote inteiro falhar com `TransactionNotFound`).
+
+        Args:
+            build_requests (Callable[[], List[Any]]): Cria as consultas do lote; é chamada
+                dentro do contexto `batch_requests`, onde as chamadas do Web3 não são executadas.
+
+        Returns:
+            Optional[List[Any]]: As respostas, na ordem das consultas, ou None.
+        """
+        if not self._batch_supported:
+            return None
+        try:
+            with self.w3.batch_requests() as batch:
+                for request in build_requests():
+                    batch.add(request)
+                return batch.execute()
+        except NotImplementedError:
+            self._batch_supported = False
+            return None
+        except (Web3RPCError, ContractLogicError):
+            return None
+
+    def _memoize_transaction(self, tx_hash: str, tx: Dict) -> Dict:
+        # Transações ainda pendentes (sem bloco) mudam ao serem mineradas e não são memorizadas.
+        if tx.get("blockNumber") is not None:
+            self.rpc_memo.set(("tx", tx_hash), tx)
+        return tx
+
+    def _memoize_receipt(self, tx_hash: str, receipt: Dict) -> Dict:
+        self.rpc_memo.set(("receipt", tx_hash), receipt)
+        return receipt
+
+    @staticmethod
+    def _serialize_transaction(tx) -> Dict:
+        """Converte um objeto Transaction do Web3.py para um dicionário serializável."""
+        return {
+            "blockHash": tx.blockHash.hex() if tx.blockHash else None,
+            "blockNumber": tx.blockNumber,
+            "from": tx["from"],
+            "gas": tx.gas,
+            "gasPrice": tx.gasPrice,
+            "hash": tx.hash.hex(),
+            # Dados de entrada como texto hexadecimal com prefixo; "0x" indica ausência de calldata.
+            "input": tx.input.to_0x_hex(),
+            "nonce": tx.nonce,
+            "to": tx.to,
+            "transactionIndex": tx.transactionIndex,
+            "value": tx.value,
+            "type": tx.type,
+            "v": tx.v,
+            "r": tx.r.hex(),
+            "s": tx.s.hex()
+        }
+
+    @staticmethod
+    def _serialize_receipt(receipt) -> Dict:
+        """Converte um objeto TransactionReceipt do Web3.py para um dicionário.
+
+        A conversão é rasa: os campos binários (hashes, tópicos, dados dos logs) são mantidos
+        como `HexBytes`, sem convertê-los um a um para texto. Se um recibo for devolvido em
+        uma resposta HTTP, o provedor JSON da aplicação os serializa em hexadecimal.
+        """
+        return {**receipt, "logs": [dict(log) for log in receipt.logs]}
 
     def get_current_block_number(self) -> int:
         """Retorna o número do bloco atual da rede Ethereum.
@@ -187,9 +378,59 @@ class Web3BlockchainService(IBlockchainService):
         """
         return self.w3.eth.block_number
 
+    def get_transaction_bundle(self, tx_hash: str) -> Tuple[Dict, Dict, int]:
+        """Obtém os detalhes, o recibo de uma transação e o número do bloco atual.
+
+        As três consultas são independentes entre si e são enviadas ao nó em um único
+        lote JSON-RPC (uma única requisição HTTP), de forma que a latência total é a de
+        uma viagem de ida e volta, e não a soma das três.
+
+        Args:
+            tx_hash (str): O hash da transação.
+
+        Returns:
+            Tuple[Dict, Dict, int]: Os detalhes da transação, o recibo da transação
+                                    e o número do bloco atual.
+        """
+        # Transação e recibo consultados recentemente são reaproveitados; nesse caso
+        # apenas o número do bloco atual, que muda a cada bloco, é consultado.
+        memoized_tx = self.rpc_memo.get(("tx", tx_hash))
+        memoized_receipt = self.rpc_memo.get(("receipt", tx_hash))
+        if memoized_tx is not None and memoized_receipt is not None:
+            return memoized_tx, memoized_receipt, self.get_current_block_number()
+
+        results = self._execute_batch(
+            lambda: [
+                self.w3.eth.get_transaction(tx_hash),
+                self.w3.eth.get_transaction_receipt(tx_hash),
+                self.w3.eth.get_block_number(),
+            ]
+        )
+        if results is None:
+            # Se a transação ou o recibo não existirem, o lote inteiro falha; as consultas
+            # são refeitas individualmente para que cada uma trate a ausência isoladamente.
+            return self._get_transaction_bundle_concurrently(tx_hash)
+        tx, receipt, block_number = results
+        return (
+            self._memoize_transaction(tx_hash, self._serialize_transaction(tx)),
+            self._memoize_receipt(tx_hash, self._serialize_receipt(receipt)),
+            block_number,
+        )
+
+    def _get_transaction_bundle_concurrently(self, tx_hash: str) -> Tuple[Dict, Dict, int]:
+        """Executa as consultas de `get_transaction_bundle` em paralelo, uma requisição por consulta."""
+        details = self._rpc_executor.submit(self.get_transaction_details, tx_hash)
+        receipt = self._rpc_executor.submit(self.get_transaction_receipt, tx_hash)
+        block_number = self._rpc_executor.submit(self.get_current_block_number)
+        return details.result(), receipt.result(), block_number.result()
+
     def decode_erc20_transfer_log(self, log: Dict) -> Optional[TransferDetail]:
         """Decodifica um log de evento `Transfer` de um token ERC-20.
 
+        O log é decodificado diretamente a partir dos tópicos e dos dados, sem passar pelo
+        codec de ABI: o destinatário é o tópico indexado `topics[2]` e o valor é o `uint256`
+        armazenado em `data`.
+
         Args:
             log (Dict): O dicionário de log da transação.
 
@@ -197,31 +438,57 @@ class Web3BlockchainService(IBlockchainService):
             Optional[TransferDetail]: Um objeto TransferDetail se o log for um evento de transferência ERC-20,
                                       caso contrário, None.
         """
-        TRANSFER_EVENT_TOPIC = self.w3.keccak(text='Transfer(address,address,uint256)').hex()
+        topics = log.get("topics")
+        if not _is_transfer_event(topics):
+            return None
+        try:
+            # O `to` address está no topic[2] (indexado), nos 20 últimos bytes
+            to_topic = topics[2]
+            to_address_hex = to_topic[-20:].hex() if isinstance(to_topic, bytes) else to_topic[-40:]
+            to_address_erc20 = Web3.to_checksum_address("0x" + to_address_hex)
+            # O valor está nos dados do log (não indexado)
+            data = log.get("data")
+            data = data if isinstance(data, bytes) else HexBytes(data)
+            if len(data) != TRANSFER_EVENT_DATA_SIZE:
+                raise ValueError(f"o valor deve ter {TRANSFER_EVENT_DATA_SIZE} bytes, mas tem {len(data)}")
+            value_erc20_raw = int.from_bytes(data, "big")
+
+            # Placeholder para o símbolo do token.
+            # Em um cenário real, essa informação seria obtida consultando o contrato do token.
+            token_symbol = "ERC-20 Token"
+
+            # O valor é mantido em unidades base do token (inteiro exato), assim como o
+            # valor em wei das transferências de ETH; a conversão com os decimais do token
+            # fica a cargo de quem exibe o valor.
+            return TransferDetail(
+                asset=token_symbol,
+                to_address=to_address_erc20,
+                value=value_erc20_raw
+            )
+        except (IndexError, ValueError, TypeError) as e:
+            # Apenas logs malformados (tópicos ou dados ausentes ou inválidos) são ignorados.
+            logger.warning("Erro ao decodificar log ERC-20: %s", e)
+            return None
 
-        if log.get("topics") and log["topics"][0] == TRANSFER_EVENT_TOPIC:
-            try:
-                # O `to` address está no topic[2] (indexado)
-                to_address_erc20 = self.w3.to_checksum_address("0x" + log["topics"][2][-40:])
-                # O valor está nos dados do log (não indexado)
-                value_erc20_raw = int(log["data"], 16)
-
-                # Placeholder para o símbolo do token e decimais.
-                # Em um cenário real, essas informações seriam obtidas consultando o contrato do token.
-                token_symbol = "ERC-20 Token"
-                token_decimals = 18  # Assumindo 18 decimais como padrão para muitos tokens
-
-                value_erc20_readable = value_erc20_raw / (10**token_decimals)
-
-                return TransferDetail(
-                    asset=token_symbol,
-                    to_address=to_address_erc20,
-                    value=str(value_erc20_readable)
-                )
-            except Exception as e:
-                print(f"Erro ao decodificar log ERC-20: {e}")
-                return None
-        return None
+    def decode_erc20_transfer_logs(self, logs: List[Dict]) -> List[TransferDetail]:
+        """Decodifica, em lote, os eventos `Transfer` ERC-20 de uma lista de logs.
+
+        Os logs de outros eventos são descartados por uma única comparação do primeiro tópico,
+        antes de qualquer decodificação.
+
+        Args:
+            logs (List[Dict]): Os logs do recibo da transação.
+
+        Returns:
+            List[TransferDetail]: As transferências ERC-20 decodificadas, na ordem dos logs.
+        """
+        transfers = []
+        for log in logs:
+            if _is_transfer_event(log.get("topics")):
+                decoded_log = self.decode_erc20_transfer_log(log)
+                if decoded_log:
+                    transfers.append(decoded_log)
+        return transfers
 
     def create_and_sign_transaction(
         self, from_address: str, to_address: str, asset: str, value: str, private_key: str
@@ -240,56 +507,318 @@ class Web3BlockchainService(IBlockchainService):
         Returns:
             tuple[str, Dict]: Uma tupla contendo o hash da transação bruta assinada (hex) e os detalhes da transação.
         """
-        # Converte o valor para o formato correto (Wei para ETH, ou com base nos decimais do token)
-        if asset == "ETH":
-            value_in_wei = self.w3.to_wei(float(value), "ether")
-        else:
-            token_decimals = 18
-            value_in_wei = int(float(value) * (10**token_decimals))
+        outcome = self._create_and_sign_many([(from_address, to_address, asset, value, private_key)])[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def create_and_sign_transactions(
+        self, transfers: List[Tuple[str, str, str, str, str]]
+    ) -> List[Dict]:
+        """Cria e assina várias transações (ETH ou ERC-20) de uma só vez.
+
+        As consultas necessárias para todas as transações (o nonce pendente de cada remetente,
+        as estimativas de gás, o preço do gás e o chain ID) são feitas em conjunto, em lotes
+        JSON-RPC, e as transações de um mesmo remetente recebem nonces consecutivos.
+        As transações são assinadas localmente, na ordem recebida. Uma transação que não pode
+        ser montada ou assinada (ex: a estimativa de gás de uma transferência ERC-20 sem saldo
+        é revertida) não interrompe as demais e não reserva um nonce.
 
-        sender_account: LocalAccount = Account.from_key(private_key)
+        Args:
+            transfers (List[Tuple[str, str, str, str, str]]): As transferências, cada uma com
+                endereço de origem, endereço de destino, ativo, valor decimal e chave privada.
 
-        gas_price = self.w3.eth.gas_price
-        gas_price_with_margin = int(gas_price * 1.20)
+        Returns:
+            List[Dict]: Para cada transferência, na mesma ordem, `{"raw_tx": ..., "transaction": ...}`
+                        com a transação bruta assinada e seus detalhes, ou `{"error": ...}` com a
+                        mensagem de erro.
+        """
+        return [
+            # As exceções do Web3 guardam a mensagem do nó em `message`; `str` incluiria os dados brutos.
+            {"error": getattr(outcome, "message", None) or str(outcome)} if isinstance(outcome, Exception)
+            else {"raw_tx": outcome[0], "transaction": outcome[1]}
+            for outcome in self._create_and_sign_many(transfers)
+        ]
+
+    def _create_and_sign_many(
+        self, transfers: List[Tuple[str, str, str, str, str]]
+    ) -> List[Union[Tuple[bytes, Dict], Exception]]:
+        """Cria e assina as transações, devolvendo a exceção no lugar das que falharam."""
+        outcomes: List[Union[Tuple[bytes, Dict], Exception]] = [None] * len(transfers)
+        built: List[Tuple[int, Dict]] = []
+        for index, transfer in enumerate(transfers):
+            try:
+                built.append((index, self._build_transaction(*transfer)))
+            except SIGNING_ERRORS as e:
+                outcomes[index] = e
+
+        signing_parameters = self._get_signing_parameters_many([transaction for _, transaction in built])
+        for (index, transaction), parameters in zip(built, signing_parameters):
+            if isinstance(parameters, Exception):
+                outcomes[index] = parameters
+                continue
+            gas_price, pending_nonce, chain_id, gas_limit = parameters
+            # O nonce é reservado apenas no momento da assinatura, para que transações que
+            # falharam antes não deixem uma lacuna na sequência do remetente.
+            transaction["nonce"] = self._reserve_nonce(transaction["from"], pending_nonce)
+            transaction["gasPrice"] = int(gas_price * 1.20)
+            transaction["chainId"] = chain_id
+            transaction["gas"] = gas_limit
+            try:
+                signed_transaction = self.w3.eth.account.sign_transaction(transaction, transfers[index][4])
+            except SIGNING_ERRORS as e:
+                self._release_nonce(transaction["from"], transaction["nonce"])
+                outcomes[index] = e
+                continue
+            self.rpc_memo.set(("nonce_reservation", bytes(signed_transaction.raw_transaction)), transaction["from"])
+            outcomes[index] = (signed_transaction.raw_transaction, transaction)
+        return outcomes
+
+    def _build_transaction(self, from_address: str, to_address: str, asset: str, value: str, private_key: str) -> Dict:
+        """Monta os campos de uma transação que não dependem do nó (origem, destino, valor e dados)."""
+        # Converte o valor para unidades base (wei para ETH, ou com base nos decimais do token),
+        # com aritmética exata em vez de `float`.
+        value_in_wei = to_base_units(value, ETHER_DECIMALS)
 
-        transaction = {
-            "from": sender_account.address,
-            "nonce": self.w3.eth.get_transaction_count(sender_account.address),
-            "gasPrice": gas_price_with_margin,
-            "chainId": self.w3.eth.chain_id,
-        }
+        sender_account: LocalAccount = Account.from_key(private_key)
 
+        transaction = {"from": sender_account.address}
         if asset == "ETH":
             transaction["to"] = to_address
             transaction["value"] = value_in_wei
-            gas_limit = self.w3.eth.estimate_gas(transaction)
-            transaction["gas"] = gas_limit
+            # Uma transferência de ETH sem dados sempre consome o custo intrínseco; não é
+            # preciso simulá-la no nó.
+            transaction["gas"] = ETH_TRANSFER_GAS
         else:
-            token_contract = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(asset), abi=json.loads(ERC20_ABI)
-            )
-            transfer_function = token_contract.functions.transfer(
+            token_address = self.w3.to_checksum_address(asset)
+            transfer_function = self._get_erc20_contract(token_address).functions.transfer(
                 self.w3.to_checksum_address(to_address), value_in_wei
             )
-            transaction["to"] = self.w3.to_checksum_address(asset)
+            transaction["to"] = token_address
             transaction["data"] = transfer_function._encode_transaction_data()
-            gas_limit = self.w3.eth.estimate_gas(transaction)
-            transaction["gas"] = gas_limit
             transaction["value"] = 0
+            if self.erc20_gas_limit is not None:
+                transaction["gas"] = self.erc20_gas_limit
+        return transaction
+
+    def _get_erc20_contract(self, token_address: str) -> Contract:
+        """Retorna o contrato ERC-20 do token, construindo-o apenas no primeiro uso.
+
+        A construção do contrato processa o ABI e monta as funções e eventos; como o ABI
+        é o mesmo para todos os tokens, o objeto é reaproveitado nas transferências seguintes.
+        """
+        contract = self._erc20_contracts.get(token_address)
+        if contract is None:
+            contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI_JSON)
+            self._erc20_contracts[token_address] = contract
+        return contract
+
+    def _get_signing_parameters_many(
+        self, transactions: List[Dict]
+    ) -> List[Union[Tuple[int, int, int, int], Exception]]:
+        """Obtém o preço do gás, o nonce, o chain ID e a estimativa de gás de várias transações.
+
+        O chain ID é consultado uma única vez por processo e o preço do gás é reaproveitado
+        por `RpcMemo` durante alguns segundos (a margem de 20% aplicada sobre ele cobre essa
+        defasagem). O nonce pendente é consultado uma vez por remetente, e não por transação.
+        As consultas restantes são independentes entre si e são enviadas ao nó em lotes
+        JSON-RPC de até `RPC_BATCH_MAX_SIZE` chamadas; se o lote não puder ser usado, são
+        executadas em paralelo. Uma estimativa de gás que falha (ex: transferência revertida)
+        afeta apenas a sua transação; falhas nas demais consultas são propagadas.
 
-        signed_transaction = self.w3.eth.account.sign_transaction(transaction, private_key)
-        return signed_transaction.raw_transaction, transaction # Retorna o raw_tx_hex e os detalhes da transação
+        Args:
+            transactions (List[Dict]): As transações, com `from`, `to`, `value` e, se houver, `data`.
+                Transações que já têm o limite de gás (`gas`) não têm a estimativa consultada.
+
+        Returns:
+            List[Union[Tuple[int, int, int, int], Exception]]: Para cada transação, na mesma ordem,
+                o preço do gás, o nonce pendente informado pelo nó, o chain ID e o limite de gás,
+                ou a exceção da estimativa de gás que falhou. O nonce ainda não está reservado
+                (ver `_reserve_nonce`).
+        """
+        gas_price = self.rpc_memo.get(("gas_price",))
+        chain_id = self._chain_id
+
+        # `gas_price` e `chain_id` são propriedades que executam a chamada imediatamente; no lote
+        # são usados os métodos RPC que as implementam (`_gas_price` e `_chain_id`).
+        calls: Dict[Tuple, Callable[[], Any]] = {}
+        for sender in dict.fromkeys(transaction["from"] for transaction in transactions):
+            # O nonce considera as transações ainda pendentes no nó, não apenas as já mineradas.
+            calls[("nonce", sender)] = lambda sender=sender: self.w3.eth.get_transaction_count(sender, "pending")
+        for index, transaction in enumerate(transactions):
+            if "gas" not in transaction:
+                calls[("gas_limit", index)] = lambda transaction=transaction: self.w3.eth.estimate_gas(transaction)
+        if gas_price is None:
+            calls[("gas_price",)] = lambda: self.w3.eth._gas_price()
+        if chain_id is None:
+            calls[("chain_id",)] = lambda: self.w3.eth._chain_id()
+
+        keys = list(calls)
+        fetched: Dict[Tuple, Any] = {}
+        for start in range(0, len(keys), RPC_BATCH_MAX_SIZE):
+            chunk = [calls[key] for key in keys[start:start + RPC_BATCH_MAX_SIZE]]
+            results = self._execute_batch(lambda: [call() for call in chunk])
+            if results is None:
+                # Cada consulta é feita isoladamente, guardando a exceção das que falharem.
+                futures = [self._rpc_executor.submit(call) for call in chunk]
+                results = [future.exception() or future.result() for future in futures]
+            fetched.update(zip(keys[start:start + RPC_BATCH_MAX_SIZE], results))
+        for key, result in fetched.items():
+            if isinstance(result, Exception) and key[0] != "gas_limit":
+                raise result
+
+        if gas_price is None:
+            gas_price = fetched[("gas_price",)]
+            self.rpc_memo.set(("gas_price",), gas_price)
+        if chain_id is None:
+            chain_id = self._chain_id = fetched[("chain_id",)]
+        signing_parameters: List[Union[Tuple[int, int, int, int], Exception]] = []
+        for index, transaction in enumerate(transactions):
+            gas_limit = fetched.get(("gas_limit", index), transaction.get("gas"))
+            if isinstance(gas_limit, Exception):
+                signing_parameters.append(gas_limit)
+            else:
+                signing_parameters.append((gas_price, fetched[("nonce", transaction["from"])], chain_id, gas_limit))
+        return signing_parameters
+
+    def _reserve_nonce(self, address: str, pending_nonce: int) -> int:
+        """Reserva o próximo nonce de um endereço, considerando as transações assinadas localmente.
+
+        Transações assinadas em sequência (ex: para envio em lote) ainda não chegaram ao nó quando
+        a próxima é assinada, e receberiam o mesmo nonce. O próximo nonce local é mantido em
+        `RpcMemo` por alguns segundos, o suficiente para que o nó passe a contar as transações
+        enviadas; depois disso, prevalece novamente o valor informado pelo nó.
+
+        Args:
+            address (str): O endereço de origem.
+            pending_nonce (int): O nonce informado pelo nó, incluindo as transações pendentes.
+
+        Returns:
+            int: O nonce a ser usado na transação.
+        """
+        with self._nonce_lock:
+            local_nonce = self.rpc_memo.get(("nonce", address))
+            nonce = pending_nonce if local_nonce is None else max(pending_nonce, local_nonce)
+            self.rpc_memo.set(("nonce", address), nonce + 1)
+            return nonce
+
+    def _release_nonce(self, address: str, nonce: Optional[int] = None) -> None:
+        """Libera o nonce reservado para uma transação que não foi assinada ou não foi aceita.
+
+        O nonce reservado ficaria sem uso, e as transações seguintes do mesmo endereço ficariam
+        retidas no nó à espera dele. Se ele ainda for o último reservado (`nonce`), a reserva é
+        simplesmente desfeita; caso contrário, o próximo nonce local é descartado e volta a
+        prevalecer o valor informado pelo nó, que preenche essa lacuna.
+        """
+        with self._nonce_lock:
+            if nonce is not None and self.rpc_memo.get(("nonce", address)) == nonce + 1:
+                self.rpc_memo.set(("nonce", address), nonce)
+            else:
+                self.rpc_memo.delete(("nonce", address))
+
+    def _release_rejected_nonce(self, raw_tx: str) -> None:
+        """Libera o nonce reservado para uma transação assinada por este serviço e rejeitada pelo nó."""
+        sender = self.rpc_memo.get(("nonce_reservation", bytes(HexBytes(raw_tx))))
+        if sender is not None:
+            self._release_nonce(sender)
 
     def send_raw_transaction(self, raw_tx: str) -> str:
         """Envia uma transação bruta assinada para a rede Ethereum.
 
+        Se o nó rejeitar a transação, o nonce reservado para ela é liberado (ver `_release_nonce`).
+
         Args:
             raw_tx (str): A transação bruta assinada em formato hexadecimal.
 
         Returns:
             str: O hash da transação enviada.
         """
-        tx_hash = self.w3.eth.send_raw_transaction(raw_tx).hex()
+        try:
+            tx_hash = self.w3.eth.send_raw_transaction(raw_tx).to_0x_hex()
+        except Exception:
+            self._release_rejected_nonce(raw_tx)
+            raise
         return tx_hash
 
+    def send_raw_transactions(self, raw_txs: List[str]) -> List[Dict]:
+        """Envia várias transações brutas assinadas para a rede Ethereum.
 
+        As transações são enviadas em lotes JSON-RPC de até `RPC_BATCH_MAX_SIZE` chamadas, com
+        uma viagem de ida e volta ao nó por lote. Diferente das consultas, um envio não pode ser
+        refeito sem risco, por isso as respostas do lote são lidas uma a uma: a falha de uma
+        transação não afeta as demais. Sem suporte a lotes, as transações são enviadas em
+        sequência, na ordem recebida (preservando a ordem dos nonces).
+
+        Args:
+            raw_txs (List[str]): As transações brutas assinadas.
+
+        Returns:
+            List[Dict]: Para cada transação, na mesma ordem, `{"tx_hash": ...}` se foi aceita
+                        pelo nó ou `{"error": ...}` com a mensagem de erro. Se a comunicação com o
+                        nó falhar, as transações ainda não enviadas recebem um erro, sem que a
+                        falha seja propagada. Os nonces reservados para as transações com erro
+                        são liberados.
+        """
+        results: List[Dict] = []
+        for start in range(0, len(raw_txs), RPC_BATCH_MAX_SIZE):
+            chunk = raw_txs[start:start + RPC_BATCH_MAX_SIZE]
+            responses = self._send_raw_transactions_batch(chunk)
+            if responses is None:
+                responses = self._send_raw_transactions_sequentially(chunk)
+            results.extend(responses)
+            if len(responses) < len(chunk):
+                # A comunicação com o nó falhou: as transações restantes não são enviadas, e as
+                # já aceitas continuam nos resultados para serem registradas por quem chamou.
+                break
+        results.extend({"error": UNSENT_TRANSACTION_ERROR} for _ in range(len(raw_txs) - len(results)))
+        # Cada nonce é liberado uma única vez, aqui, para todas as transações com erro.
+        for raw_tx, result in zip(raw_txs, results):
+            if "error" in result:
+                self._release_rejected_nonce(raw_tx)
+        return results
+
+    def _send_raw_transactions_batch(self, raw_txs: List[str]) -> Optional[List[Dict]]:
+        """Envia as transações em um único lote, ou retorna None se o lote não puder ser usado.
+
+        Se a comunicação com o nó falhar, retorna uma lista vazia: não é possível saber quais
+        transações do lote foram aceitas.
+        """
+        if not self._batch_supported:
+            return None
+        try:
+            # O lote é enviado diretamente pelo provedor, que devolve as respostas sem lançar
+            # exceções para os itens com erro.
+            responses = self.w3.provider.make_batch_request(
+                [("eth_sendRawTransaction", [HexBytes(raw_tx).to_0x_hex()]) for raw_tx in raw_txs]
+            )
+        except NotImplementedError:
+            self._batch_supported = False
+            return None
+        except requests.exceptions.RequestException:
+            logger.warning("Falha de comunicação com o nó ao enviar um lote de transações.", exc_info=True)
+            return []
+        if not isinstance(responses, list):
+            # O nó rejeitou o lote inteiro (uma única resposta de erro); nenhuma transação foi aceita.
+            return None
+        return [
+            {"tx_hash": response["result"]} if "result" in response
+            else {"error": (response.get("error") or {}).get("message", "Erro desconhecido.")}
+            for response in responses
+        ]
+
+    def _send_raw_transactions_sequentially(self, raw_txs: List[str]) -> List[Dict]:
+        """Envia as transações uma a uma, parando na primeira falha de comunicação com o nó.
+
+        Returns:
+            List[Dict]: Os resultados das transações processadas até a falha, se houver.
+        """
+        responses: List[Dict] = []
+        for raw_tx in raw_txs:
+            try:
+                responses.append({"tx_hash": self.w3.eth.send_raw_transaction(raw_tx).to_0x_hex()})
+            except Web3RPCError as e:
+                responses.append({"error": str(e)})
+            except requests.exceptions.RequestException:
+                logger.warning("Falha de comunicação com o nó ao enviar uma transação.", exc_info=True)
+                break
+        return responses
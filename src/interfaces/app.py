@@ -4,18 +4,25 @@ import os
 
 from src.infrastructure.config import Config
 from src.infrastructure.database.models import db
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 from src.infrastructure.repositories.sqlalchemy_address_repository import SQLAlchemyAddressRepository
+from src.infrastructure.repositories.cached_address_repository import CachedAddressRepository
 from src.infrastructure.repositories.sqlalchemy_validated_transaction_repository import SQLAlchemyValidatedTransactionRepository
 from src.infrastructure.repositories.sqlalchemy_created_transaction_repository import SQLAlchemyCreatedTransactionRepository
 from src.infrastructure.services.web3_blockchain_service import Web3BlockchainService
+from src.infrastructure.cache.rpc_memo import RpcMemo
 
 from src.application.use_cases.generate_addresses import GenerateAddressesUseCase
 from src.application.use_cases.validate_transaction import ValidateTransactionUseCase
 from src.application.use_cases.create_transaction import CreateTransactionUseCase, UpdateTransactionStatusUseCase
 
+from src.interfaces.background import BackgroundTaskRunner
+from src.interfaces.json_provider import OrjsonJSONProvider
+from src.interfaces.warmup import warm_up
 from src.interfaces.controllers.address_controller import initialize_address_controller
 from src.interfaces.controllers.transaction_validation_controller import initialize_transaction_validation_controller
 from src.interfaces.controllers.transaction_creation_controller import initialize_transaction_creation_controller
+from src.interfaces.controllers.health_controller import initialize_health_controller
 
 # Esta é a camada de Interfaces (a mais externa na Clean Architecture).
 # O arquivo `app.py` atua como o ponto de entrada da aplicação Flask e é responsável
@@ -27,6 +34,11 @@ def create_app():
     """Cria e configura a aplicação Flask, injetando as dependências."""
     app = Flask(__name__)
     app.config.from_object(Config)
+    # As respostas JSON são serializadas com `orjson`, incluindo os tipos do Web3.py (ex: `HexBytes`).
+    app.json = OrjsonJSONProvider(app)
+    # As chaves são mantidas na ordem em que os controladores montam as respostas; ordená-las
+    # a cada serialização não traz benefício aos clientes (objetos JSON não são ordenados).
+    app.json.sort_keys = False
 
     # Inicializa o banco de dados
     # A configuração do DB é delegada à classe Config, mantendo a responsabilidade única.
@@ -36,24 +48,37 @@ def create_app():
     # A instância do serviço de blockchain é criada aqui e injetada nos casos de uso.
     # Isso garante que os casos de uso não dependam diretamente da implementação do Web3.py,
     # mas sim da interface IBlockchainService, aderindo ao DIP.
-    web3_service = Web3BlockchainService(Config.WEB3_PROVIDER_URL)
+    # A memória de respostas RPC é compartilhada pelos casos de uso: um recibo obtido na
+    # validação é reaproveitado por alguns segundos, por exemplo, na atualização de status.
+    web3_service = Web3BlockchainService(Config.get_web3_instance(), RpcMemo(), Config.ERC20_GAS_LIMIT)
 
     # Inicializa os repositórios
     # As implementações concretas dos repositórios são criadas aqui.
     # Elas implementam as interfaces definidas na camada de aplicação, permitindo a substituição
     # por outras implementações (ex: MongoDB, PostgreSQL) sem afetar as camadas internas (LSP).
-    address_repository = SQLAlchemyAddressRepository()
+    # O repositório de endereços é decorado com um cache em memória, evitando uma consulta
+    # ao banco de dados a cada transação enviada a partir de um mesmo endereço (OCP).
+    address_repository = CachedAddressRepository(SQLAlchemyAddressRepository())
     validated_tx_repository = SQLAlchemyValidatedTransactionRepository()
     created_tx_repository = SQLAlchemyCreatedTransactionRepository()
 
+    # Inicializa a unidade de trabalho
+    # Os repositórios não confirmam as alterações; cada caso de uso delimita sua própria
+    # transação através da unidade de trabalho, com um único commit por operação.
+    unit_of_work = SQLAlchemyUnitOfWork()
+
     # Inicializa os casos de uso
     # Os casos de uso recebem suas dependências (repositórios e serviços) via injeção.
     # Isso reforça o DIP e o SRP, pois os casos de uso se concentram apenas na lógica de negócio,
     # sem se preocupar com a criação ou gerenciamento de suas dependências.
-    generate_addresses_use_case = GenerateAddressesUseCase(address_repository, web3_service)
-    validate_transaction_use_case = ValidateTransactionUseCase(validated_tx_repository, address_repository, web3_service)
-    create_transaction_use_case = CreateTransactionUseCase(created_tx_repository, address_repository, web3_service)
-    update_transaction_status_use_case = UpdateTransactionStatusUseCase(created_tx_repository, web3_service)
+    generate_addresses_use_case = GenerateAddressesUseCase(address_repository, web3_service, unit_of_work)
+    validate_transaction_use_case = ValidateTransactionUseCase(validated_tx_repository, address_repository, web3_service, unit_of_work)
+    create_transaction_use_case = CreateTransactionUseCase(created_tx_repository, address_repository, web3_service, unit_of_work)
+    update_transaction_status_use_case = UpdateTransactionStatusUseCase(created_tx_repository, web3_service, unit_of_work)
+
+    # Inicializa o executor de tarefas em segundo plano
+    # Usado pelos endpoints que aceitam processamento assíncrono (`Prefer: respond-async`).
+    background_tasks = BackgroundTaskRunner(app, Config.BACKGROUND_TASK_WORKERS)
 
     # Inicializa e registra os Blueprints dos controladores
     # Os controladores são inicializados com os casos de uso e repositórios necessários.
@@ -61,16 +86,23 @@ def create_app():
     # Isso mantém os controladores independentes da lógica de negócio, aderindo ao SRP.
     app.register_blueprint(initialize_address_controller(generate_addresses_use_case, address_repository))
     app.register_blueprint(initialize_transaction_validation_controller(validate_transaction_use_case, validated_tx_repository))
-    app.register_blueprint(initialize_transaction_creation_controller(create_transaction_use_case, update_transaction_status_use_case, created_tx_repository))
+    app.register_blueprint(initialize_transaction_creation_controller(create_transaction_use_case, update_transaction_status_use_case, created_tx_repository, background_tasks))
+    app.register_blueprint(initialize_health_controller(web3_service))
+
+    # Aquece a aplicação antes de ela receber a primeira requisição
+    # As consultas são compiladas e os caminhos mais usados executados uma vez, sem chamadas RPC.
+    if Config.WARMUP_ON_STARTUP:
+        warm_up(app, create_transaction_use_case, address_repository, created_tx_repository, validated_tx_repository)
 
     return app
 
 if __name__ == '__main__':
-    # Ponto de entrada da aplicação Flask.
-    # `debug=True` é útil para desenvolvimento, mas deve ser `False` em produção.
+    # Ponto de entrada da aplicação Flask com o servidor de desenvolvimento do Werkzeug.
+    # Em produção, a aplicação deve ser executada com o Gunicorn (ver `gunicorn.conf.py`).
+    # O modo de depuração é ativado apenas com a variável de ambiente `FLASK_DEBUG=1`.
     # `host='0.0.0.0'` permite que a aplicação seja acessível externamente (necessário no ambiente sandbox).
     # `port=5000` define a porta em que a API estará escutando.
     app = create_app()
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=os.getenv("FLASK_DEBUG") == "1", host='0.0.0.0', port=5000, threaded=True)
 
 
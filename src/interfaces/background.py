@@ -0,0 +1,57 @@
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Set
+from flask import Flask
+
+# Execução de tarefas em segundo plano, fora do ciclo da requisição HTTP. Endpoints que
+# aceitam processamento assíncrono (cabeçalho `Prefer: respond-async`) agendam o trabalho
+# aqui e respondem imediatamente com `202 Accepted`, sem ocupar a thread do servidor WSGI
+# enquanto aguardam o nó Ethereum.
+
+logger = logging.getLogger(__name__)
+
+class BackgroundTaskRunner:
+    """Executa tarefas em um pool de threads do próprio processo.
+
+    Cada tarefa roda dentro de um contexto da aplicação Flask, com sua própria sessão do banco
+    de dados. As tarefas são identificadas por uma chave: enquanto uma tarefa estiver pendente,
+    outra com a mesma chave não é agendada novamente. As tarefas ficam apenas em memória; se o
+    processo terminar, as pendentes são descartadas e podem ser solicitadas outra vez.
+    """
+
+    def __init__(self, app: Flask, max_workers: int):
+        self._app = app
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="background-task")
+        self._pending: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> bool:
+        """Agenda a execução de `fn(*args)` em segundo plano.
+
+        Args:
+            key (Hashable): Identificador da tarefa, usado para evitar agendamentos duplicados.
+            fn (Callable[..., Any]): A função a ser executada.
+            *args (Any): Os argumentos da função.
+
+        Returns:
+            bool: True se a tarefa foi agendada, ou False se uma tarefa com a mesma chave já estava pendente.
+        """
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        self._executor.submit(self._run, key, fn, *args)
+        return True
+
+    def _run(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> None:
+        """Executa a tarefa no contexto da aplicação, registrando eventuais falhas no log."""
+        try:
+            with self._app.app_context():
+                fn(*args)
+        except Exception:
+            logger.exception("Falha na tarefa em segundo plano %s.", key)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
@@ -1,5 +1,9 @@
 
 from flask import Blueprint, request, jsonify
+from flask.views import MethodView
+from src.interfaces.controllers.error_handlers import register_error_handlers
+from src.interfaces.controllers.json_stream import stream_json_array
+from src.interfaces.schemas import GenerateAddressesRequest, parse_request
 from src.application.use_cases.generate_addresses import GenerateAddressesUseCase
 from src.application.interfaces import IAddressRepository
 
@@ -8,64 +12,64 @@ from src.application.interfaces import IAddressRepository
 # esperado pelos casos de uso, chamar os casos de uso apropriados e formatar a resposta HTTP.
 # Os controladores não contêm lógica de negócio e dependem apenas dos casos de uso e das entidades de domínio.
 # Isso adere ao Princípio da Responsabilidade Única (SRP) e ao Princípio da Inversão de Dependência (D de SOLID).
+# Cada recurso é uma `MethodView` que recebe suas dependências no construtor; a instância é criada
+# uma única vez (`init_every_request = False`) e compartilhada por todas as requisições.
 
-# Cria um Blueprint para os endpoints de endereço
-address_bp = Blueprint("address", __name__)
+class AddressesView(MethodView):
+    """Endpoints de `/addresses`: geração (POST) e listagem (GET) de endereços."""
 
-def initialize_address_controller(generate_addresses_use_case: GenerateAddressesUseCase, address_repository: IAddressRepository):
-    """Inicializa o controlador de endereços com as dependências necessárias.
+    init_every_request = False
 
-    Esta função recebe as instâncias dos casos de uso e repositórios necessários
-    através de injeção de dependência, garantindo que o controlador não crie suas
-    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
-    """
+    def __init__(self, generate_addresses_use_case: GenerateAddressesUseCase, address_repository: IAddressRepository):
+        self.generate_addresses_use_case = generate_addresses_use_case
+        self.address_repository = address_repository
 
-    @address_bp.route("/addresses", methods=["POST"])
-    def generate_addresses():
+    def post(self):
         """Endpoint para gerar um ou mais novos endereços Ethereum.
 
         Recebe o número de endereços a serem gerados, chama o caso de uso
         `GenerateAddressesUseCase` para executar a lógica de negócio e retorna
         a resposta formatada em JSON.
         """
-        data = request.get_json()
-        num_addresses = data.get("num_addresses", 1)
-
-        try:
-            generated_addresses = generate_addresses_use_case.execute(num_addresses)
-            return jsonify(
-                {
-                    "status": "success",
-                    "message": f"{len(generated_addresses)} endereços gerados e salvos.",
-                    "addresses": [addr.address for addr in generated_addresses]
-                }
-            ), 201
-        except ValueError as e:
-            # Captura erros de validação do caso de uso e retorna uma resposta de erro adequada.
-            return jsonify({"status": "error", "message": str(e)}), 400
-        except Exception as e:
-            # Captura quaisquer outras exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
+        body = parse_request(GenerateAddressesRequest)
+        generated_addresses = self.generate_addresses_use_case.execute(body.num_addresses)
+        return jsonify(
+            {
+                "status": "success",
+                "message": f"{len(generated_addresses)} endereços gerados e salvos.",
+                "addresses": [addr.address for addr in generated_addresses]
+            }
+        ), 201
 
-    @address_bp.route("/addresses", methods=["GET"])
-    def list_addresses():
+    def get(self):
         """Endpoint para consultar a lista de todos os endereços gerados e armazenados.
 
-        Recupera todos os endereços através do repositório e retorna a lista formatada em JSON.
+        Recupera os endereços através do repositório e retorna a lista formatada em JSON,
+        transmitida item a item. Aceita os parâmetros opcionais de paginação `limit` e `offset`.
         """
-        try:
-            addresses = address_repository.get_all()
-            address_list = [
-                {"id": addr.id, "address": addr.address, "created_at": addr.created_at}
-                for addr in addresses
-            ]
-            return jsonify(address_list), 200
-        except Exception as e:
-            # Captura quaisquer exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
-
-    return address_bp
-
+        limit = request.args.get("limit", type=int)
+        offset = request.args.get("offset", 0, type=int)
+        if (limit is not None and limit <= 0) or offset < 0:
+            raise ValueError("Parâmetros de paginação inválidos.")
 
+        addresses = self.address_repository.get_all(limit=limit, offset=offset)
+        return stream_json_array(
+            {"id": addr.id, "address": addr.address, "created_at": addr.created_at}
+            for addr in addresses
+        )
 
+def initialize_address_controller(generate_addresses_use_case: GenerateAddressesUseCase, address_repository: IAddressRepository):
+    """Inicializa o controlador de endereços com as dependências necessárias.
 
+    Esta função recebe as instâncias dos casos de uso e repositórios necessários
+    através de injeção de dependência, garantindo que o controlador não crie suas
+    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
+    Um novo Blueprint é criado a cada chamada, para que cada aplicação tenha as suas rotas.
+    """
+    # Erros de validação (`ValueError`) resultam em 400 e os demais em 500 (ver `error_handlers`).
+    address_bp = register_error_handlers(Blueprint("address", __name__))
+    address_bp.add_url_rule(
+        "/addresses",
+        view_func=AddressesView.as_view("addresses", generate_addresses_use_case, address_repository),
+    )
+    return address_bp
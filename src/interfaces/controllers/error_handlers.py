@@ -0,0 +1,35 @@
+
+import orjson
+from flask import Blueprint, Response
+from werkzeug.exceptions import HTTPException
+
+# Tratamento de erros compartilhado pelos controladores. Em vez de cada endpoint repetir os
+# blocos `except ValueError` / `except Exception`, os Blueprints registram estes tratadores
+# e os endpoints contêm apenas o caminho de sucesso.
+
+# Corpo das respostas de erro, no mesmo formato de `jsonify`. Apenas a mensagem é serializada
+# a cada erro; o restante do corpo é um modelo fixo, sem montar um dicionário por resposta.
+ERROR_BODY_TEMPLATE = b'{"status":"error","message":%b}\n'
+
+def error_response(message: str, status: int) -> Response:
+    """Cria uma resposta de erro JSON com a mensagem e o status informados."""
+    return Response(ERROR_BODY_TEMPLATE % orjson.dumps(message), status=status, mimetype="application/json")
+
+def handle_value_error(e: ValueError) -> Response:
+    """Converte erros de validação (dos schemas ou dos casos de uso) em uma resposta 400."""
+    return error_response(str(e), 400)
+
+def handle_unexpected_error(e: Exception):
+    """Converte quaisquer outras exceções inesperadas em um erro genérico 500.
+
+    Erros HTTP do próprio Flask (ex: 404, 405) são devolvidos sem alteração.
+    """
+    if isinstance(e, HTTPException):
+        return e
+    return error_response(f"Erro interno: {str(e)}", 500)
+
+def register_error_handlers(blueprint: Blueprint) -> Blueprint:
+    """Registra os tratadores de erro padrão da API no Blueprint informado."""
+    blueprint.register_error_handler(ValueError, handle_value_error)
+    blueprint.register_error_handler(Exception, handle_unexpected_error)
+    return blueprint
@@ -0,0 +1,46 @@
+
+import logging
+from flask import Blueprint, jsonify
+from flask.views import MethodView
+from src.interfaces.controllers.error_handlers import error_response
+from src.application.interfaces import IBlockchainService
+
+# Esta camada contém os controladores da API, que são a parte mais externa da Clean Architecture.
+# Este controlador expõe a verificação de disponibilidade da aplicação, usada por balanceadores
+# de carga e orquestradores. A conexão com o nó Ethereum é verificada aqui, sob demanda,
+# e não durante a inicialização da aplicação.
+
+logger = logging.getLogger(__name__)
+
+class HealthView(MethodView):
+    """Endpoint de `/health`: verificação de disponibilidade (GET)."""
+
+    init_every_request = False
+
+    def __init__(self, blockchain_service: IBlockchainService):
+        self.blockchain_service = blockchain_service
+
+    def get(self):
+        """Endpoint que informa se a aplicação consegue se comunicar com a rede Ethereum.
+
+        Consulta o número do bloco atual e o retorna; se o nó não responder, retorna 503.
+        """
+        try:
+            block_number = self.blockchain_service.get_current_block_number()
+            return jsonify({"status": "ok", "block_number": block_number}), 200
+        except Exception:
+            # Qualquer falha na comunicação com o nó torna a aplicação indisponível. O detalhe fica
+            # apenas no log: as mensagens do provedor costumam incluir a URL, com a chave de API,
+            # e este endpoint não exige autenticação.
+            logger.warning("Falha na verificação de disponibilidade do nó Ethereum.", exc_info=True)
+            return error_response("Não foi possível conectar à rede Ethereum.", 503)
+
+def initialize_health_controller(blockchain_service: IBlockchainService):
+    """Inicializa o controlador de disponibilidade com as dependências necessárias.
+
+    Esta função recebe o serviço de blockchain através de injeção de dependência,
+    garantindo que o controlador não crie suas próprias dependências.
+    """
+    health_bp = Blueprint("health", __name__)
+    health_bp.add_url_rule("/health", view_func=HealthView.as_view("health", blockchain_service))
+    return health_bp
@@ -0,0 +1,112 @@
+
+import zlib
+from itertools import islice
+from typing import Iterable, Iterator
+from flask import Response, current_app, request, stream_with_context
+
+# Utilitário compartilhado pelos controladores para respostas JSON grandes.
+# Em vez de montar a lista inteira em memória antes de serializá-la, os itens são
+# serializados e enviados ao cliente um a um, à medida que são lidos do repositório.
+
+# Tempo, em segundos, durante o qual o cliente pode reutilizar uma resposta de histórico
+# sem consultá-la novamente; depois disso, ela é revalidada pelo ETag.
+HISTORY_CACHE_MAX_AGE = 5
+
+# Quantidade de itens serializados agrupados em cada parte enviada ao servidor WSGI.
+# Cada bloco é serializado com uma única chamada ao provedor JSON (o laço sobre os itens
+# fica no código nativo do `orjson`) e enviado em uma única escrita no socket (um chunk HTTP).
+STREAM_CHUNK_ITEMS = 500
+
+# Nível de compressão gzip (1 a 9) das respostas transmitidas, para clientes que aceitam
+# `gzip` (`Accept-Encoding`). Os arrays JSON repetem os nomes dos campos e os endereços, e
+# comprimem várias vezes; um nível intermediário mantém o custo de CPU baixo por bloco.
+STREAM_GZIP_LEVEL = 4
+
+def _accepts_gzip() -> bool:
+    """Indica se o cliente da requisição atual aceita respostas comprimidas com gzip."""
+    return request.accept_encodings["gzip"] > 0
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Comprime as partes de uma resposta transmitida em um único fluxo gzip."""
+    compressor = zlib.compressobj(STREAM_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def stream_json_array(items: Iterable[dict]) -> Response:
+    """Cria uma resposta HTTP que transmite um array JSON item a item.
+
+    O primeiro item é lido imediatamente, para que erros de acesso ao banco de dados
+    ocorram ainda dentro do tratamento de exceções do controlador, antes do envio do status.
+    Os itens são serializados pelo provedor JSON da aplicação, com o mesmo formato de `jsonify`,
+    em blocos de `STREAM_CHUNK_ITEMS` itens. Se o cliente aceitar, o corpo é comprimido com gzip.
+
+    Args:
+        items (Iterable[dict]): Os itens do array, produzidos sob demanda.
+
+    Returns:
+        Response: A resposta com status 200 e corpo `application/json` transmitido em partes.
+    """
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        # O array vazio segue a mesma codificação das demais respostas, da qual depende o ETag.
+        if _accepts_gzip():
+            response = Response(b"".join(_gzip_chunks([b"[]"])), mimetype="application/json")
+            response.content_encoding = "gzip"
+        else:
+            response = Response(b"[]", mimetype="application/json")
+        response.vary.add("Accept-Encoding")
+        return response
+
+    # Provedores que serializam diretamente para bytes (ex: `OrjsonJSONProvider`) dispensam
+    # a conversão intermediária para texto.
+    provider = current_app.json
+    dumpb = getattr(provider, "dumpb", None) or (lambda obj: provider.dumps(obj).encode())
+
+    def generate():
+        # Cada bloco é serializado como um array JSON, do qual são removidos os colchetes.
+        chunk = [first, *islice(iterator, STREAM_CHUNK_ITEMS - 1)]
+        yield b"[" + dumpb(chunk)[1:-1]
+        while chunk := list(islice(iterator, STREAM_CHUNK_ITEMS)):
+            yield b"," + dumpb(chunk)[1:-1]
+        yield b"]"
+
+    # A compressão acontece bloco a bloco, sem acumular a resposta inteira em memória.
+    if _accepts_gzip():
+        response = Response(stream_with_context(_gzip_chunks(generate())), mimetype="application/json")
+        response.content_encoding = "gzip"
+    else:
+        response = Response(stream_with_context(generate()), mimetype="application/json")
+    response.vary.add("Accept-Encoding")
+    return response
+
+def stream_json_array_with_etag(version: str, items: Iterable[dict]) -> Response:
+    """Cria uma resposta como `stream_json_array`, validável pelo cliente através do ETag.
+
+    Se o cliente já tiver a versão atual (`If-None-Match`), retorna `304 Not Modified` sem
+    percorrer os itens; como os repositórios só consultam o banco de dados ao serem
+    percorridos, nem a consulta nem a serialização acontecem nesse caso.
+
+    Os corpos comprimido e não comprimido são representações diferentes, com bytes diferentes;
+    cada uma tem o seu ETag forte (o da versão comprimida termina em `-gzip`), para que caches
+    intermediários e requisições com `Range` não confundam uma com a outra.
+
+    Args:
+        version (str): A versão atual dos dados, usada como ETag.
+        items (Iterable[dict]): Os itens do array, produzidos sob demanda.
+
+    Returns:
+        Response: A resposta `304` vazia ou a resposta transmitida com o array JSON.
+    """
+    etag = f"{version}-gzip" if _accepts_gzip() else version
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.vary.add("Accept-Encoding")
+    else:
+        response = stream_json_array(items)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"private, max-age={HISTORY_CACHE_MAX_AGE}"
+    return response
@@ -1,5 +1,10 @@
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify, request
+from flask.views import MethodView
+from src.interfaces.background import BackgroundTaskRunner
+from src.interfaces.controllers.error_handlers import register_error_handlers
+from src.interfaces.controllers.json_stream import stream_json_array_with_etag
+from src.interfaces.schemas import CreateTransactionRequest, CreateTransactionsBatchRequest, TransactionHashesRequest, parse_request
 from src.application.use_cases.create_transaction import CreateTransactionUseCase, UpdateTransactionStatusUseCase
 from src.application.interfaces import ICreatedTransactionRepository
 
@@ -8,101 +13,181 @@ from src.application.interfaces import ICreatedTransactionRepository
 # esperado pelos casos de uso, chamar os casos de uso apropriados e formatar a resposta HTTP.
 # Os controladores não contêm lógica de negócio e dependem apenas dos casos de uso e das entidades de domínio.
 # Isso adere ao Princípio da Responsabilidade Única (SRP) e ao Princípio da Inversão de Dependência (D de SOLID).
+# Cada recurso é uma `MethodView` que recebe suas dependências no construtor; a instância é criada
+# uma única vez (`init_every_request = False`) e compartilhada por todas as requisições.
 
-# Cria um Blueprint para os endpoints de criação de transação
-transaction_creation_bp = Blueprint("transaction_creation", __name__)
+def _uint256_to_str(value):
+    """Converte um valor uint256 opcional para texto decimal."""
+    return None if value is None else str(value)
 
-def initialize_transaction_creation_controller(create_transaction_use_case: CreateTransactionUseCase, update_transaction_status_use_case: UpdateTransactionStatusUseCase, created_tx_repository: ICreatedTransactionRepository):
-    """Inicializa o controlador de criação de transações com as dependências necessárias.
+def _prefers_async() -> bool:
+    """Indica se o cliente pediu processamento assíncrono (`Prefer: respond-async`, RFC 7240)."""
+    preferences = request.headers.get("Prefer", "")
+    return any(
+        preference.split("=", 1)[0].strip().lower() == "respond-async"
+        for preference in preferences.split(",")
+    )
 
-    Esta função recebe as instâncias dos casos de uso e repositórios necessários
-    através de injeção de dependência, garantindo que o controlador não crie suas
-    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
-    """
+class TransactionsView(MethodView):
+    """Endpoints de `/transactions`: criação (POST), histórico (GET) e atualização em lote (PATCH)."""
+
+    init_every_request = False
+
+    def __init__(self, create_transaction_use_case: CreateTransactionUseCase, update_transaction_status_use_case: UpdateTransactionStatusUseCase, created_tx_repository: ICreatedTransactionRepository):
+        self.create_transaction_use_case = create_transaction_use_case
+        self.update_transaction_status_use_case = update_transaction_status_use_case
+        self.created_tx_repository = created_tx_repository
 
-    @transaction_creation_bp.route("/transactions", methods=["POST"])
-    def create_transaction():
+    def post(self):
         """Endpoint para gerar e enviar uma transação on-chain (ETH ou ERC-20).
 
         Recebe os detalhes da transação, chama o caso de uso `CreateTransactionUseCase`
         para executar a lógica de negócio e retorna a resposta formatada em JSON.
         """
-        data = request.get_json()
-        from_address = data.get("from_address")
-        to_address = data.get("to_address")
-        asset = data.get("asset")
-        value = data.get("value")
-
-        try:
-            new_tx = create_transaction_use_case.execute(from_address, to_address, asset, value)
-            return jsonify(
-                {
-                    "status": "success",
-                    "message": "Transação enviada com sucesso.",
-                    "tx_hash": new_tx.tx_hash
-                }
-            ), 200
-        except ValueError as e:
-            # Captura erros de validação do caso de uso e retorna uma resposta de erro adequada.
-            return jsonify({"status": "error", "message": str(e)}), 400
-        except Exception as e:
-            # Captura quaisquer outras exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
-
-    @transaction_creation_bp.route("/transactions", methods=["GET"])
-    def created_transactions_history():
+        body = parse_request(CreateTransactionRequest)
+        new_tx = self.create_transaction_use_case.execute(body.from_address, body.to_address, body.asset, body.value)
+        return jsonify(
+            {
+                "status": "success",
+                "message": "Transação enviada com sucesso.",
+                "tx_hash": new_tx.tx_hash
+            }
+        ), 200
+
+    def get(self):
         """Endpoint para consultar o histórico de transações que foram criadas pela aplicação.
 
-        Recupera o histórico de transações criadas através do repositório e retorna a lista formatada em JSON.
+        Recupera o histórico de transações criadas através do repositório e retorna a lista formatada em JSON,
+        transmitida item a item à medida que as linhas são lidas do banco de dados.
         """
-        try:
-            history = created_tx_repository.get_all()
-            history_list = [
-                {
-                    "id": tx.id,
-                    "tx_hash": tx.tx_hash,
-                    "from_address": tx.from_address,
-                    "to_address": tx.to_address,
-                    "asset": tx.asset,
-                    "value": tx.value,
-                    "status": tx.status,
-                    "gas_price_gwei": tx.gas_price_gwei,
-                    "gas_limit": tx.gas_limit,
-                    "effective_cost_wei": tx.effective_cost_wei,
-                    "created_at": tx.created_at,
-                }
-                for tx in history
-            ]
-            return jsonify(history_list), 200
-        except Exception as e:
-            # Captura quaisquer outras exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
-
-    @transaction_creation_bp.route("/transactions/<tx_hash>", methods=["PATCH"])
-    def update_transaction_status(tx_hash):
+        # O cliente que já tem a versão atual do histórico recebe `304 Not Modified`.
+        version = self.created_tx_repository.get_version()
+        # A projeção usa um literal de dicionário com acesso direto aos atributos: no CPython 3.11+,
+        # o acesso a atributos de `slots` é especializado e esta forma é cerca de duas vezes mais
+        # rápida que `dict(zip(campos, attrgetter(*campos)(tx)))`.
+        history = (
+            {
+                "id": tx.id,
+                "tx_hash": tx.tx_hash,
+                "from_address": tx.from_address,
+                "to_address": tx.to_address,
+                "asset": tx.asset,
+                "value": tx.value,
+                "status": tx.status,
+                # Valores uint256 são devolvidos como texto, preservando a precisão em clientes JSON.
+                "gas_price_gwei": _uint256_to_str(tx.gas_price_gwei),
+                "gas_limit": tx.gas_limit,
+                "effective_cost_wei": _uint256_to_str(tx.effective_cost_wei),
+                "created_at": tx.created_at,
+            }
+            for tx in self.created_tx_repository.get_all()
+        )
+        return stream_json_array_with_etag(version, history)
+
+    def patch(self):
+        """Endpoint para atualizar, de uma só vez, o status de várias transações criadas.
+
+        Recebe uma lista de hashes, chama `UpdateTransactionStatusUseCase.execute_many`
+        e retorna o status atual de cada transação encontrada.
+        """
+        tx_hashes = parse_request(TransactionHashesRequest).tx_hashes
+        updated_txs = self.update_transaction_status_use_case.execute_many(tx_hashes)
+        found_hashes = {tx.tx_hash for tx in updated_txs}
+        return jsonify(
+            {
+                "status": "success",
+                "message": f"{len(updated_txs)} transações verificadas.",
+                "transactions": [{"tx_hash": tx.tx_hash, "status": tx.status} for tx in updated_txs],
+                "not_found": [tx_hash for tx_hash in dict.fromkeys(tx_hashes) if tx_hash not in found_hashes],
+            }
+        ), 200
+
+class TransactionsBatchView(MethodView):
+    """Endpoint de `/transactions:batch`: criação de várias transações (POST)."""
+
+    init_every_request = False
+
+    def __init__(self, create_transaction_use_case: CreateTransactionUseCase):
+        self.create_transaction_use_case = create_transaction_use_case
+
+    def post(self):
+        """Endpoint para gerar e enviar várias transações on-chain de uma só vez.
+
+        Recebe a lista de transações, chama `CreateTransactionUseCase.execute_many` e retorna
+        o resultado de cada uma, na ordem recebida. O nonce e o preço do gás são consultados
+        uma única vez para todo o lote.
+        """
+        txs = parse_request(CreateTransactionsBatchRequest).txs
+        results = self.create_transaction_use_case.execute_many(
+            [tx.model_dump() for tx in txs] if txs is not None else None
+        )
+        return jsonify(results), 200
+
+class TransactionStatusView(MethodView):
+    """Endpoint de `/transactions/<tx_hash>`: atualização de status (PATCH)."""
+
+    init_every_request = False
+
+    def __init__(self, update_transaction_status_use_case: UpdateTransactionStatusUseCase, created_tx_repository: ICreatedTransactionRepository, background_tasks: BackgroundTaskRunner):
+        self.update_transaction_status_use_case = update_transaction_status_use_case
+        self.created_tx_repository = created_tx_repository
+        self.background_tasks = background_tasks
+
+    def patch(self, tx_hash):
         """Endpoint para atualizar o status de uma transação criada após sua confirmação na rede.
 
         Recebe o hash da transação, chama o caso de uso `UpdateTransactionStatusUseCase`
         para executar a lógica de atualização e retorna a resposta formatada em JSON.
+        Com o cabeçalho `Prefer: respond-async`, a atualização é executada em segundo plano
+        e a resposta `202 Accepted` é devolvida sem aguardar o recibo da transação.
         """
-
-        try:
-            updated_tx = update_transaction_status_use_case.execute(tx_hash)
-            return jsonify(
+        if _prefers_async():
+            # Hashes desconhecidos são rejeitados imediatamente, como na execução síncrona;
+            # a consulta ao nó e a gravação do novo status acontecem em segundo plano.
+            if not self.created_tx_repository.find_by_hash(tx_hash):
+                raise ValueError("Transação não encontrada.")
+            self.background_tasks.submit(("update_transaction_status", tx_hash), self.update_transaction_status_use_case.execute, tx_hash)
+            response = jsonify(
                 {
-                    "status": "success",
-                    "message": f"Status da transação {tx_hash} atualizado para {updated_tx.status}.",
+                    "status": "accepted",
+                    "message": f"Atualização do status da transação {tx_hash} agendada.",
                 }
-            ), 200
-        except ValueError as e:
-            # Captura erros de validação do caso de uso e retorna uma resposta de erro adequada.
-            return jsonify({"status": "error", "message": str(e)}), 400
-        except Exception as e:
-            # Captura quaisquer outras exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
+            )
+            response.headers["Preference-Applied"] = "respond-async"
+            return response, 202
+
+        updated_tx = self.update_transaction_status_use_case.execute(tx_hash)
+        return jsonify(
+            {
+                "status": "success",
+                "message": f"Status da transação {tx_hash} atualizado para {updated_tx.status}.",
+            }
+        ), 200
+
+def initialize_transaction_creation_controller(create_transaction_use_case: CreateTransactionUseCase, update_transaction_status_use_case: UpdateTransactionStatusUseCase, created_tx_repository: ICreatedTransactionRepository, background_tasks: BackgroundTaskRunner):
+    """Inicializa o controlador de criação de transações com as dependências necessárias.
 
+    Esta função recebe as instâncias dos casos de uso e repositórios necessários
+    através de injeção de dependência, garantindo que o controlador não crie suas
+    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
+    Um novo Blueprint é criado a cada chamada, para que cada aplicação tenha as suas rotas.
+    """
+    # Erros de validação (`ValueError`) resultam em 400 e os demais em 500 (ver `error_handlers`).
+    transaction_creation_bp = register_error_handlers(Blueprint("transaction_creation", __name__))
+    transaction_creation_bp.add_url_rule(
+        "/transactions",
+        view_func=TransactionsView.as_view(
+            "transactions", create_transaction_use_case, update_transaction_status_use_case, created_tx_repository
+        ),
+    )
+    transaction_creation_bp.add_url_rule(
+        "/transactions:batch",
+        view_func=TransactionsBatchView.as_view("transactions_batch", create_transaction_use_case),
+    )
+    transaction_creation_bp.add_url_rule(
+        "/transactions/<tx_hash>",
+        view_func=TransactionStatusView.as_view(
+            "transaction_status", update_transaction_status_use_case, created_tx_repository, background_tasks
+        ),
+    )
     return transaction_creation_bp
-
-
-
-
@@ -1,5 +1,9 @@
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
+from flask.views import MethodView
+from src.interfaces.controllers.error_handlers import register_error_handlers
+from src.interfaces.controllers.json_stream import stream_json_array_with_etag
+from src.interfaces.schemas import TransactionHashesRequest, ValidateTransactionRequest, parse_request
 from src.application.use_cases.validate_transaction import ValidateTransactionUseCase
 from src.application.interfaces import IValidatedTransactionRepository
 
@@ -8,65 +12,85 @@ from src.application.interfaces import IValidatedTransactionRepository
 # esperado pelos casos de uso, chamar os casos de uso apropriados e formatar a resposta HTTP.
 # Os controladores não contêm lógica de negócio e dependem apenas dos casos de uso e das entidades de domínio.
 # Isso adere ao Princípio da Responsabilidade Única (SRP) e ao Princípio da Inversão de Dependência (D de SOLID).
+# Cada recurso é uma `MethodView` que recebe suas dependências no construtor; a instância é criada
+# uma única vez (`init_every_request = False`) e compartilhada por todas as requisições.
 
-# Cria um Blueprint para os endpoints de validação de transação
-transaction_validation_bp = Blueprint("transaction_validation", __name__)
+class ValidationsView(MethodView):
+    """Endpoints de `/transactions/validations`: validação (POST) e histórico (GET)."""
 
-def initialize_transaction_validation_controller(validate_transaction_use_case: ValidateTransactionUseCase, validated_tx_repository: IValidatedTransactionRepository):
-    """Inicializa o controlador de validação de transações com as dependências necessárias.
+    init_every_request = False
 
-    Esta função recebe as instâncias dos casos de uso e repositórios necessários
-    através de injeção de dependência, garantindo que o controlador não crie suas
-    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
-    """
+    def __init__(self, validate_transaction_use_case: ValidateTransactionUseCase, validated_tx_repository: IValidatedTransactionRepository):
+        self.validate_transaction_use_case = validate_transaction_use_case
+        self.validated_tx_repository = validated_tx_repository
 
-    @transaction_validation_bp.route("/transactions/validations", methods=["POST"])
-    def validate_transaction():
+    def post(self):
         """Endpoint que recebe uma hash de transação e valida sua segurança para gerar crédito.
 
         Recebe o hash da transação, chama o caso de uso `ValidateTransactionUseCase`
         para executar a lógica de validação e retorna a resposta formatada em JSON.
         """
-        data = request.get_json()
-        tx_hash = data.get("tx_hash")
-
-        try:
-            validation_result = validate_transaction_use_case.execute(tx_hash)
-            return jsonify(validation_result), 200
-        except ValueError as e:
-            # Captura erros de validação do caso de uso e retorna uma resposta de erro adequada.
-            return jsonify({"status": "error", "message": str(e)}), 400
-        except Exception as e:
-            # Captura quaisquer outras exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
-
-    @transaction_validation_bp.route("/transactions/validations", methods=["GET"])
-    def validated_transactions_history():
+        body = parse_request(ValidateTransactionRequest)
+        validation_result = self.validate_transaction_use_case.execute(body.tx_hash)
+        return jsonify(validation_result), 200
+
+    def get(self):
         """Endpoint para consultar o histórico de transações que foram validadas como seguras.
 
-        Recupera o histórico de transações validadas através do repositório e retorna a lista formatada em JSON.
+        Recupera o histórico de transações validadas através do repositório e retorna a lista formatada em JSON,
+        transmitida item a item à medida que as linhas são lidas do banco de dados.
         """
-        try:
-            history = validated_tx_repository.get_all()
-            history_list = [
-                {
-                    "id": tx.id,
-                    "tx_hash": tx.tx_hash,
-                    "asset": tx.asset,
-                    "to_address": tx.to_address,
-                    "value": tx.value,
-                    "is_valid": tx.is_valid,
-                    "created_at": tx.created_at,
-                }
-                for tx in history
-            ]
-            return jsonify(history_list), 200
-        except Exception as e:
-            # Captura quaisquer exceções inesperadas e retorna um erro genérico.
-            return jsonify({"status": "error", "message": f"Erro interno: {str(e)}"}), 500
+        # O cliente que já tem a versão atual do histórico recebe `304 Not Modified`.
+        version = self.validated_tx_repository.get_version()
+        history = (
+            {
+                "id": tx.id,
+                "tx_hash": tx.tx_hash,
+                "asset": tx.asset,
+                "to_address": tx.to_address,
+                # Valores uint256 são devolvidos como texto, preservando a precisão em clientes JSON.
+                "value": str(tx.value),
+                "is_valid": tx.is_valid,
+                "created_at": tx.created_at,
+            }
+            for tx in self.validated_tx_repository.get_all()
+        )
+        return stream_json_array_with_etag(version, history)
 
-    return transaction_validation_bp
+class ValidationsBatchView(MethodView):
+    """Endpoint de `/transactions/validations/batch`: validação em lote (POST)."""
+
+    init_every_request = False
 
+    def __init__(self, validate_transaction_use_case: ValidateTransactionUseCase):
+        self.validate_transaction_use_case = validate_transaction_use_case
 
+    def post(self):
+        """Endpoint que valida várias transações em uma única requisição.
 
+        Recebe uma lista de hashes, chama `ValidateTransactionUseCase.execute_many` e retorna
+        o resultado de cada validação. As transações válidas são gravadas com um único commit.
+        """
+        body = parse_request(TransactionHashesRequest)
+        validation_results = self.validate_transaction_use_case.execute_many(body.tx_hashes)
+        return jsonify(validation_results), 200
 
+def initialize_transaction_validation_controller(validate_transaction_use_case: ValidateTransactionUseCase, validated_tx_repository: IValidatedTransactionRepository):
+    """Inicializa o controlador de validação de transações com as dependências necessárias.
+
+    Esta função recebe as instâncias dos casos de uso e repositórios necessários
+    através de injeção de dependência, garantindo que o controlador não crie suas
+    próprias dependências, o que violaria o Princípio da Inversão de Dependência.
+    Um novo Blueprint é criado a cada chamada, para que cada aplicação tenha as suas rotas.
+    """
+    # Erros de validação (`ValueError`) resultam em 400 e os demais em 500 (ver `error_handlers`).
+    transaction_validation_bp = register_error_handlers(Blueprint("transaction_validation", __name__))
+    transaction_validation_bp.add_url_rule(
+        "/transactions/validations",
+        view_func=ValidationsView.as_view("validations", validate_transaction_use_case, validated_tx_repository),
+    )
+    transaction_validation_bp.add_url_rule(
+        "/transactions/validations/batch",
+        view_func=ValidationsBatchView.as_view("validations_batch", validate_transaction_use_case),
+    )
+    return transaction_validation_bp
@@ -0,0 +1,68 @@
+
+from collections.abc import Mapping
+from typing import Any
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# Provedores JSON da aplicação Flask, usados por `jsonify`, por `request.get_json` e pelas
+# respostas transmitidas. Eles estendem o provedor padrão com os tipos produzidos pelo Web3.py,
+# de modo que dicionários vindos do serviço de blockchain (ex: recibos) possam ser devolvidos
+# sem uma cópia campo a campo.
+
+# Opções do `orjson` equivalentes ao comportamento do provedor padrão do Flask: chaves não
+# textuais aceitas e datas entregues a `default`, para que continuem no formato HTTP
+# (`http_date`) em vez do ISO 8601 nativo do `orjson`. A ordenação das chaves
+# (`OPT_SORT_KEYS`) é adicionada apenas se `sort_keys` estiver ativo no provedor.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+class Web3JSONProvider(DefaultJSONProvider):
+    """Provedor JSON que serializa `bytes`/`HexBytes` e `AttributeDict` do Web3.py."""
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Converte valores não suportados pelo `json` da biblioteca padrão.
+
+        Valores binários são representados em hexadecimal com prefixo `0x`, como no JSON-RPC,
+        e mapeamentos imutáveis (`AttributeDict`) são convertidos para dicionários.
+        """
+        if isinstance(o, bytes):
+            return "0x" + o.hex()
+        if isinstance(o, Mapping):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+class OrjsonJSONProvider(Web3JSONProvider):
+    """Provedor JSON que serializa e interpreta JSON com `orjson`.
+
+    `orjson` é implementado em Rust e gera os bytes da resposta diretamente, sem a
+    conversão intermediária para texto. O formato de saída é o mesmo do provedor padrão
+    (exceto pela ordenação das chaves, que segue `sort_keys`).
+    Inteiros acima de 64 bits, não suportados pelo `orjson`, fazem a serialização recorrer
+    ao módulo `json`.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumpb(obj).decode()
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Serializa um valor diretamente para bytes UTF-8, sem passar por texto."""
+        options = ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if self.sort_keys else ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=self.default, option=options)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if self._app.debug:
+            # Em modo de depuração, mantém a saída indentada do provedor padrão.
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj) + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,81 @@
+
+from typing import List, Optional, Type, TypeVar
+from flask import request
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, ValidationError
+
+# Schemas dos corpos das requisições da API, validados com Pydantic (núcleo em Rust).
+# Eles garantem os tipos dos campos antes que os dados cheguem aos casos de uso; as regras
+# de negócio (campos obrigatórios, formato dos endereços etc.) continuam nos casos de uso.
+
+RequestSchemaT = TypeVar("RequestSchemaT", bound="RequestSchema")
+
+# Quantidade máxima de endereços gerados por requisição. A geração é limitada por CPU e os
+# endereços são gravados em uma única transação; sem um limite, uma única requisição poderia
+# ocupar todos os núcleos do servidor e o banco de dados por tempo indeterminado.
+MAX_ADDRESSES_PER_REQUEST = 1000
+
+class RequestSchema(BaseModel):
+    """Base dos schemas de requisição: campos extras são ignorados e números são aceitos como texto."""
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+class GenerateAddressesRequest(RequestSchema):
+    """Corpo de `POST /addresses`."""
+
+    num_addresses: StrictInt = Field(default=1, le=MAX_ADDRESSES_PER_REQUEST)
+
+class CreateTransactionRequest(RequestSchema):
+    """Corpo de `POST /transactions`."""
+
+    from_address: Optional[str] = None
+    to_address: Optional[str] = None
+    asset: Optional[str] = None
+    value: Optional[str] = None
+
+class CreateTransactionsBatchRequest(RequestSchema):
+    """Corpo de `POST /transactions:batch`."""
+
+    txs: Optional[List[CreateTransactionRequest]] = None
+
+class ValidateTransactionRequest(RequestSchema):
+    """Corpo de `POST /transactions/validations`."""
+
+    tx_hash: Optional[str] = None
+
+class TransactionHashesRequest(RequestSchema):
+    """Corpo das operações em lote (`PATCH /transactions` e `POST /transactions/validations/batch`)."""
+
+    tx_hashes: Optional[List[str]] = None
+
+def parse_request(schema: Type[RequestSchemaT]) -> RequestSchemaT:
+    """Valida o corpo JSON da requisição atual com o schema informado.
+
+    Args:
+        schema (Type[RequestSchemaT]): O schema esperado para o corpo da requisição.
+
+    Returns:
+        RequestSchemaT: O corpo da requisição validado.
+
+    Raises:
+        ValueError: Se o corpo não for um objeto JSON compatível com o schema.
+    """
+    # O corpo é lido uma única vez, sem ser guardado na requisição (`cache=False`), e
+    # interpretado e validado pelo Pydantic em uma única passagem (`model_validate_json`),
+    # sem construir o dicionário intermediário em Python.
+    raw = request.get_data(cache=False)
+    if not raw:
+        # Um corpo vazio equivale a um objeto sem campos (valores padrão do schema).
+        return schema()
+    if not request.is_json:
+        raise ValueError("O corpo da requisição não é um JSON válido.")
+    try:
+        return schema.model_validate_json(raw)
+    except ValidationError as e:
+        errors = e.errors()
+        if any(error["type"] == "json_invalid" for error in errors):
+            raise ValueError("O corpo da requisição não é um JSON válido.") from None
+        details = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'corpo'}: {error['msg']}"
+            for error in errors
+        )
+        raise ValueError(f"Requisição inválida ({details}).") from None
@@ -0,0 +1,56 @@
+
+import logging
+from typing import Iterable
+from flask import Flask
+from src.application.interfaces import IAddressRepository, ICreatedTransactionRepository, IValidatedTransactionRepository
+from src.application.use_cases.create_transaction import CreateTransactionUseCase
+from src.interfaces.schemas import CreateTransactionRequest
+
+# Aquecimento da aplicação, executado uma única vez ao final de `create_app`, antes de o processo
+# começar a aceitar conexões. Sem ele, as primeiras requisições de cada processo pagam custos
+# que só acontecem uma vez: a compilação dos SELECTs pelo SQLAlchemy (guardada no cache de
+# compilação do engine), a abertura da primeira conexão do pool, a primeira serialização JSON e
+# a especialização do bytecode dos caminhos mais usados. Nenhuma chamada é feita ao nó Ethereum
+# e nada é gravado no banco de dados.
+
+logger = logging.getLogger(__name__)
+
+# Endereço usado nas chamadas de aquecimento; não pertence à aplicação (ninguém tem sua chave privada).
+WARMUP_ADDRESS = "0x" + "00" * 20
+
+def _read_first(rows: Iterable) -> None:
+    """Lê apenas o primeiro item de uma listagem, o suficiente para compilar e executar a consulta."""
+    next(iter(rows), None)
+
+def warm_up(
+    app: Flask,
+    create_transaction_use_case: CreateTransactionUseCase,
+    address_repository: IAddressRepository,
+    created_tx_repository: ICreatedTransactionRepository,
+    validated_tx_repository: IValidatedTransactionRepository,
+) -> None:
+    """Executa os caminhos mais usados da aplicação uma vez, sem efeitos colaterais.
+
+    O aquecimento é apenas uma otimização: se falhar (ex: banco de dados indisponível),
+    a falha é registrada no log e a aplicação é iniciada normalmente.
+    """
+    try:
+        # Validação do corpo das requisições (Pydantic) e serialização das respostas (orjson).
+        body = CreateTransactionRequest.model_validate_json(
+            f'{{"from_address":"{WARMUP_ADDRESS}","to_address":"{WARMUP_ADDRESS}","asset":"ETH","value":"0"}}'
+        )
+        app.json.dumps({"status": "success", "transactions": [body.model_dump()]})
+
+        with app.app_context():
+            # O remetente não existe na base de dados: o caso de uso valida os campos, converte o
+            # valor e busca o endereço, mas devolve um erro antes de assinar ou enviar a transação.
+            create_transaction_use_case.execute_many([body.model_dump()])
+
+            # Consultas dos endpoints de listagem, incluindo as versões usadas nos ETags.
+            _read_first(address_repository.get_all(limit=1))
+            _read_first(created_tx_repository.get_all())
+            _read_first(validated_tx_repository.get_all())
+            created_tx_repository.get_version()
+            validated_tx_repository.get_version()
+    except Exception:
+        logger.warning("Falha no aquecimento da aplicação; as primeiras requisições podem ser mais lentas.", exc_info=True)
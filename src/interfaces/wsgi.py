@@ -0,0 +1,8 @@
+
+from src.interfaces.app import create_app
+
+# Ponto de entrada WSGI da aplicação, usado pelo Gunicorn (ver `gunicorn.conf.py` e `Procfile`).
+# A aplicação é criada uma única vez, na importação deste módulo por cada processo do Gunicorn,
+# antes de o processo começar a aceitar conexões: a composição das dependências e o registro
+# das rotas não acontecem durante a primeira requisição.
+app = create_app()
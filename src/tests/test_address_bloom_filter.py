@@ -0,0 +1,26 @@
+
+import unittest
+from src.infrastructure.cache.address_bloom_filter import AddressBloomFilter
+
+class TestAddressBloomFilter(unittest.TestCase):
+    def test_added_addresses_are_always_found(self):
+        bloom = AddressBloomFilter(expected_items=1000, error_rate=1e-6)
+        addresses = ["0x%040x" % i for i in range(1000)]
+        bloom.update(addresses)
+
+        self.assertTrue(all(address in bloom for address in addresses))
+        self.assertIn(addresses[10].upper().replace("0X", "0x"), bloom)
+
+    def test_unknown_addresses_are_rejected(self):
+        bloom = AddressBloomFilter(expected_items=1000, error_rate=1e-6)
+        bloom.update("0x%040x" % i for i in range(1000))
+
+        false_positives = sum(("0x%040x" % i) in bloom for i in range(10_000, 20_000))
+        self.assertEqual(false_positives, 0)
+
+    def test_invalid_parameters_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            AddressBloomFilter(expected_items=0)
+
+if __name__ == '__main__':
+    unittest.main()
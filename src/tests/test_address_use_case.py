@@ -1,52 +1,96 @@
 
 import unittest
-from unittest.mock import Mock
+from dataclasses import replace
+from typing import List
 from src.application.use_cases.generate_addresses import GenerateAddressesUseCase
 from src.domain.entities import Address
 
+# Implementações simples das dependências do caso de uso, usadas no lugar de `Mock`: não
+# registram argumentos nem sintetizam atributos a cada chamada, e o custo do teste cresce
+# apenas com a quantidade de endereços gerados.
+
+class FakeBlockchainService:
+    """Serviço de blockchain que devolve endereços pré-definidos e conta as chamadas."""
+
+    def __init__(self, addresses: List[Address]):
+        self.addresses = addresses
+        self.call_count = 0
+        self.requested: List[int] = []
+
+    def generate_new_addresses(self, count: int) -> List[Address]:
+        self.call_count += 1
+        self.requested.append(count)
+        return self.addresses[:count]
+
+class FakeAddressRepository:
+    """Repositório em memória que atribui IDs sequenciais, como o banco de dados."""
+
+    def __init__(self):
+        self.saved: List[Address] = []
+        self.call_count = 0
+
+    def save_many(self, addresses: List[Address]) -> List[Address]:
+        self.call_count += 1
+        saved = [replace(address, id=len(self.saved) + i + 1) for i, address in enumerate(addresses)]
+        self.saved.extend(saved)
+        return saved
+
+class FakeUnitOfWork:
+    """Unidade de trabalho que apenas conta as transações abertas."""
+
+    def __init__(self):
+        self.enter_count = 0
+
+    def __enter__(self):
+        self.enter_count += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
 class TestGenerateAddressesUseCase(unittest.TestCase):
+    # Quantidade de endereços do teste de geração múltipla.
+    NUM_ADDRESSES = 3
+
+    @classmethod
+    def setUpClass(cls):
+        # A lista de endereços é montada uma única vez para a classe inteira.
+        cls.generated_addresses = [
+            Address(address=f"0x{i}", private_key=f"priv_key_{i}") for i in range(cls.NUM_ADDRESSES)
+        ]
+
     def setUp(self):
-        self.mock_address_repository = Mock()
-        self.mock_blockchain_service = Mock()
+        self.address_repository = FakeAddressRepository()
+        self.blockchain_service = FakeBlockchainService(self.generated_addresses)
+        self.unit_of_work = FakeUnitOfWork()
         self.use_case = GenerateAddressesUseCase(
-            self.mock_address_repository,
-            self.mock_blockchain_service
+            self.address_repository,
+            self.blockchain_service,
+            self.unit_of_work
         )
 
     def test_execute_generates_and_saves_single_address(self):
-        # Mock do serviço de blockchain para retornar um novo endereço
-        mock_address = Address(address="0x123", private_key="priv_key_1")
-        self.mock_blockchain_service.generate_new_address.return_value = mock_address
-
-        # Mock do repositório para retornar o endereço salvo com ID
-        self.mock_address_repository.save.return_value = Address(id=1, address="0x123", private_key="priv_key_1")
-
-        # Executa o caso de uso
         result = self.use_case.execute(num_addresses=1)
 
-        # Verifica se os métodos foram chamados corretamente
-        self.mock_blockchain_service.generate_new_address.assert_called_once()
-        self.mock_address_repository.save.assert_called_once_with(mock_address)
+        # Verifica se as dependências foram chamadas corretamente
+        self.assertEqual(self.blockchain_service.requested, [1])
+        self.assertEqual(self.address_repository.call_count, 1)
+        self.assertEqual(self.unit_of_work.enter_count, 1)
         self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].address, "0x123")
+        self.assertEqual(result[0].address, "0x0")
         self.assertIsNotNone(result[0].id)
 
     def test_execute_generates_and_saves_multiple_addresses(self):
-        # Mock para gerar múltiplos endereços
-        self.mock_blockchain_service.generate_new_address.side_effect = [
-            Address(address=f"0x{i}", private_key=f"priv_key_{i}") for i in range(3)
-        ]
-        self.mock_address_repository.save.side_effect = [
-            Address(id=i+1, address=f"0x{i}", private_key=f"priv_key_{i}") for i in range(3)
-        ]
-
-        result = self.use_case.execute(num_addresses=3)
+        result = self.use_case.execute(num_addresses=self.NUM_ADDRESSES)
 
-        self.assertEqual(self.mock_blockchain_service.generate_new_address.call_count, 3)
-        self.assertEqual(self.mock_address_repository.save.call_count, 3)
-        self.assertEqual(len(result), 3)
+        self.assertEqual(self.blockchain_service.requested, [self.NUM_ADDRESSES])
+        # Todos os endereços são persistidos em uma única chamada ao repositório
+        self.assertEqual(self.address_repository.call_count, 1)
+        self.assertEqual(self.address_repository.saved, result)
+        self.assertEqual(len(result), self.NUM_ADDRESSES)
         self.assertEqual(result[0].address, "0x0")
-        self.assertEqual(result[2].address, "0x2")
+        self.assertEqual(result[-1].address, f"0x{self.NUM_ADDRESSES - 1}")
+        self.assertEqual([addr.id for addr in result], list(range(1, self.NUM_ADDRESSES + 1)))
 
     def test_execute_with_invalid_num_addresses(self):
         with self.assertRaises(ValueError) as cm:
@@ -60,8 +104,7 @@ class TestGenerateAddressesUseCase(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             self.use_case.execute(num_addresses="abc")
         self.assertEqual(str(cm.exception), "Número de endereços inválido.")
+        self.assertEqual(self.blockchain_service.call_count, 0)
 
 if __name__ == '__main__':
     unittest.main()
-
-
@@ -0,0 +1,38 @@
+
+import threading
+import unittest
+from flask import Flask, current_app
+from src.interfaces.background import BackgroundTaskRunner
+
+class TestBackgroundTaskRunner(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.runner = BackgroundTaskRunner(self.app, max_workers=1)
+
+    def test_runs_task_inside_application_context(self):
+        done = threading.Event()
+        seen = []
+
+        def task(value):
+            seen.append((current_app.name, value))
+            done.set()
+
+        self.assertTrue(self.runner.submit("tarefa", task, 1))
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(seen, [(self.app.name, 1)])
+
+    def test_does_not_schedule_duplicate_pending_task(self):
+        release = threading.Event()
+        finished = threading.Event()
+
+        def task():
+            release.wait(timeout=5)
+            finished.set()
+
+        self.assertTrue(self.runner.submit("tarefa", task))
+        self.assertFalse(self.runner.submit("tarefa", task))
+        release.set()
+        self.assertTrue(finished.wait(timeout=5))
+
+if __name__ == '__main__':
+    unittest.main()
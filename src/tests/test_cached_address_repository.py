@@ -0,0 +1,22 @@
+import unittest
+from unittest.mock import MagicMock
+from src.domain.entities import Address
+from src.infrastructure.repositories.cached_address_repository import CachedAddressRepository
+
+CHECKSUM_ADDRESS = "0xAbaBaBaBABabABabAbAbABAbABababaBaBABaBab"
+
+class TestCachedAddressRepository(unittest.TestCase):
+    def setUp(self):
+        self.repository = MagicMock()
+        self.repository.find_by_address.return_value = Address(address=CHECKSUM_ADDRESS, private_key="11" * 32)
+        self.cached_repository = CachedAddressRepository(self.repository)
+
+    def test_find_by_address_ignores_letter_case(self):
+        found = self.cached_repository.find_by_address(CHECKSUM_ADDRESS.lower())
+
+        self.assertIs(self.cached_repository.find_by_address(CHECKSUM_ADDRESS), found)
+        self.assertIs(self.cached_repository.find_by_address("0x" + CHECKSUM_ADDRESS[2:].upper()), found)
+        self.repository.find_by_address.assert_called_once_with(CHECKSUM_ADDRESS.lower())
+
+if __name__ == '__main__':
+    unittest.main()
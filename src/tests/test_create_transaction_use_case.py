@@ -0,0 +1,107 @@
+
+import unittest
+from unittest.mock import MagicMock, Mock
+from src.application.use_cases.create_transaction import CreateTransactionUseCase
+from src.domain.entities import Address
+
+FROM_ADDRESS = "0x" + "aa" * 20
+TO_ADDRESS = "0x" + "bb" * 20
+
+class TestCreateTransactionUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_created_tx_repository = Mock()
+        self.mock_address_repository = Mock()
+        self.mock_blockchain_service = Mock()
+        self.use_case = CreateTransactionUseCase(
+            self.mock_created_tx_repository,
+            self.mock_address_repository,
+            self.mock_blockchain_service,
+            MagicMock()
+        )
+
+    def test_execute_saves_sent_transaction_with_single_insert(self):
+        self.mock_address_repository.find_by_address.return_value = Address(address=FROM_ADDRESS, private_key="0x01")
+        self.mock_blockchain_service.create_and_sign_transaction.return_value = (b"raw", {"gasPrice": 10, "gas": 21000})
+        self.mock_blockchain_service.send_raw_transaction.return_value = "0x99"
+
+        result = self.use_case.execute(FROM_ADDRESS, TO_ADDRESS, "ETH", "0.1")
+
+        self.assertEqual((result.tx_hash, result.status, result.gas_limit), ("0x99", "pending", 21000))
+        self.mock_created_tx_repository.save.assert_called_once_with(result)
+        self.mock_created_tx_repository.update.assert_not_called()
+
+    def test_execute_does_not_save_when_send_fails(self):
+        self.mock_address_repository.find_by_address.return_value = Address(address=FROM_ADDRESS, private_key="0x01")
+        self.mock_blockchain_service.create_and_sign_transaction.return_value = (b"raw", {})
+        self.mock_blockchain_service.send_raw_transaction.side_effect = RuntimeError("nonce too low")
+
+        with self.assertRaises(RuntimeError):
+            self.use_case.execute(FROM_ADDRESS, TO_ADDRESS, "ETH", "0.1")
+        self.mock_created_tx_repository.save.assert_not_called()
+
+    def test_execute_rejects_invalid_value_before_any_lookup(self):
+        with self.assertRaises(ValueError):
+            self.use_case.execute(FROM_ADDRESS, TO_ADDRESS, "ETH", "0.1.2")
+        self.mock_address_repository.find_by_address.assert_not_called()
+        self.mock_blockchain_service.create_and_sign_transaction.assert_not_called()
+
+    def test_execute_many_signs_valid_transfers_together_and_reports_each_result(self):
+        self.mock_address_repository.find_by_address.side_effect = lambda address: (
+            Address(address=FROM_ADDRESS, private_key="0x01") if address == FROM_ADDRESS else None
+        )
+        self.mock_blockchain_service.create_and_sign_transactions.return_value = [
+            {"raw_tx": b"raw1", "transaction": {"gasPrice": 10, "gas": 21000}},
+            {"raw_tx": b"raw2", "transaction": {"gasPrice": 10, "gas": 21000}},
+        ]
+        self.mock_blockchain_service.send_raw_transactions.return_value = [
+            {"tx_hash": "0x01"},
+            {"error": "nonce too low"},
+        ]
+        transfer = {"from_address": FROM_ADDRESS, "to_address": TO_ADDRESS, "asset": "ETH", "value": "0.1"}
+
+        results = self.use_case.execute_many([
+            transfer,
+            {**transfer, "value": "abc"},
+            {**transfer, "from_address": TO_ADDRESS},
+            transfer,
+        ])
+
+        self.assertEqual([result["status"] for result in results], ["success", "error", "error", "error"])
+        self.assertEqual(results[0]["tx_hash"], "0x01")
+        self.assertEqual(results[3]["message"], "nonce too low")
+        # O remetente é buscado uma única vez e as transações válidas são assinadas juntas.
+        self.assertEqual(self.mock_address_repository.find_by_address.call_count, 2)
+        self.mock_blockchain_service.create_and_sign_transactions.assert_called_once()
+        self.assertEqual(len(self.mock_blockchain_service.create_and_sign_transactions.call_args.args[0]), 2)
+        saved = self.mock_created_tx_repository.save_many.call_args.args[0]
+        self.assertEqual([tx.tx_hash for tx in saved], ["0x01"])
+
+    def test_execute_many_reports_transactions_that_could_not_be_signed(self):
+        self.mock_address_repository.find_by_address.return_value = Address(address=FROM_ADDRESS, private_key="0x01")
+        self.mock_blockchain_service.create_and_sign_transactions.return_value = [
+            {"error": "execution reverted"},
+            {"raw_tx": b"raw", "transaction": {"gasPrice": 10, "gas": 65000}},
+        ]
+        self.mock_blockchain_service.send_raw_transactions.return_value = [{"tx_hash": "0x01"}]
+        transfer = {"from_address": FROM_ADDRESS, "to_address": TO_ADDRESS, "asset": "0x" + "cc" * 20, "value": "5"}
+
+        results = self.use_case.execute_many([transfer, transfer, {**transfer, "asset": "USDT"}])
+
+        self.assertEqual(
+            results,
+            [
+                {"status": "error", "message": "execution reverted"},
+                {"status": "success", "tx_hash": "0x01"},
+                {"status": "error", "message": "Ativo inválido: informe 'ETH' ou o endereço do contrato do token ERC-20."},
+            ],
+        )
+        # Apenas a transação assinada é enviada ao nó.
+        self.mock_blockchain_service.send_raw_transactions.assert_called_once_with([b"raw"])
+
+    def test_execute_many_rejects_empty_list(self):
+        with self.assertRaises(ValueError):
+            self.use_case.execute_many([])
+        self.mock_blockchain_service.create_and_sign_transactions.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+
+import unittest
+from flask import Flask, jsonify
+from werkzeug.exceptions import NotFound
+from src.interfaces.json_provider import OrjsonJSONProvider
+from src.interfaces.controllers.error_handlers import handle_unexpected_error, handle_value_error
+
+class TestErrorHandlers(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonJSONProvider(self.app)
+        self.app.json.sort_keys = False
+
+    def test_error_body_matches_jsonify_format(self):
+        message = 'Endereço "inválido"'
+        with self.app.app_context():
+            expected = jsonify({"status": "error", "message": message}).get_data()
+            response = handle_value_error(ValueError(message))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(), expected)
+
+    def test_unexpected_errors_are_500_and_http_errors_pass_through(self):
+        response = handle_unexpected_error(RuntimeError("falha"))
+        self.assertEqual((response.status_code, response.get_json()["message"]), (500, "Erro interno: falha"))
+
+        not_found = NotFound()
+        self.assertIs(handle_unexpected_error(not_found), not_found)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+
+import unittest
+from unittest.mock import Mock
+from flask import Flask
+from src.interfaces.controllers.health_controller import initialize_health_controller
+
+class TestHealthController(unittest.TestCase):
+    def setUp(self):
+        self.blockchain_service = Mock()
+        app = Flask(__name__)
+        app.register_blueprint(initialize_health_controller(self.blockchain_service))
+        self.client = app.test_client()
+
+    def test_reports_current_block(self):
+        self.blockchain_service.get_current_block_number.return_value = 128
+
+        response = self.client.get("/health")
+
+        self.assertEqual((response.status_code, response.get_json()["block_number"]), (200, 128))
+
+    def test_unavailable_node_does_not_expose_provider_details(self):
+        self.blockchain_service.get_current_block_number.side_effect = ConnectionError(
+            "HTTPSConnectionPool(host='sepolia.infura.io'): /v3/chave-secreta"
+        )
+
+        with self.assertLogs("src.interfaces.controllers.health_controller", level="WARNING"):
+            response = self.client.get("/health")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertNotIn("chave-secreta", response.get_data(as_text=True))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+
+import unittest
+from flask import Flask
+from src.domain.entities import CreatedTransaction, ValidatedTransaction
+from src.infrastructure.database.models import db
+from src.infrastructure.repositories.sqlalchemy_created_transaction_repository import SQLAlchemyCreatedTransactionRepository
+from src.infrastructure.repositories.sqlalchemy_validated_transaction_repository import SQLAlchemyValidatedTransactionRepository
+
+FROM_ADDRESS = "0x" + "aa" * 20
+TO_ADDRESS = "0x" + "bb" * 20
+
+class TestHistoryVersions(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.repository = SQLAlchemyCreatedTransactionRepository()
+        self.txs = self.repository.save_many(
+            [
+                CreatedTransaction(FROM_ADDRESS, TO_ADDRESS, "ETH", "0.1", "pending", tx_hash=f"0x{i:064x}")
+                for i in range(2)
+            ]
+        )
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_version_changes_after_each_status_update(self):
+        # As alterações acontecem no mesmo segundo da inserção, o que não pode manter a versão.
+        versions = [self.repository.get_version()]
+
+        self.txs[0].status = "confirmed"
+        self.repository.update(self.txs[0])
+        db.session.commit()
+        versions.append(self.repository.get_version())
+
+        self.txs[1].status = "failed"
+        self.txs[1].effective_cost_wei = 2**255
+        self.repository.update_many(self.txs)
+        db.session.commit()
+        versions.append(self.repository.get_version())
+
+        self.assertEqual(len(set(versions)), 3)
+        self.assertEqual(
+            [(tx.status, tx.effective_cost_wei) for tx in self.repository.get_all()],
+            [("confirmed", None), ("failed", 2**255)],
+        )
+
+    def test_validated_history_version_changes_on_every_save(self):
+        repository = SQLAlchemyValidatedTransactionRepository()
+        versions = [repository.get_version()]
+
+        repository.save(ValidatedTransaction(f"0x{1:064x}", "ETH", TO_ADDRESS, 10**18, True))
+        db.session.commit()
+        versions.append(repository.get_version())
+        repository.save_many([ValidatedTransaction(f"0x{2:064x}", "ETH", TO_ADDRESS, 1, False)])
+        db.session.commit()
+        versions.append(repository.get_version())
+
+        self.assertEqual(versions, ["0", "1", "2"])
+        # Cada histórico tem a sua própria versão.
+        self.assertEqual(self.repository.get_version(), "1")
+
+if __name__ == '__main__':
+    unittest.main()
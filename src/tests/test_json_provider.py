@@ -0,0 +1,33 @@
+
+import unittest
+from datetime import datetime
+from flask import Flask, jsonify
+from hexbytes import HexBytes
+from src.interfaces.json_provider import OrjsonJSONProvider
+
+class TestOrjsonJSONProvider(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonJSONProvider(self.app)
+
+    def test_response_keeps_default_provider_format(self):
+        with self.app.app_context():
+            body = jsonify({"b": HexBytes(b"\x01"), "a": datetime(2026, 1, 2, 3, 4, 5)}).get_data()
+
+        self.assertEqual(body, b'{"a":"Fri, 02 Jan 2026 03:04:05 GMT","b":"0x01"}\n')
+
+    def test_response_keeps_insertion_order_when_sorting_is_disabled(self):
+        self.app.json.sort_keys = False
+        with self.app.app_context():
+            body = jsonify({"b": 1, "a": 2}).get_data()
+
+        self.assertEqual(body, b'{"b":1,"a":2}\n')
+
+    def test_integers_above_64_bits_fall_back_to_stdlib_json(self):
+        with self.app.app_context():
+            body = jsonify({"value": 2**100}).get_data()
+
+        self.assertEqual(self.app.json.loads(body), {"value": 2**100})
+
+if __name__ == '__main__':
+    unittest.main()
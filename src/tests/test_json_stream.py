@@ -0,0 +1,67 @@
+
+import gzip
+import json
+import unittest
+from unittest.mock import patch
+from flask import Flask
+from src.interfaces.json_provider import OrjsonJSONProvider
+from src.interfaces.controllers.json_stream import stream_json_array, stream_json_array_with_etag
+
+class TestStreamJsonArray(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonJSONProvider(self.app)
+
+    def _stream(self, items, **request_kwargs):
+        with self.app.test_request_context(**request_kwargs):
+            response = stream_json_array_with_etag("1", items)
+            return response, b"".join(response.response)
+
+    def test_streams_items_in_chunks_as_a_single_array(self):
+        items = [{"id": i} for i in range(7)]
+        with patch("src.interfaces.controllers.json_stream.STREAM_CHUNK_ITEMS", 3):
+            response, body = self._stream(iter(items))
+
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(json.loads(body), items)
+        self.assertEqual(response.headers["ETag"], '"1"')
+
+    def test_compresses_stream_when_client_accepts_gzip(self):
+        items = [{"id": i, "address": "0x" + "ab" * 20} for i in range(5)]
+        with patch("src.interfaces.controllers.json_stream.STREAM_CHUNK_ITEMS", 2):
+            response, body = self._stream(iter(items), headers={"Accept-Encoding": "gzip, br"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(response.headers["ETag"], '"1-gzip"')
+        self.assertEqual(json.loads(gzip.decompress(body)), items)
+
+    def test_etag_of_one_encoding_does_not_validate_the_other(self):
+        response, body = self._stream(iter([{"id": 1}]), headers={"If-None-Match": '"1"', "Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(gzip.decompress(body)), [{"id": 1}])
+
+        response, body = self._stream(iter([]), headers={"If-None-Match": '"1-gzip"', "Accept-Encoding": "gzip"})
+        self.assertEqual((response.status_code, body, response.headers["ETag"]), (304, b"", '"1-gzip"'))
+
+    def test_empty_array_follows_the_accepted_encoding(self):
+        response, body = self._stream(iter([]), headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(body), b"[]")
+
+    def test_empty_iterable_returns_empty_array(self):
+        with self.app.test_request_context():
+            self.assertEqual(stream_json_array(iter([])).get_data(), b"[]")
+
+    def test_matching_etag_returns_304_without_consuming_items(self):
+        def items():
+            raise AssertionError("os itens não devem ser percorridos")
+            yield
+
+        response, body = self._stream(items(), headers={"If-None-Match": '"1"'})
+
+        self.assertEqual((response.status_code, body), (304, b""))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from flask import Flask
+from src.infrastructure.config import Config
+from src.infrastructure.database.models import db
+from src.infrastructure.database.schema_check import SchemaMismatchError, find_schema_differences
+
+class TestSchemaCheck(unittest.TestCase):
+    def setUp(self):
+        handle, self.database_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.addCleanup(os.remove, self.database_path)
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{self.database_path}"
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    def test_init_db_accepts_database_created_from_models(self):
+        Config.init_db(self.app)
+
+        with self.app.app_context():
+            self.assertEqual(find_schema_differences(), [])
+
+    def test_init_db_rejects_tables_from_previous_models(self):
+        # Tabela de endereços de uma versão anterior: endereço como texto e sem `created_at`.
+        with sqlite3.connect(self.database_path) as connection:
+            connection.execute("CREATE TABLE addresses (id INTEGER PRIMARY KEY, address VARCHAR(42), private_key VARCHAR(64))")
+
+        with self.assertRaises(SchemaMismatchError) as raised:
+            Config.init_db(self.app)
+
+        message = str(raised.exception)
+        self.assertIn("addresses.address: tipo VARCHAR(42), esperado BLOB", message)
+        self.assertIn("addresses.created_at: coluna ausente", message)
+
+if __name__ == '__main__':
+    unittest.main()
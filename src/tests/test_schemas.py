@@ -0,0 +1,44 @@
+
+import unittest
+from flask import Flask
+from src.interfaces.schemas import MAX_ADDRESSES_PER_REQUEST, CreateTransactionRequest, GenerateAddressesRequest, parse_request
+
+class TestParseRequest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def test_parse_request_coerces_numeric_value_to_text(self):
+        body = {"from_address": "0x" + "ab" * 20, "value": 0.5}
+        with self.app.test_request_context(json=body):
+            parsed = parse_request(CreateTransactionRequest)
+
+        self.assertEqual(parsed.value, "0.5")
+        self.assertIsNone(parsed.asset)
+
+    def test_parse_request_rejects_wrong_types_and_invalid_json(self):
+        with self.app.test_request_context(json={"num_addresses": "3"}):
+            with self.assertRaises(ValueError):
+                parse_request(GenerateAddressesRequest)
+
+        with self.app.test_request_context(data="{invalid", content_type="application/json"):
+            with self.assertRaises(ValueError):
+                parse_request(GenerateAddressesRequest)
+
+    def test_parse_request_limits_number_of_addresses(self):
+        with self.app.test_request_context(json={"num_addresses": MAX_ADDRESSES_PER_REQUEST}):
+            self.assertEqual(parse_request(GenerateAddressesRequest).num_addresses, MAX_ADDRESSES_PER_REQUEST)
+
+        with self.app.test_request_context(json={"num_addresses": MAX_ADDRESSES_PER_REQUEST + 1}):
+            with self.assertRaises(ValueError):
+                parse_request(GenerateAddressesRequest)
+
+    def test_parse_request_uses_defaults_for_empty_body_and_rejects_non_json_content(self):
+        with self.app.test_request_context(method="POST"):
+            self.assertEqual(parse_request(GenerateAddressesRequest).num_addresses, 1)
+
+        with self.app.test_request_context(data="num_addresses=3", content_type="application/x-www-form-urlencoded"):
+            with self.assertRaises(ValueError):
+                parse_request(GenerateAddressesRequest)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+
+import unittest
+import time
+from src.domain.units import UINT256_MAX, to_base_units
+
+class TestToBaseUnits(unittest.TestCase):
+    def test_converts_decimal_text_exactly(self):
+        self.assertEqual(to_base_units("0.1"), 10**17)
+        self.assertEqual(to_base_units("1.50", decimals=1), 15)
+        self.assertEqual(to_base_units("123456789012345678901234.123456789012345678"), 123456789012345678901234123456789012345678)
+        self.assertEqual(to_base_units("0"), 0)
+
+    def test_rejects_invalid_values(self):
+        for value in ("abc", "-1", "NaN", "Infinity", "0.0000000000000000001"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    to_base_units(value)
+
+    def test_rejects_values_above_uint256(self):
+        self.assertEqual(to_base_units(str(UINT256_MAX), decimals=0), UINT256_MAX)
+        started = time.perf_counter()
+        for value in (str(UINT256_MAX + 1), "1e78", "1e9999999", "1" * 60 + "e9999999"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError) as cm:
+                    to_base_units(value, decimals=0)
+                self.assertEqual(str(cm.exception), "Valor da transferência inválido.")
+        # Expoentes enormes são rejeitados sem calcular a potência.
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_repeated_conversions_are_cached(self):
+        to_base_units.cache_clear()
+        to_base_units("2.5")
+        to_base_units("2.5")
+        self.assertEqual(to_base_units.cache_info().hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
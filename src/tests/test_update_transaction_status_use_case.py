@@ -0,0 +1,44 @@
+
+import unittest
+from unittest.mock import MagicMock, Mock
+from src.application.use_cases.create_transaction import UpdateTransactionStatusUseCase
+from src.domain.entities import CreatedTransaction
+
+def _pending_tx(tx_hash):
+    return CreatedTransaction(
+        from_address="0x" + "aa" * 20, to_address="0x" + "bb" * 20, asset="ETH",
+        value="0.1", status="pending", tx_hash=tx_hash, id=1,
+    )
+
+class TestUpdateTransactionStatusUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_created_tx_repository = Mock()
+        self.mock_blockchain_service = Mock()
+        self.use_case = UpdateTransactionStatusUseCase(
+            self.mock_created_tx_repository,
+            self.mock_blockchain_service,
+            MagicMock()
+        )
+
+    def test_execute_many_updates_only_transactions_with_receipts(self):
+        confirmed, pending = _pending_tx("0x01"), _pending_tx("0x02")
+        self.mock_created_tx_repository.find_by_hashes.return_value = [confirmed, pending]
+        self.mock_blockchain_service.get_transaction_receipts.return_value = [
+            {"status": 1, "gasUsed": 21000, "effectiveGasPrice": 10},
+            {},
+        ]
+
+        result = self.use_case.execute_many(["0x01", "0x02", "0x03"])
+
+        self.assertEqual([tx.status for tx in result], ["confirmed", "pending"])
+        self.assertEqual(confirmed.effective_cost_wei, 210000)
+        self.mock_blockchain_service.get_transaction_receipts.assert_called_once_with(["0x01", "0x02"])
+        self.mock_created_tx_repository.update_many.assert_called_once_with([confirmed])
+
+    def test_execute_many_with_invalid_hashes(self):
+        with self.assertRaises(ValueError):
+            self.use_case.execute_many([])
+        self.mock_created_tx_repository.find_by_hashes.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
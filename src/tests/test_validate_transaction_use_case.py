@@ -0,0 +1,85 @@
+
+import unittest
+from unittest.mock import MagicMock, Mock
+from src.application.use_cases.validate_transaction import ValidateTransactionUseCase
+
+class TestValidateTransactionUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_validated_tx_repository = Mock()
+        self.mock_address_repository = Mock()
+        self.mock_blockchain_service = Mock()
+        self.use_case = ValidateTransactionUseCase(
+            self.mock_validated_tx_repository,
+            self.mock_address_repository,
+            self.mock_blockchain_service,
+            MagicMock()
+        )
+        self.mock_validated_tx_repository.find_by_hash.return_value = None
+
+    def test_execute_validates_eth_transfer_to_our_address(self):
+        tx_details = {"value": 1000, "input": "0x", "to": "0xabc"}
+        tx_receipt = {"status": 1, "blockNumber": 100, "logs": []}
+        self.mock_blockchain_service.get_transaction_bundle.return_value = (tx_details, tx_receipt, 120)
+        self.mock_address_repository.exists_any.return_value = True
+        self.mock_blockchain_service.decode_erc20_transfer_logs.return_value = []
+
+        result = self.use_case.execute("0xhash")
+
+        self.assertTrue(result["is_valid_and_safe_for_credit"])
+        self.assertEqual(result["confirmations"], 20)
+        self.assertEqual(result["transfers"][0]["to_address"], "0xabc")
+        self.mock_validated_tx_repository.save.assert_called_once()
+
+    def test_execute_ignores_value_sent_with_contract_call(self):
+        tx_details = {"value": 1000, "input": "0xa9059cbb", "to": "0xabc"}
+        tx_receipt = {"status": 1, "blockNumber": 100, "logs": []}
+        self.mock_blockchain_service.get_transaction_bundle.return_value = (tx_details, tx_receipt, 120)
+        self.mock_blockchain_service.decode_erc20_transfer_logs.return_value = []
+
+        result = self.use_case.execute("0xhash")
+
+        self.assertFalse(result["is_valid_and_safe_for_credit"])
+        self.assertEqual(result["transfers"], [])
+        self.mock_validated_tx_repository.save.assert_not_called()
+
+    def test_execute_failed_transaction_skips_decoding_and_address_lookup(self):
+        tx_details = {"value": 1000, "input": "0x", "to": "0xabc"}
+        tx_receipt = {"status": 0, "blockNumber": 100, "logs": [{"topics": []}]}
+        self.mock_blockchain_service.get_transaction_bundle.return_value = (tx_details, tx_receipt, 120)
+
+        result = self.use_case.execute("0xhash")
+
+        self.assertFalse(result["is_valid_and_safe_for_credit"])
+        self.assertEqual(result["tx_status"], "failed")
+        self.mock_blockchain_service.decode_erc20_transfer_logs.assert_not_called()
+        self.mock_address_repository.exists_any.assert_not_called()
+        self.mock_validated_tx_repository.save.assert_not_called()
+
+    def test_execute_many_saves_valid_transactions_together(self):
+        tx_details = {"value": 1000, "input": "0x", "to": "0xabc"}
+        tx_receipt = {"status": 1, "blockNumber": 100, "logs": []}
+        self.mock_blockchain_service.get_transaction_bundle.side_effect = iter([
+            (tx_details, tx_receipt, 120),
+            ({}, {}, 120),
+            (tx_details, tx_receipt, 120),
+        ])
+        self.mock_blockchain_service.decode_erc20_transfer_logs.return_value = []
+        self.mock_address_repository.exists_any.return_value = True
+
+        results = self.use_case.execute_many(["0x01", "0x02", "0x03", "0x01"])
+
+        self.assertEqual([r["tx_hash"] for r in results], ["0x01", "0x02", "0x03"])
+        self.assertEqual(results[1]["status"], "error")
+        saved = self.mock_validated_tx_repository.save_many.call_args[0][0]
+        self.assertEqual([tx.tx_hash for tx in saved], ["0x01", "0x03"])
+        self.mock_validated_tx_repository.save.assert_not_called()
+
+    def test_execute_with_missing_transaction(self):
+        self.mock_blockchain_service.get_transaction_bundle.return_value = ({}, {}, 120)
+
+        with self.assertRaises(ValueError) as cm:
+            self.use_case.execute("0xhash")
+        self.assertEqual(str(cm.exception), "Transação não encontrada ou pendente.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+
+import unittest
+from unittest.mock import Mock
+from flask import Flask, has_app_context
+from src.interfaces.warmup import warm_up
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.create_transaction_use_case = Mock()
+        self.address_repository = Mock()
+        self.created_tx_repository = Mock()
+        self.validated_tx_repository = Mock()
+        for repository in (self.address_repository, self.created_tx_repository, self.validated_tx_repository):
+            repository.get_all.return_value = iter([])
+
+    def _warm_up(self):
+        warm_up(
+            self.app,
+            self.create_transaction_use_case,
+            self.address_repository,
+            self.created_tx_repository,
+            self.validated_tx_repository,
+        )
+
+    def test_runs_listing_queries_and_use_case_inside_application_context(self):
+        contexts = []
+        self.created_tx_repository.get_all.side_effect = lambda: contexts.append(has_app_context()) or iter([])
+
+        self._warm_up()
+
+        self.assertEqual(contexts, [True])
+        self.address_repository.get_all.assert_called_once_with(limit=1)
+        self.validated_tx_repository.get_version.assert_called_once()
+        # O caso de uso recebe apenas transações de um remetente que não pertence à aplicação.
+        transfers = self.create_transaction_use_case.execute_many.call_args.args[0]
+        self.assertEqual([transfer["asset"] for transfer in transfers], ["ETH"])
+
+    def test_failure_does_not_prevent_startup(self):
+        self.created_tx_repository.get_all.side_effect = RuntimeError("banco de dados indisponível")
+
+        with self.assertLogs("src.interfaces.warmup", level="WARNING"):
+            self._warm_up()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError, Web3RPCError
+from src.infrastructure.services.web3_blockchain_service import (
+    ADDRESS_POOL_START_METHOD,
+    PARALLEL_ADDRESS_GENERATION_THRESHOLD,
+    Web3BlockchainService,
+    TRANSFER_EVENT_TOPIC,
+    TRANSFER_EVENT_TOPIC_BYTES,
+)
+
+TO_ADDRESS = "0x" + "ab" * 20
+PRIVATE_KEY = "0x" + "01" * 32
+
+class TestWeb3BlockchainService(unittest.TestCase):
+    def setUp(self):
+        mock_w3 = MagicMock()
+        mock_w3.is_connected.return_value = True
+        mock_w3.eth.get_transaction_count.return_value = 0
+        self.mock_w3 = mock_w3
+        self.service = Web3BlockchainService(mock_w3)
+
+    def _use_node_nonce(self, nonce):
+        """Configura o nó falso sem suporte a lotes, com o nonce pendente informado."""
+        self.mock_w3.batch_requests.side_effect = NotImplementedError
+        self.mock_w3.provider.make_batch_request.side_effect = NotImplementedError
+        self.mock_w3.eth.get_transaction_count.return_value = nonce
+        self.mock_w3.eth._gas_price.return_value = 10
+        self.mock_w3.eth._chain_id.return_value = 1
+        # A transação "assinada" é apenas o seu nonce, o suficiente para identificá-la no envio.
+        self.mock_w3.eth.account.sign_transaction.side_effect = lambda tx, key: MagicMock(raw_transaction=bytes([tx["nonce"]]))
+
+    def _sign(self, count=1):
+        transfers = [(TO_ADDRESS, TO_ADDRESS, "ETH", "0.1", PRIVATE_KEY)] * count
+        return [signed["raw_tx"] for signed in self.service.create_and_sign_transactions(transfers)]
+
+    def test_decode_erc20_transfer_logs_decodes_only_transfer_events(self):
+        transfer_log = {
+            "topics": [TRANSFER_EVENT_TOPIC, "0x" + "00" * 12 + "ee" * 20, "0x" + "00" * 12 + "ab" * 20],
+            "data": HexBytes((5 * 10**18).to_bytes(32, "big")),
+        }
+        other_log = {"topics": ["11" * 32], "data": HexBytes(b"")}
+
+        transfers = self.service.decode_erc20_transfer_logs([other_log, transfer_log, {"topics": []}])
+
+        self.assertEqual(len(transfers), 1)
+        self.assertEqual(transfers[0].to_address.lower(), TO_ADDRESS)
+        self.assertEqual(transfers[0].value, 5 * 10**18)
+
+    def test_decode_erc20_transfer_log_accepts_binary_topics(self):
+        transfer_log = {
+            "topics": [
+                HexBytes(TRANSFER_EVENT_TOPIC),
+                HexBytes("00" * 12 + "ee" * 20),
+                HexBytes("00" * 12 + "ab" * 20),
+            ],
+            "data": HexBytes((7).to_bytes(32, "big")),
+        }
+
+        transfer = self.service.decode_erc20_transfer_log(transfer_log)
+
+        self.assertEqual(transfer.to_address.lower(), TO_ADDRESS)
+        self.assertEqual(transfer.value, 7)
+
+    def test_decode_erc20_transfer_log_accepts_json_rpc_hex_strings(self):
+        transfer_log = {
+            "topics": [TRANSFER_EVENT_TOPIC.upper().replace("0X", "0x"), "0x" + "00" * 12 + "ee" * 20, "0x" + "00" * 12 + "ab" * 20],
+            "data": "0x" + (9).to_bytes(32, "big").hex(),
+        }
+
+        transfer = self.service.decode_erc20_transfer_log(transfer_log)
+
+        self.assertEqual((transfer.to_address.lower(), transfer.value), (TO_ADDRESS, 9))
+
+    def test_decode_erc20_transfer_log_ignores_erc721_transfer(self):
+        # Mesma assinatura do evento, mas com o ID do token como quarto tópico e sem dados.
+        erc721_log = {
+            "topics": [TRANSFER_EVENT_TOPIC_BYTES, HexBytes("00" * 12 + "ee" * 20), HexBytes("00" * 12 + "ab" * 20), HexBytes((1).to_bytes(32, "big"))],
+            "data": HexBytes(b""),
+        }
+
+        self.assertIsNone(self.service.decode_erc20_transfer_log(erc721_log))
+        self.assertEqual(self.service.decode_erc20_transfer_logs([erc721_log]), [])
+
+    def test_decode_erc20_transfer_log_ignores_malformed_log_with_warning(self):
+        malformed_log = {"topics": [TRANSFER_EVENT_TOPIC, "0x" + "00" * 32, "0x" + "00" * 32], "data": HexBytes(b"")}
+
+        with self.assertLogs("src.infrastructure.services.web3_blockchain_service", level="WARNING"):
+            self.assertIsNone(self.service.decode_erc20_transfer_log(malformed_log))
+
+    def test_get_transaction_receipt_reuses_recent_response(self):
+        first = self.service.get_transaction_receipt("0x01")
+        second = self.service.get_transaction_receipt("0x01")
+
+        self.assertIs(first, second)
+        self.mock_w3.eth.get_transaction_receipt.assert_called_once_with("0x01")
+
+    def test_get_transaction_receipts_falls_back_when_provider_cannot_batch(self):
+        self.mock_w3.batch_requests.side_effect = NotImplementedError
+
+        self.service.get_transaction_receipts(["0x01", "0x02"])
+        self.service.get_transaction_receipts(["0x03"])
+
+        # Após a primeira falha, o lote não é mais tentado.
+        self.mock_w3.batch_requests.assert_called_once()
+        self.assertEqual(self.mock_w3.eth.get_transaction_receipt.call_count, 3)
+
+    def test_signing_reuses_chain_id_and_recent_gas_price(self):
+        self._use_node_nonce(4)
+
+        self._sign()
+        self._sign()
+
+        self.mock_w3.eth._chain_id.assert_called_once()
+        self.mock_w3.eth._gas_price.assert_called_once()
+        self.assertEqual(self.mock_w3.eth.get_transaction_count.call_count, 2)
+
+    def test_signing_estimates_gas_only_when_limit_is_unknown(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.estimate_gas.return_value = 52000
+        token = "0x" + "cd" * 20
+
+        signed = self.service.create_and_sign_transactions([
+            (TO_ADDRESS, TO_ADDRESS, "ETH", "0.1", PRIVATE_KEY),
+            (TO_ADDRESS, TO_ADDRESS, token, "5", PRIVATE_KEY),
+        ])
+
+        self.assertEqual([item["transaction"]["gas"] for item in signed], [21000, 52000])
+        # A transferência de ETH já tem o limite de gás; apenas a do token é estimada.
+        self.mock_w3.eth.estimate_gas.assert_called_once()
+
+    def test_reserve_nonce_hands_out_consecutive_nonces_before_node_catches_up(self):
+        nonces = [self.service._reserve_nonce(TO_ADDRESS, 5) for _ in range(3)]
+
+        self.assertEqual(nonces, [5, 6, 7])
+        self.assertEqual(self.service._reserve_nonce(TO_ADDRESS, 10), 10)
+
+    def test_rejected_send_releases_the_reserved_nonce(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.send_raw_transaction.side_effect = Web3RPCError("insufficient funds")
+
+        with self.assertRaises(Web3RPCError):
+            self.service.send_raw_transaction(self._sign()[0])
+
+        # A próxima transação reutiliza o nonce informado pelo nó, em vez de deixar uma lacuna.
+        self.assertEqual(self._sign(), [bytes([4])])
+
+    def test_rejected_send_in_batch_releases_the_reserved_nonce(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.send_raw_transaction.side_effect = [
+            Web3RPCError("transaction underpriced"),
+            HexBytes("01" * 32),
+        ]
+
+        results = self.service.send_raw_transactions(self._sign(count=2))
+
+        self.assertEqual(results[0], {"error": "transaction underpriced"})
+        self.assertEqual(self._sign(), [bytes([4])])
+
+    def test_batch_fetches_nonce_once_per_sender_and_signs_consecutive_nonces(self):
+        self._use_node_nonce(4)
+
+        self.assertEqual(self._sign(count=3), [bytes([4]), bytes([5]), bytes([6])])
+        self.mock_w3.eth.get_transaction_count.assert_called_once()
+        self.mock_w3.eth._gas_price.assert_called_once()
+
+    def test_reverted_gas_estimate_fails_only_its_transaction(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.estimate_gas.side_effect = ContractLogicError("execution reverted: saldo insuficiente")
+        token = "0x" + "cd" * 20
+
+        signed = self.service.create_and_sign_transactions([
+            (TO_ADDRESS, TO_ADDRESS, "ETH", "0.1", PRIVATE_KEY),
+            (TO_ADDRESS, TO_ADDRESS, token, "5", PRIVATE_KEY),
+            (TO_ADDRESS, TO_ADDRESS, "USDT", "5", PRIVATE_KEY),
+            (TO_ADDRESS, TO_ADDRESS, "ETH", "0.2", PRIVATE_KEY),
+        ])
+
+        self.assertIn("saldo insuficiente", signed[1]["error"])
+        self.assertIn("error", signed[2])
+        # As transações que falharam não reservam nonce: as demais seguem sem lacuna.
+        self.assertEqual([signed[0]["raw_tx"], signed[3]["raw_tx"]], [bytes([4]), bytes([5])])
+
+    def test_connection_failure_keeps_results_of_transactions_already_sent(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.send_raw_transaction.side_effect = [
+            HexBytes("01" * 32),
+            Web3RPCError("transaction underpriced"),
+            requests.exceptions.ConnectionError("connection reset"),
+        ]
+        raw_txs = self._sign(count=4)
+
+        with patch.object(self.service, "_release_nonce", wraps=self.service._release_nonce) as release_nonce:
+            results = self.service.send_raw_transactions(raw_txs)
+
+        self.assertEqual(results[0], {"tx_hash": "0x" + "01" * 32})
+        self.assertEqual([result.get("error") is not None for result in results], [False, True, True, True])
+        # Após a falha de comunicação, as transações restantes não são enviadas.
+        self.assertEqual(self.mock_w3.eth.send_raw_transaction.call_count, 3)
+        # Cada transação com erro libera o nonce uma única vez.
+        self.assertEqual(release_nonce.call_count, 3)
+
+    def test_connection_failure_in_batch_send_reports_every_transaction(self):
+        self._use_node_nonce(4)
+        raw_txs = self._sign(count=2)
+        self.mock_w3.provider.make_batch_request.side_effect = requests.exceptions.Timeout("timeout")
+        self.service._batch_supported = True
+
+        results = self.service.send_raw_transactions(raw_txs)
+
+        self.assertTrue(all("error" in result for result in results))
+        self.mock_w3.eth.send_raw_transaction.assert_not_called()
+        self.assertEqual(self._sign(), [bytes([4])])
+
+    def test_accepted_send_keeps_consecutive_nonces(self):
+        self._use_node_nonce(4)
+        self.mock_w3.eth.send_raw_transaction.return_value = HexBytes("01" * 32)
+
+        self.service.send_raw_transaction(self._sign()[0])
+
+        self.assertEqual(self._sign(), [bytes([5])])
+
+    def test_send_raw_transactions_reports_each_result_of_the_batch(self):
+        self.mock_w3.provider.make_batch_request.return_value = [
+            {"id": 0, "result": "0x" + "01" * 32},
+            {"id": 1, "error": {"code": -32000, "message": "nonce too low"}},
+        ]
+
+        results = self.service.send_raw_transactions([b"\x01", b"\x02"])
+
+        self.assertEqual(results, [{"tx_hash": "0x" + "01" * 32}, {"error": "nonce too low"}])
+        self.mock_w3.eth.send_raw_transaction.assert_not_called()
+
+    @patch("src.infrastructure.services.web3_blockchain_service.os.cpu_count", return_value=2)
+    def test_generate_new_addresses_reuses_one_process_pool(self, _):
+        count = PARALLEL_ADDRESS_GENERATION_THRESHOLD
+        first = self.service.generate_new_addresses(count)
+        pool = self.service._address_pool
+        self.addCleanup(pool.shutdown)
+        second = self.service.generate_new_addresses(count)
+
+        self.assertIs(self.service._address_pool, pool)
+        self.assertEqual(pool._mp_context.get_start_method(), ADDRESS_POOL_START_METHOD)
+        self.assertNotEqual(ADDRESS_POOL_START_METHOD, "fork")
+        self.assertEqual(len({a.address for a in first + second}), 2 * count)
+
+if __name__ == '__main__':
+    unittest.main()